@@ -16,11 +16,18 @@ primes.c
 #include <sys/time.h>
 #include <sys/stat.h>
 
-#define DIAG_PRINT 1
+#include "sieve.h"
+
+// Diagnostic output (to stderr): build with "make DEFINES=-DDIAG_PRINT=1"
+
+#ifndef DIAG_PRINT
+#define DIAG_PRINT 0
+#endif
 
 // Function prototypes
 
 long long sqrtll( long long x );
+int gcd( int a, int b );
 void usage();
 
 // main program
@@ -41,11 +48,24 @@ extern int
 int
   remaining_args,
   i,
-  c;
+  j,
+  k,
+  c,
+  wheel,
+  sieve,
+  binary,
+  threads,
+  n_res,
+  n_wheel_primes,
+  i_wheel_prime,
+  residues[48],
+  gaps[48],
+  wheel_primes[3];
 
 long long
   start_search,
   end_search,
+  base,
   i_div,
   i_div_tot,
   x,
@@ -60,10 +80,14 @@ char
 // Begin executable code
 //----------------------
 
-// May have up to two optional args:
+// Optional args:
 //
 //  -s <search_start>
 //  -e <search_end>
+//  -w <wheel_modulus>   (2, 30 or 210)
+//  -m <mode>            (trial or sieve)
+//  -t <threads>         (sieve only; default: one per CPU)
+//  -b                   (sieve only; raw binary output)
 
 clock_t begin, end;
 double time_spent;
@@ -71,26 +95,30 @@ begin = clock();
 
 if( DIAG_PRINT )
   {
-  printf("\n");
-  printf("primes.c DIAGNOSTIC OUTPUT:\n\n");
-  printf("Command line arguments:\n\n");
+  fprintf(stderr, "\n");
+  fprintf(stderr, "primes.c DIAGNOSTIC OUTPUT:\n\n");
+  fprintf(stderr, "Command line arguments:\n\n");
   for (i=0; i<argc; i++)
     {
-    printf("  iarg = %d, arg = '%s'\n", i, argv[i]);
+    fprintf(stderr, "  iarg = %d, arg = '%s'\n", i, argv[i]);
     }
-  printf("\n");
-  printf("  optind    = %d\n", optind);
-  printf("  opterr    = %d\n", opterr);
-  printf("  optopt    = %d\n", optopt);
-  printf("  LLONG_MAX = %lld\n", LLONG_MAX);
+  fprintf(stderr, "\n");
+  fprintf(stderr, "  optind    = %d\n", optind);
+  fprintf(stderr, "  opterr    = %d\n", opterr);
+  fprintf(stderr, "  optopt    = %d\n", optopt);
+  fprintf(stderr, "  LLONG_MAX = %lld\n", LLONG_MAX);
   }
 
 // Parse command line arguments
 
 start_search = 1;
 end_search = LLONG_MAX;
+wheel = 2;
+sieve = 0;
+binary = 0;
+threads = sysconf(_SC_NPROCESSORS_ONLN);
 
-while ((c = getopt( argc, argv, "s:e:")) != EOF)
+while ((c = getopt( argc, argv, "s:e:w:m:t:b")) != EOF)
   {
   //printf("DEBUG: c = %d [%c]\n", c, (char) c );
   switch (c)
@@ -105,8 +133,29 @@ while ((c = getopt( argc, argv, "s:e:")) != EOF)
       end_search = atoll(optarg);
       //printf("DEBUG: end_search = %d\n", end_search);
       break;
+    case 'w':
+      wheel = atoi(optarg);
+      break;
+    case 'm':
+      if (strcmp(optarg, "sieve") == 0)
+        sieve = 1;
+      else if (strcmp(optarg, "trial") == 0)
+        sieve = 0;
+      else
+        {
+        fprintf(stderr, "ERROR: -m must be trial or sieve\n");
+        usage();
+        exit(1);
+        }
+      break;
+    case 't':
+      threads = atoi(optarg);
+      break;
+    case 'b':
+      binary = 1;
+      break;
     case '?':
-      printf("ERROR: unrecognized option '%s'", optarg);
+      fprintf(stderr, "ERROR: unrecognized option '%c'\n", optopt);
       usage();
       exit(1);
       break;
@@ -120,11 +169,15 @@ remaining_args = argc - optind;
 
 if (DIAG_PRINT)
   {
-  printf("\n");
-  printf("Parameters set from command line arguments:\n\n");
-  printf("  start_search   = %lld\n", start_search);
-  printf("  end_search     = %lld\n", end_search);
-  printf("  remaining_args = %d\n", remaining_args);
+  fprintf(stderr, "\n");
+  fprintf(stderr, "Parameters set from command line arguments:\n\n");
+  fprintf(stderr, "  start_search   = %lld\n", start_search);
+  fprintf(stderr, "  end_search     = %lld\n", end_search);
+  fprintf(stderr, "  wheel          = %d\n", wheel);
+  fprintf(stderr, "  sieve          = %d\n", sieve);
+  fprintf(stderr, "  threads        = %d\n", threads);
+  fprintf(stderr, "  binary         = %d\n", binary);
+  fprintf(stderr, "  remaining_args = %d\n", remaining_args);
   }
 
 // start_search and end_search must be greater than zero
@@ -145,6 +198,53 @@ if (start_search >= end_search)
   exit(2);
   }
 
+// wheel must be 2, 30 or 210
+
+if (wheel != 2 && wheel != 30 && wheel != 210)
+  {
+  fprintf(stderr, "ERROR: -w must be 2, 30 or 210\n");
+  usage();
+  exit(3);
+  }
+
+// Sieve: primes in [start_search, end_search), one per line (or as
+// raw uint64 values with -b); the summary goes to stderr so that
+// stdout holds nothing but primes.
+
+if (sieve)
+  {
+  if (end_search == LLONG_MAX)
+    {
+    fprintf(stderr, "ERROR: -m sieve requires -e\n");
+    usage();
+    exit(4);
+    }
+  if (threads < 1)
+    threads = 1;
+  if (threads > MAX_THREADS)
+    threads = MAX_THREADS;
+
+  long long
+    n_primes = sieve_write(start_search, end_search, 1, threads, binary);
+
+  if (n_primes < 0)
+    exit(5);
+
+  end = clock();
+  time_spent = (double)(end - begin) / CLOCKS_PER_SEC;
+
+  fprintf(stderr, "Total primes found          = %lld\n", n_primes);
+  fprintf(stderr, "CPU seconds                 = %.3f\n", time_spent);
+
+  exit(0);
+  }
+else if (binary)
+  {
+  fprintf(stderr, "ERROR: -b requires -m sieve\n");
+  usage();
+  exit(4);
+  }
+
 // start_search must be an odd number
 
 if (start_search % 2 == 0)
@@ -154,6 +254,9 @@ x         = start_search;
 i_div     = 0;
 i_div_tot = 0;
 
+if (wheel == 2)
+{ // START 2-wheel (odd numbers only)
+
 while (x < end_search)
   { // START while (x < end_search)
 
@@ -187,6 +290,100 @@ while (x < end_search)
 
   } // END while (x < end_search)
 
+} // END 2-wheel (odd numbers only)
+else
+{ // START 30- or 210-wheel
+
+// Wheel factorization: only integers prime to the wheel modulus are
+// candidates, and only those are used as divisors, starting with the
+// smallest one after 1 (7 or 11). The odd primes dividing the modulus
+// (3, 5 and 7) are printed as they are passed. residues[] holds the
+// residues prime to the modulus, gaps[j] steps from residues[j] to the
+// next one.
+
+n_res = 0;
+for (i = 0; i < wheel; i++)
+  {
+  if (gcd(i, wheel) == 1)
+    residues[n_res++] = i;
+  }
+for (j = 0; j < n_res - 1; j++)
+  gaps[j] = residues[j+1] - residues[j];
+gaps[n_res-1] = wheel + residues[0] - residues[n_res-1];
+
+n_wheel_primes = 0;
+if (wheel % 3 == 0) wheel_primes[n_wheel_primes++] = 3;
+if (wheel % 5 == 0) wheel_primes[n_wheel_primes++] = 5;
+if (wheel % 7 == 0) wheel_primes[n_wheel_primes++] = 7;
+
+i_wheel_prime = 0;
+while (i_wheel_prime < n_wheel_primes &&
+       wheel_primes[i_wheel_prime] < start_search)
+  i_wheel_prime++;
+
+// First candidate: smallest integer >= start_search prime to wheel
+
+base = (start_search / wheel) * wheel;
+k    = 0;
+while (base + residues[k] < start_search)
+  {
+  k++;
+  if (k == n_res)
+    {
+    k     = 0;
+    base += wheel;
+    }
+  }
+x = base + residues[k];
+
+while (x < end_search)
+  { // START while (x < end_search)
+
+  while (i_wheel_prime < n_wheel_primes && wheel_primes[i_wheel_prime] < x)
+    {
+    printf("%d [%lld]\n", wheel_primes[i_wheel_prime++], i_div);
+    i_div_tot += i_div;
+    i_div = 0;
+    }
+
+  max_divisor = sqrtll(x);
+
+  divisor   = residues[1];
+  j         = 1;
+  remainder = -1;
+
+  while ((divisor <= max_divisor) && (remainder != 0))
+    {
+    remainder = x % divisor;
+    divisor += gaps[j];
+    if (++j == n_res)
+      j = 0;
+    i_div += 1;
+    }
+
+  if (remainder != 0)
+    {
+    printf("%lld [%lld]\n", x, i_div);
+    i_div_tot += i_div;
+    i_div = 0;
+    }
+
+  x += gaps[k];
+  if (++k == n_res)
+    k = 0;
+
+  } // END while (x < end_search)
+
+while (i_wheel_prime < n_wheel_primes &&
+       wheel_primes[i_wheel_prime] < end_search)
+  {
+  printf("%d [%lld]\n", wheel_primes[i_wheel_prime++], i_div);
+  i_div_tot += i_div;
+  i_div = 0;
+  }
+
+} // END 30- or 210-wheel
+
 end = clock();
 time_spent = (double)(end - begin) / CLOCKS_PER_SEC;
 
@@ -197,7 +394,7 @@ printf("Total divisors checked      = %lld\n", i_div_tot);
 printf("Divisors checked per second = %lld\n\n", div_per_second);
 
 if (DIAG_PRINT)
-  printf("\n");
+  fprintf(stderr, "\n");
 
 // Exit with status 0: keeps Make happier.
 exit(0);
@@ -211,9 +408,41 @@ return(0);
 
 void usage()
 {
+fprintf(stderr,
+  "\n"
+  "usage: primes [-s <start>] [-e <end>] [-w <wheel>] [-m <mode>]\n"
+  "              [-t <threads>] [-b]\n"
+  "\n"
+  "  Prints the primes p with start <= p < end.\n"
+  "\n"
+  "  -s <start>   start of the search (default 1)\n"
+  "  -e <end>     end of the search, exclusive (required by -m sieve)\n"
+  "  -w <wheel>   trial division wheel modulus: 2 (default), 30 or 210\n"
+  "  -m <mode>    trial (default): trial division, \"p [divisions]\"\n"
+  "               sieve: multithreaded segmented sieve, one prime per\n"
+  "               line, summary on stderr\n"
+  "  -t <threads> sieve threads (default: one per CPU)\n"
+  "  -b           sieve output as raw uint64 values (host byte order)\n"
+  "\n");
 }
 
 
+// Greatest common divisor (Euclid)
+
+int gcd( int a, int b )
+{
+int t;
+
+while (b != 0)
+  {
+  t = a % b;
+  a = b;
+  b = t;
+  }
+
+return a;
+}
+
 // http://stackoverflow.com/questions/18499492/how-can-you-easily-calculate-the-square-root-of-an-unsigned-long-long-in-c
 // Then this code calculates the square root of x, truncated to an integer,
 // provided the operations conform to IEEE 754:
@@ -0,0 +1,708 @@
+/*
+-------------------------------------------------------------------------------
+sieve.c
+
+Segmented sieve of Eratosthenes (see sieve.h).
+-------------------------------------------------------------------------------
+*/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include <unistd.h>
+#include <errno.h>
+#include <math.h>
+#include <pthread.h>
+
+#include "sieve.h"
+
+// Diagnostic output (to stderr): build with "make DEFINES=-DDIAG_PRINT=1"
+
+#ifndef DIAG_PRINT
+#define DIAG_PRINT 0
+#endif
+
+// What the sieve threads do with the primes of each segment
+
+#define SIEVE_TEXT   0
+#define SIEVE_BINARY 1
+#define SIEVE_COUNT  2
+
+// The odd primes <= limit, as a bitmap: bit i of bits stands for 2*i+1
+// and is set if 2*i+1 is prime. refs counts the jobs using the table,
+// plus one while it is kept in the cache (see base_acquire()).
+
+typedef struct
+{
+  uint64_t
+    *bits;
+
+  long long
+    limit,
+    n_words;
+
+  long
+    refs;
+} base_table;
+
+// State shared by the sieve threads. Segments are handed out in order
+// (next_segment); each thread sieves its segment and formats the primes
+// into its own buffer, then waits until next_output reaches its segment
+// to write the buffer, so the output stays in increasing order. When
+// counting, nothing is written and no thread waits.
+
+typedef struct
+{
+  long long
+    lo,               // first odd integer searched
+    hi,               // end of the search (exclusive)
+    n_segments,
+    next_segment,
+    next_output,
+    n_primes;
+
+  base_table
+    *base;            // odd primes <= sqrt(hi)
+
+  int
+    fd,
+    output,           // SIEVE_TEXT, SIEVE_BINARY or SIEVE_COUNT
+    error;
+
+  pthread_mutex_t
+    lock;
+
+  pthread_cond_t
+    turn;
+} sieve_job;
+
+// Function prototypes (internal)
+
+static long long sieve_run( long long a, long long b, int fd, int threads,
+                            int output );
+static long long isqrt( long long x );
+static base_table *base_acquire( long long limit, int keep );
+static void base_release( base_table *base );
+static base_table *base_sieve( long long limit );
+static void *sieve_worker( void *arg );
+static void sieve_segment( uint64_t *bits, long long seg_lo,
+                           long long n_bits, const base_table *base );
+static char *format_prime( char *p, unsigned long long x );
+static int write_all( int fd, const char *buf, size_t len );
+
+// The base primes up to BASE_CACHE_LIMIT (enough to sieve below 2**56,
+// in a table of at most 16 MB) are kept between calls, and replaced
+// only by a longer table. Longer tables belong to the call that sieved
+// them, except that sieve_fill() keeps its last one (base_kept), as it
+// is called over and over on the same range, until sieve_release().
+// A replaced table is freed once the last job using it is done.
+
+#define BASE_CACHE_LIMIT (1LL << 28)
+
+static base_table
+  *base_cache = NULL,
+  *base_kept  = NULL;
+
+static pthread_mutex_t
+  base_cache_lock = PTHREAD_MUTEX_INITIALIZER;
+
+//////////////////////////////////////////////////////////////////////////////
+// API (see sieve.h)
+//////////////////////////////////////////////////////////////////////////////
+
+long long sieve_write( long long a, long long b, int fd, int threads,
+                       int binary )
+{
+return sieve_run(a, b, fd, threads, binary ? SIEVE_BINARY : SIEVE_TEXT);
+}
+
+long long sieve_count( long long a, long long b, int threads )
+{
+return sieve_run(a, b, -1, threads, SIEVE_COUNT);
+}
+
+long long sieve_fill( long long a, long long b, uint64_t *buf,
+                      long long size )
+{
+base_table
+  *base;
+
+uint64_t
+  *bits,
+  word;
+
+long long
+  lo,
+  seg_lo,
+  n_bits,
+  n_words,
+  w,
+  n = 0;
+
+if (size <= 0 || b <= a)
+  return 0;
+
+if (a <= 2 && b > 2)
+  buf[n++] = 2;
+
+lo = a < 3 ? 3 : a;
+if (lo % 2 == 0)
+  lo += 1;
+
+if (lo >= b || n == size)
+  return n;
+
+base = base_acquire(isqrt(b - 1), 1);
+bits = malloc(SEGMENT_BYTES);
+if (base == NULL || bits == NULL)
+  {
+  base_release(base);
+  free(bits);
+  return -1;
+  }
+
+for (seg_lo = lo; seg_lo < b && n < size; seg_lo += SEGMENT_SPAN)
+  {
+  n_bits = (b - seg_lo + 1)/2;
+  if (n_bits > SEGMENT_BITS)
+    n_bits = SEGMENT_BITS;
+
+  sieve_segment(bits, seg_lo, n_bits, base);
+
+  n_words = (n_bits + 63)/64;
+  for (w = 0; w < n_words && n < size; w++)
+    {
+    word = bits[w];
+    while (word && n < size)
+      {
+      buf[n++] = seg_lo + 2*(64*w + __builtin_ctzll(word));
+      word &= word - 1;
+      }
+    }
+  }
+
+base_release(base);
+free(bits);
+return n;
+}
+
+void sieve_release( void )
+{
+pthread_mutex_lock(&base_cache_lock);
+if (base_kept != NULL && --base_kept->refs == 0)
+  {
+  free(base_kept->bits);
+  free(base_kept);
+  }
+base_kept = NULL;
+pthread_mutex_unlock(&base_cache_lock);
+}
+
+//////////////////////////////////////////////////////////////////////////////
+// Multithreaded sieve
+//////////////////////////////////////////////////////////////////////////////
+
+// Sieves [a, b) with "threads" threads; output is SIEVE_TEXT or
+// SIEVE_BINARY (written to fd) or SIEVE_COUNT. Returns the number of
+// primes (-1 on error).
+
+static long long sieve_run( long long a, long long b, int fd, int threads,
+                            int output )
+{
+sieve_job
+  job;
+
+pthread_t
+  tid[MAX_THREADS];
+
+int
+  i;
+
+uint64_t
+  two = 2;
+
+char
+  two_text[] = "2\n";
+
+memset(&job, 0, sizeof(job));
+
+job.hi     = b;
+job.fd     = fd;
+job.output = output;
+job.lo     = a < 3 ? 3 : a;
+if (job.lo % 2 == 0)
+  job.lo += 1;
+
+job.n_segments = job.hi > job.lo ?
+  ((job.hi - job.lo + 1)/2 + SEGMENT_BITS - 1) / SEGMENT_BITS : 0;
+
+job.base = base_acquire(isqrt(b - 1), 0);
+if (job.base == NULL)
+  {
+  fprintf(stderr, "ERROR: out of memory for the base primes\n");
+  return -1;
+  }
+
+if (DIAG_PRINT)
+  {
+  fprintf(stderr, "sieve_run: lo = %lld, hi = %lld\n", job.lo, job.hi);
+  fprintf(stderr, "  segments    = %lld\n", job.n_segments);
+  fprintf(stderr, "  base limit  = %lld\n", job.base->limit);
+  fprintf(stderr, "  threads     = %d\n", threads);
+  }
+
+// 2 is the only even prime
+
+if (a <= 2 && b > 2)
+  {
+  if ((output == SIEVE_BINARY && write_all(fd, (char *) &two, sizeof(two)))
+      || (output == SIEVE_TEXT && write_all(fd, two_text, 2)))
+    {
+    base_release(job.base);
+    return -1;
+    }
+  job.n_primes = 1;
+  }
+
+pthread_mutex_init(&job.lock, NULL);
+pthread_cond_init(&job.turn, NULL);
+
+if (threads < 1)
+  threads = 1;
+if (threads > MAX_THREADS)
+  threads = MAX_THREADS;
+if (threads > job.n_segments)
+  threads = job.n_segments > 0 ? job.n_segments : 1;
+
+for (i = 0; i < threads; i++)
+  {
+  if (pthread_create(&tid[i], NULL, sieve_worker, &job) != 0)
+    {
+    fprintf(stderr, "ERROR: cannot create sieve thread %d\n", i);
+    job.error = 1;
+    break;
+    }
+  }
+
+threads = i;
+for (i = 0; i < threads; i++)
+  pthread_join(tid[i], NULL);
+
+pthread_mutex_destroy(&job.lock);
+pthread_cond_destroy(&job.turn);
+base_release(job.base);
+
+// With no threads at all there is nobody to do the work
+
+if (threads == 0)
+  return -1;
+
+return job.error ? -1 : job.n_primes;
+}
+
+// Thread: sieve segments in turn, write each one's primes in order
+
+static void *sieve_worker( void *arg )
+{
+sieve_job
+  *job = arg;
+
+uint64_t
+  *bits,
+  word;
+
+char
+  *out = NULL,
+  *p;
+
+size_t
+  out_size;
+
+long long
+  seg,
+  seg_lo,
+  n_bits,
+  n_words,
+  w,
+  n;
+
+// Room for every prime of a segment; a prime takes at most 20 digits
+// and a newline (8 bytes in binary), and at most 1 in 3 odd integers
+// of a segment above 9 is prime.
+
+bits = malloc(SEGMENT_BYTES);
+if (job->output != SIEVE_COUNT)
+  {
+  out_size = (SEGMENT_BITS/3 + 64) * (job->output == SIEVE_BINARY ? 8 : 21);
+  out      = malloc(out_size);
+  }
+
+// A thread without buffers leaves the segments to the others
+
+if (bits == NULL || (out == NULL && job->output != SIEVE_COUNT))
+  {
+  fprintf(stderr, "ERROR: out of memory in sieve thread\n");
+  pthread_mutex_lock(&job->lock);
+  job->error = 1;
+  pthread_mutex_unlock(&job->lock);
+  free(bits);
+  free(out);
+  return NULL;
+  }
+
+for (;;)
+  {
+  pthread_mutex_lock(&job->lock);
+  seg = job->next_segment++;
+  pthread_mutex_unlock(&job->lock);
+
+  if (seg >= job->n_segments)
+    break;
+
+  seg_lo = job->lo + seg*SEGMENT_SPAN;
+  n_bits = (job->hi - seg_lo + 1)/2;
+  if (n_bits > SEGMENT_BITS)
+    n_bits = SEGMENT_BITS;
+
+  sieve_segment(bits, seg_lo, n_bits, job->base);
+
+  n_words = (n_bits + 63)/64;
+  n       = 0;
+
+  if (job->output == SIEVE_COUNT)
+    {
+    for (w = 0; w < n_words; w++)
+      n += __builtin_popcountll(bits[w]);
+
+    pthread_mutex_lock(&job->lock);
+    job->n_primes += n;
+    pthread_mutex_unlock(&job->lock);
+    continue;
+    }
+
+  // Format the primes (set bits) of this segment
+
+  p = out;
+  for (w = 0; w < n_words; w++)
+    {
+    word = bits[w];
+    while (word)
+      {
+      unsigned long long
+        x = seg_lo + 2*(64*w + __builtin_ctzll(word));
+
+      if (job->output == SIEVE_BINARY)
+        {
+        uint64_t v = x;
+        memcpy(p, &v, 8);
+        p += 8;
+        }
+      else
+        p = format_prime(p, x);
+      n++;
+      word &= word - 1;
+      }
+    }
+
+  // Wait for this segment's turn to write
+
+  pthread_mutex_lock(&job->lock);
+  while (job->next_output != seg)
+    pthread_cond_wait(&job->turn, &job->lock);
+  pthread_mutex_unlock(&job->lock);
+
+  if (write_all(job->fd, out, p - out))
+    job->error = 1;
+
+  pthread_mutex_lock(&job->lock);
+  job->n_primes += n;
+  job->next_output++;
+  pthread_cond_broadcast(&job->turn);
+  pthread_mutex_unlock(&job->lock);
+  }
+
+free(bits);
+free(out);
+return NULL;
+}
+
+// Sieve n_bits odd integers from seg_lo (odd): bit i of bits stands
+// for seg_lo + 2*i and is left set if that integer is prime. The base
+// table must hold the odd primes up to sqrt(seg_lo + 2*(n_bits - 1)).
+
+static void sieve_segment( uint64_t *bits, long long seg_lo,
+                           long long n_bits, const base_table *base )
+{
+uint64_t
+  word;
+
+long long
+  n_words,
+  seg_hi,
+  k,
+  p,
+  m,
+  i;
+
+n_words = (n_bits + 63)/64;
+seg_hi  = seg_lo + 2*(n_bits - 1);
+
+memset(bits, 0xff, n_words*8);
+if (n_bits % 64)
+  bits[n_words-1] = (1ULL << (n_bits % 64)) - 1;
+
+// 1 is not prime
+
+if (seg_lo == 1)
+  bits[0] &= ~1ULL;
+
+// The base primes are the set bits of the table, 3 (bit 1) onwards
+
+for (k = 0; k < base->n_words; k++)
+  {
+  word = base->bits[k];
+  if (k == 0)
+    word &= ~1ULL;
+
+  while (word)
+    {
+    p = 2*(64*k + __builtin_ctzll(word)) + 1;
+    word &= word - 1;
+
+    if (p*p > seg_hi)
+      return;
+
+    // First odd multiple of p that is >= max(p*p, seg_lo)
+
+    m = p*p;
+    if (m < seg_lo)
+      {
+      m = seg_lo + (p - seg_lo % p) % p;
+      if (m % 2 == 0)
+        m += p;
+      }
+
+    for (i = (m - seg_lo)/2; i < n_bits; i += p)
+      bits[i >> 6] &= ~(1ULL << (i & 63));
+    }
+  }
+}
+
+//////////////////////////////////////////////////////////////////////////////
+// Base primes
+//////////////////////////////////////////////////////////////////////////////
+
+// Returns a table of the odd primes <= limit, from the cache if it is
+// long enough, or NULL if out of memory. Up to BASE_CACHE_LIMIT a new
+// table replaces the cached one; above, it is kept for the next call
+// if "keep" is set (see sieve_release()). Give it back with
+// base_release().
+
+static base_table *base_acquire( long long limit, int keep )
+{
+base_table
+  *base,
+  **slot = NULL;
+
+pthread_mutex_lock(&base_cache_lock);
+
+if (base_cache != NULL && base_cache->limit >= limit)
+  base = base_cache;
+else if (base_kept != NULL && base_kept->limit >= limit)
+  base = base_kept;
+else
+  {
+  // A cached table grows at least twofold, within BASE_CACHE_LIMIT
+
+  if (limit <= BASE_CACHE_LIMIT && base_cache != NULL)
+    {
+    if (limit < 2*base_cache->limit)
+      limit = 2*base_cache->limit;
+    if (limit > BASE_CACHE_LIMIT)
+      limit = BASE_CACHE_LIMIT;
+    }
+
+  base = base_sieve(limit);
+  if (base == NULL)
+    {
+    pthread_mutex_unlock(&base_cache_lock);
+    return NULL;
+    }
+
+  if (limit <= BASE_CACHE_LIMIT)
+    slot = &base_cache;
+  else if (keep)
+    slot = &base_kept;
+
+  if (slot != NULL)
+    {
+    if (*slot != NULL && --(*slot)->refs == 0)
+      {
+      free((*slot)->bits);
+      free(*slot);
+      }
+    *slot = base;
+    base->refs++;
+    }
+  }
+
+base->refs++;
+pthread_mutex_unlock(&base_cache_lock);
+
+return base;
+}
+
+// Gives back a table from base_acquire(); frees it if it is no longer
+// used or cached
+
+static void base_release( base_table *base )
+{
+if (base == NULL)
+  return;
+
+pthread_mutex_lock(&base_cache_lock);
+if (--base->refs == 0)
+  {
+  free(base->bits);
+  free(base);
+  }
+pthread_mutex_unlock(&base_cache_lock);
+}
+
+// Returns a new table of the odd primes <= limit (refs 0), or NULL if
+// out of memory. The first segment is sieved in place; every later one
+// with sieve_segment(), its base primes being the ones already found
+// in the segments before it (all below sqrt(limit) < SEGMENT_SPAN).
+
+static base_table *base_sieve( long long limit )
+{
+base_table
+  *base,
+  found;
+
+long long
+  n_bits,
+  seg_bits,
+  seg,
+  p,
+  i;
+
+if (limit < 1)
+  limit = 1;
+
+base   = malloc(sizeof(base_table));
+n_bits = (limit + 1)/2;
+if (base == NULL)
+  return NULL;
+
+base->limit   = limit;
+base->n_words = (n_bits + 63)/64;
+base->refs    = 0;
+base->bits    = malloc(base->n_words*8);
+if (base->bits == NULL)
+  {
+  free(base);
+  return NULL;
+  }
+
+// First segment: odd-only sieve of Eratosthenes on the bitmap itself
+
+seg_bits = n_bits < SEGMENT_BITS ? n_bits : SEGMENT_BITS;
+
+memset(base->bits, 0xff, (seg_bits + 63)/64*8);
+if (seg_bits % 64)
+  base->bits[(seg_bits - 1)/64] = (1ULL << (seg_bits % 64)) - 1;
+base->bits[0] &= ~1ULL;
+
+for (p = 3; p*p < 2*seg_bits; p += 2)
+  if (base->bits[p/2 >> 6] & (1ULL << (p/2 & 63)))
+    for (i = p*p/2; i < seg_bits; i += p)
+      base->bits[i >> 6] &= ~(1ULL << (i & 63));
+
+// Later segments (SEGMENT_BITS is a multiple of 64, so each one starts
+// on a word of the bitmap)
+
+found.bits = base->bits;
+for (seg = SEGMENT_BITS; seg < n_bits; seg += SEGMENT_BITS)
+  {
+  seg_bits      = n_bits - seg < SEGMENT_BITS ? n_bits - seg : SEGMENT_BITS;
+  found.limit   = 2*seg - 1;
+  found.n_words = seg/64;
+  sieve_segment(base->bits + seg/64, 2*seg + 1, seg_bits, &found);
+  }
+
+return base;
+}
+
+//////////////////////////////////////////////////////////////////////////////
+// Utilities
+//////////////////////////////////////////////////////////////////////////////
+
+// Square root of x >= 0, truncated to an integer. The corrections
+// compare by division, as y*y overflows for x near 2**63.
+
+static long long isqrt( long long x )
+{
+long long
+  y;
+
+if (x < 1)
+  return 0;
+
+y = sqrt((double) x);
+while (y > x / y)
+  y--;
+while (y + 1 <= x / (y + 1))
+  y++;
+
+return y;
+}
+
+// Writes x and a newline at p; returns the end of what was written
+
+static char *format_prime( char *p, unsigned long long x )
+{
+char
+  digits[20];
+
+int
+  n = 0;
+
+do
+  {
+  digits[n++] = '0' + x % 10;
+  x /= 10;
+  }
+while (x);
+
+while (n)
+  *p++ = digits[--n];
+*p++ = '\n';
+
+return p;
+}
+
+// Writes all of buf to fd; returns 0, or -1 on error
+
+static int write_all( int fd, const char *buf, size_t len )
+{
+ssize_t
+  n;
+
+while (len > 0)
+  {
+  n = write(fd, buf, len);
+  if (n < 0)
+    {
+    if (errno == EINTR)
+      continue;
+    perror("primes: write");
+    return -1;
+    }
+  buf += n;
+  len -= n;
+  }
+
+return 0;
+}
@@ -0,0 +1,48 @@
+/*
+-------------------------------------------------------------------------------
+sieve.h
+
+Segmented sieve of Eratosthenes (odd-only, bit-packed, multithreaded),
+used by the "primes" program and built as the shared library
+libprimes.so for primeslib.py (ctypes). All ranges are [a, b), with
+0 <= a and b < LLONG_MAX.
+-------------------------------------------------------------------------------
+*/
+
+#ifndef SIEVE_H
+#define SIEVE_H
+
+#include <stdint.h>
+
+// One bit per odd integer, SEGMENT_BYTES bytes per segment (sized to
+// stay in L2 cache), so each segment covers SEGMENT_SPAN integers.
+
+#define SEGMENT_BYTES (1 << 18)
+#define SEGMENT_BITS  (8LL * SEGMENT_BYTES)
+#define SEGMENT_SPAN  (2LL * SEGMENT_BITS)
+#define MAX_THREADS   256
+
+// Writes the primes in [a, b) to file descriptor fd, one per line or
+// (binary != 0) as uint64 values in host byte order; returns the number
+// of primes, or -1 on error
+
+long long sieve_write( long long a, long long b, int fd, int threads,
+                       int binary );
+
+// Returns the number of primes in [a, b) (-1 on error)
+
+long long sieve_count( long long a, long long b, int threads );
+
+// Stores the first primes in [a, b), at most "size" of them, in buf;
+// returns how many were stored (-1 on error). If that is "size" there
+// may be more: continue from buf[size-1] + 1.
+
+long long sieve_fill( long long a, long long b, uint64_t *buf,
+                      long long size );
+
+// Frees the base primes that sieve_fill() keeps from one call to the
+// next for ranges beyond 2**56 (call it when done with such a range)
+
+void sieve_release( void );
+
+#endif
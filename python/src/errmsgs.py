@@ -26,7 +26,10 @@
 # Python imports
 
 import sys
-import inspect
+
+# "inspect" is slow to import, and only needed once there is an error to
+# report: it is imported by ArgumentError() (callers of diagPrintHdr()
+# import it themselves)
 
 # Local imports
 
@@ -134,6 +137,8 @@ class ArgumentError(Exception):
 
   def __init__( self, moduleName, errList ):
 
+    import inspect
+
     stkList      = inspect.stack()
     callStackStr = getCallStackStr(stkList)
 
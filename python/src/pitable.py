@@ -0,0 +1,523 @@
+# pitable.py
+#
+# Generated by primeslib.writePiTableModule(); do not edit.
+# counts[j] is the number of primes p with j*block < p <= (j+1)*block
+# (see primeslib.py).
+
+block  = 67108864
+limit  = 274877906944
+
+counts = (
+  3957809, 3645744, 3544827, 3482463, 3437085, 3402197, 3373686, 3348939,
+  3329249, 3310028, 3293561, 3279551, 3266014, 3253418, 3242855, 3232602,
+  3222113, 3213018, 3205022, 3196962, 3188894, 3182028, 3175755, 3168594,
+  3162023, 3156727, 3151172, 3144641, 3139404, 3135977, 3129789, 3125418,
+  3120479, 3117432, 3111878, 3107436, 3104743, 3100650, 3096898, 3092261,
+  3088830, 3086014, 3082894, 3079186, 3074839, 3073472, 3069221, 3066718,
+  3063330, 3061033, 3058062, 3055938, 3053720, 3049721, 3048133, 3045643,
+  3042960, 3039684, 3037634, 3034785, 3032784, 3031414, 3028144, 3026720,
+  3025521, 3022247, 3019054, 3019086, 3016467, 3014627, 3012841, 3009684,
+  3008722, 3006638, 3005072, 3002092, 3001710, 2999959, 2998259, 2995796,
+  2993426, 2993696, 2991005, 2990794, 2988499, 2986713, 2984618, 2982850,
+  2981800, 2980683, 2979047, 2978436, 2976576, 2975019, 2972450, 2970551,
+  2970677, 2969869, 2968596, 2966569, 2965315, 2963435, 2962609, 2960414,
+  2960557, 2959556, 2956756, 2955982, 2954514, 2954245, 2954190, 2951475,
+  2949219, 2948640, 2947844, 2947585, 2946363, 2944618, 2944327, 2943149,
+  2942009, 2939510, 2940969, 2938567, 2937805, 2935825, 2935577, 2934881,
+  2933212, 2931993, 2930708, 2930851, 2928384, 2928787, 2927820, 2926576,
+  2923976, 2925834, 2924792, 2922463, 2922098, 2920843, 2920228, 2920040,
+  2919471, 2917371, 2916520, 2915825, 2915122, 2913374, 2912801, 2912392,
+  2911096, 2911351, 2909487, 2908464, 2907061, 2908249, 2906441, 2905679,
+  2907174, 2902930, 2904146, 2902198, 2901339, 2902368, 2900771, 2899002,
+  2898110, 2897345, 2897100, 2898314, 2897383, 2895442, 2894784, 2893699,
+  2893159, 2892017, 2891259, 2891305, 2891084, 2889609, 2889532, 2887728,
+  2887054, 2888676, 2886925, 2884652, 2884435, 2884231, 2884237, 2883759,
+  2882566, 2881543, 2881139, 2880058, 2880368, 2878990, 2878764, 2878239,
+  2877809, 2875827, 2876770, 2875402, 2875438, 2873955, 2872990, 2873562,
+  2871866, 2870739, 2871673, 2871098, 2870892, 2869541, 2869159, 2869035,
+  2867351, 2868389, 2866345, 2866784, 2866401, 2864052, 2865289, 2863828,
+  2863584, 2864499, 2862304, 2861394, 2860543, 2861251, 2859570, 2861557,
+  2858920, 2859745, 2857610, 2857771, 2856494, 2856748, 2855682, 2855572,
+  2855535, 2854423, 2854243, 2853162, 2852631, 2852362, 2852780, 2851092,
+  2851965, 2850904, 2850543, 2850161, 2849131, 2848695, 2848181, 2847315,
+  2847318, 2846830, 2845971, 2845452, 2845669, 2844938, 2843826, 2844820,
+  2842903, 2843332, 2843525, 2841726, 2841800, 2841126, 2839981, 2840793,
+  2839328, 2840456, 2838683, 2838554, 2837950, 2837827, 2837350, 2836630,
+  2836205, 2835749, 2836115, 2835700, 2835231, 2835381, 2834418, 2834311,
+  2832899, 2832532, 2832498, 2830459, 2832747, 2831554, 2829408, 2831022,
+  2829907, 2828862, 2828850, 2828336, 2829113, 2828476, 2826927, 2827849,
+  2826539, 2826989, 2825318, 2825839, 2825510, 2824354, 2825379, 2824533,
+  2823060, 2824198, 2823381, 2821915, 2822253, 2822031, 2820830, 2820984,
+  2820459, 2821432, 2821030, 2820319, 2817180, 2819436, 2817546, 2818663,
+  2817968, 2817380, 2817715, 2816383, 2814441, 2816712, 2816019, 2815337,
+  2816012, 2814442, 2814310, 2812934, 2813207, 2813341, 2812664, 2811922,
+  2811362, 2811861, 2811557, 2810728, 2810814, 2811366, 2810989, 2810891,
+  2809083, 2808422, 2807920, 2809100, 2808297, 2808380, 2808123, 2807660,
+  2805926, 2806004, 2805825, 2805787, 2804258, 2805871, 2803902, 2805171,
+  2802835, 2804310, 2803643, 2803539, 2803724, 2802117, 2801823, 2803127,
+  2800750, 2800620, 2801191, 2800203, 2801166, 2799740, 2799529, 2798587,
+  2799360, 2798794, 2799332, 2797959, 2798299, 2797505, 2797889, 2797656,
+  2797136, 2796446, 2796765, 2796645, 2795865, 2795062, 2794699, 2794119,
+  2794783, 2794323, 2794520, 2794049, 2793353, 2793297, 2793753, 2790571,
+  2793258, 2792291, 2792485, 2791610, 2790355, 2791236, 2788885, 2790075,
+  2790117, 2790657, 2789447, 2788615, 2787920, 2787399, 2788484, 2787641,
+  2788276, 2786868, 2788693, 2786510, 2787151, 2786119, 2786684, 2785696,
+  2785709, 2785503, 2784025, 2784415, 2784445, 2784602, 2783570, 2784296,
+  2782398, 2782872, 2782620, 2783792, 2782425, 2782533, 2780631, 2781650,
+  2781294, 2782783, 2781035, 2781260, 2779459, 2779422, 2779896, 2779841,
+  2779741, 2780639, 2778443, 2778426, 2778981, 2776613, 2777699, 2777364,
+  2777707, 2777913, 2776579, 2776316, 2777378, 2774805, 2775926, 2775728,
+  2774761, 2774924, 2775897, 2774657, 2775329, 2774246, 2773774, 2773110,
+  2774448, 2773313, 2771930, 2773904, 2772112, 2772481, 2770008, 2772279,
+  2773301, 2771341, 2770821, 2772424, 2770252, 2770046, 2770947, 2768584,
+  2768832, 2770336, 2768980, 2768105, 2768691, 2767659, 2767741, 2767743,
+  2767629, 2768858, 2766828, 2766749, 2767137, 2767164, 2766621, 2766317,
+  2766735, 2765947, 2766184, 2765268, 2765387, 2765077, 2763876, 2764976,
+  2765059, 2764611, 2761568, 2764188, 2764825, 2762527, 2763532, 2763454,
+  2763036, 2762012, 2762843, 2761637, 2762661, 2761184, 2761141, 2761863,
+  2762841, 2759866, 2761032, 2761009, 2759352, 2758962, 2757899, 2760053,
+  2760257, 2759851, 2758705, 2758028, 2758140, 2757761, 2758390, 2757266,
+  2758220, 2756100, 2758114, 2756841, 2757247, 2755250, 2756597, 2755881,
+  2756330, 2756615, 2754503, 2755766, 2754618, 2755556, 2755844, 2754632,
+  2754872, 2754854, 2752023, 2753558, 2753244, 2753879, 2752974, 2751903,
+  2752928, 2752350, 2750848, 2752375, 2753241, 2752557, 2749208, 2750796,
+  2751733, 2750694, 2751087, 2751410, 2747939, 2750660, 2750174, 2750100,
+  2750418, 2750300, 2748665, 2749388, 2747511, 2748165, 2748053, 2749634,
+  2748275, 2748116, 2747321, 2749598, 2747182, 2746932, 2746687, 2748161,
+  2745343, 2747544, 2745852, 2743885, 2744973, 2745444, 2746401, 2744919,
+  2745599, 2744901, 2745930, 2745436, 2742780, 2744928, 2744978, 2743908,
+  2743561, 2743999, 2743029, 2744379, 2743010, 2743122, 2742050, 2743663,
+  2742788, 2742867, 2741352, 2741933, 2739869, 2740037, 2741650, 2740956,
+  2739684, 2740963, 2740115, 2740553, 2739796, 2739850, 2740059, 2739457,
+  2739478, 2739665, 2739649, 2739473, 2739647, 2738638, 2737808, 2738698,
+  2737835, 2738007, 2738645, 2737877, 2736076, 2737650, 2737507, 2736966,
+  2737532, 2736432, 2736790, 2737704, 2734879, 2736445, 2736204, 2736731,
+  2735268, 2734425, 2735402, 2734479, 2734547, 2733540, 2735593, 2734249,
+  2734906, 2733594, 2735209, 2733504, 2733443, 2732881, 2731702, 2733063,
+  2732181, 2732403, 2731993, 2732515, 2733214, 2731840, 2732793, 2731558,
+  2730800, 2732128, 2731808, 2730831, 2730372, 2729365, 2730126, 2730400,
+  2731124, 2730575, 2729330, 2729429, 2730095, 2728854, 2729618, 2728228,
+  2729877, 2728844, 2729412, 2728010, 2727937, 2727788, 2727689, 2727950,
+  2726697, 2727526, 2728349, 2727442, 2725966, 2727827, 2726137, 2727763,
+  2726596, 2727390, 2726166, 2725038, 2727396, 2726346, 2724879, 2726508,
+  2724487, 2724640, 2726232, 2723836, 2723754, 2724135, 2725237, 2724803,
+  2725236, 2722506, 2722437, 2723537, 2722924, 2725786, 2723499, 2722190,
+  2723617, 2723340, 2723437, 2722765, 2722745, 2722445, 2722416, 2721387,
+  2722596, 2721775, 2722409, 2721821, 2720169, 2720278, 2721241, 2721092,
+  2721314, 2721194, 2720973, 2720651, 2720017, 2719355, 2720786, 2718884,
+  2718614, 2718359, 2718318, 2719248, 2719652, 2718142, 2720702, 2719117,
+  2717876, 2718612, 2718154, 2717409, 2717385, 2717679, 2718044, 2718372,
+  2717122, 2718641, 2717153, 2717001, 2717360, 2716240, 2715554, 2717231,
+  2715978, 2715043, 2716074, 2716276, 2714965, 2715133, 2715095, 2714834,
+  2714758, 2716943, 2716189, 2712846, 2714762, 2712756, 2715025, 2714659,
+  2714780, 2714389, 2713945, 2714526, 2713420, 2712266, 2712115, 2713563,
+  2712701, 2712994, 2712926, 2712530, 2712671, 2711620, 2712509, 2710874,
+  2713425, 2712195, 2711001, 2711577, 2711073, 2711379, 2710709, 2711487,
+  2711243, 2710812, 2709581, 2710474, 2709901, 2711059, 2709371, 2709558,
+  2710053, 2709752, 2709152, 2709774, 2710144, 2709896, 2706174, 2709559,
+  2708640, 2708834, 2709898, 2708320, 2707477, 2708178, 2707232, 2708224,
+  2707515, 2707924, 2707609, 2706975, 2707223, 2707355, 2705671, 2705465,
+  2705713, 2706794, 2707756, 2706480, 2705249, 2705822, 2706276, 2706160,
+  2706212, 2706033, 2705231, 2705635, 2705392, 2705039, 2705123, 2704998,
+  2704224, 2704484, 2704175, 2704069, 2704748, 2704743, 2703324, 2705376,
+  2704106, 2704166, 2703121, 2704251, 2702872, 2703813, 2702736, 2703000,
+  2702317, 2703247, 2702722, 2701589, 2702483, 2701667, 2702190, 2702058,
+  2702041, 2701467, 2699985, 2701489, 2701194, 2700958, 2701280, 2701118,
+  2701151, 2699658, 2700588, 2701557, 2701172, 2698428, 2701529, 2700777,
+  2699927, 2698970, 2699395, 2697916, 2700598, 2698744, 2700828, 2698336,
+  2699524, 2699212, 2699817, 2698157, 2698291, 2698106, 2697157, 2698499,
+  2697956, 2698540, 2697462, 2699280, 2697693, 2696788, 2698279, 2697110,
+  2696506, 2696969, 2698294, 2696891, 2696939, 2696529, 2696345, 2696373,
+  2695404, 2695148, 2695948, 2695284, 2696597, 2695405, 2695256, 2696413,
+  2694952, 2695681, 2696060, 2694798, 2694723, 2695716, 2696228, 2693215,
+  2694473, 2693111, 2695136, 2692659, 2693799, 2694852, 2692918, 2693713,
+  2693328, 2694260, 2694181, 2692981, 2693903, 2692004, 2692773, 2693261,
+  2693518, 2691130, 2692471, 2691523, 2693085, 2691723, 2690930, 2692483,
+  2692553, 2691474, 2690882, 2692063, 2690787, 2691965, 2691908, 2690923,
+  2692006, 2691272, 2688752, 2691518, 2690237, 2690662, 2689341, 2690292,
+  2691236, 2690569, 2690671, 2689742, 2688860, 2690455, 2689657, 2689419,
+  2689615, 2689626, 2688901, 2690004, 2690312, 2687903, 2688409, 2689023,
+  2688272, 2689080, 2687192, 2688784, 2687725, 2689845, 2688437, 2686349,
+  2687564, 2687951, 2687530, 2686941, 2687127, 2686044, 2687019, 2685992,
+  2687205, 2686783, 2686823, 2686126, 2686433, 2686011, 2686589, 2685868,
+  2685610, 2686166, 2687603, 2686419, 2686264, 2684850, 2686919, 2686347,
+  2686209, 2683344, 2683975, 2684044, 2685637, 2683186, 2683144, 2684038,
+  2683470, 2683625, 2684683, 2684164, 2684082, 2685559, 2682929, 2682492,
+  2685054, 2683686, 2682811, 2683198, 2683585, 2682315, 2683878, 2682912,
+  2683112, 2683011, 2682794, 2682707, 2682778, 2683240, 2681336, 2681530,
+  2682256, 2681142, 2682409, 2680065, 2681074, 2680108, 2681465, 2681708,
+  2680804, 2681179, 2682041, 2680524, 2681604, 2681395, 2680769, 2680213,
+  2680491, 2680431, 2679726, 2680195, 2680114, 2680270, 2680613, 2679167,
+  2679416, 2680006, 2679365, 2679089, 2680402, 2679484, 2679991, 2678993,
+  2678950, 2677600, 2678632, 2679573, 2678318, 2678651, 2679006, 2677098,
+  2679208, 2678088, 2678232, 2679315, 2678414, 2678247, 2677391, 2677507,
+  2677059, 2679207, 2675409, 2678022, 2677764, 2676473, 2678058, 2675947,
+  2676892, 2676366, 2676964, 2675363, 2676568, 2676167, 2675033, 2674890,
+  2675653, 2674544, 2676123, 2675573, 2675922, 2676290, 2673923, 2676802,
+  2675172, 2674893, 2675384, 2675043, 2675607, 2674077, 2674981, 2675002,
+  2675323, 2674727, 2675746, 2672555, 2673987, 2673343, 2674716, 2673519,
+  2673461, 2673157, 2673505, 2672659, 2674009, 2674363, 2672131, 2673059,
+  2672531, 2672866, 2672307, 2673632, 2673241, 2672431, 2673200, 2672203,
+  2671468, 2673521, 2671546, 2671611, 2671065, 2672296, 2671374, 2672171,
+  2671506, 2672432, 2671599, 2670988, 2670923, 2671940, 2670224, 2670326,
+  2670605, 2672834, 2670602, 2669342, 2670259, 2671148, 2669180, 2671989,
+  2669611, 2670356, 2671822, 2669115, 2668728, 2671355, 2669707, 2669079,
+  2669472, 2670143, 2669227, 2667728, 2670737, 2668450, 2668347, 2668277,
+  2669631, 2670143, 2669078, 2669003, 2669939, 2667516, 2668408, 2668479,
+  2666241, 2668722, 2668395, 2667383, 2668303, 2666671, 2667501, 2667535,
+  2666294, 2668578, 2668076, 2668114, 2667581, 2666155, 2667068, 2667555,
+  2666260, 2667466, 2666198, 2666961, 2665362, 2667288, 2667477, 2666209,
+  2666125, 2663873, 2665275, 2665729, 2667703, 2665892, 2665314, 2666001,
+  2665835, 2666532, 2663946, 2665071, 2664120, 2664360, 2663975, 2665315,
+  2664880, 2664030, 2664536, 2663622, 2665948, 2664645, 2664220, 2664583,
+  2664714, 2664694, 2663704, 2664778, 2664125, 2663909, 2663063, 2663030,
+  2663503, 2663792, 2664677, 2663223, 2661643, 2661895, 2663290, 2663284,
+  2661844, 2662786, 2663312, 2663179, 2662298, 2663273, 2662282, 2662420,
+  2662596, 2662271, 2662052, 2660896, 2663496, 2660775, 2662910, 2662411,
+  2660283, 2661333, 2660751, 2662551, 2661976, 2662333, 2660469, 2660313,
+  2660136, 2662031, 2659093, 2660403, 2659588, 2661137, 2660457, 2660093,
+  2660726, 2660671, 2660364, 2659619, 2661055, 2659467, 2660532, 2659943,
+  2658927, 2660071, 2659397, 2658600, 2659132, 2659616, 2659227, 2660144,
+  2658829, 2658799, 2660303, 2657710, 2658738, 2658570, 2659300, 2658873,
+  2657992, 2658839, 2658829, 2657913, 2658555, 2658521, 2657131, 2658896,
+  2659113, 2657166, 2657054, 2657579, 2657309, 2655728, 2656940, 2656881,
+  2658590, 2657866, 2656951, 2656408, 2656745, 2657950, 2656802, 2657065,
+  2657825, 2655187, 2657886, 2656069, 2656691, 2657345, 2656326, 2655864,
+  2656607, 2655967, 2656029, 2654805, 2656284, 2655267, 2656174, 2654146,
+  2655866, 2655246, 2655829, 2654181, 2655264, 2654587, 2655894, 2654772,
+  2656170, 2653342, 2654948, 2653410, 2654469, 2654540, 2654717, 2654809,
+  2653935, 2654422, 2653904, 2654155, 2654396, 2654059, 2654604, 2653452,
+  2654636, 2651942, 2653822, 2652635, 2653016, 2654176, 2652856, 2652698,
+  2651730, 2652844, 2652956, 2652872, 2654341, 2652097, 2653217, 2652470,
+  2652614, 2652573, 2652083, 2651974, 2651931, 2653060, 2652114, 2651648,
+  2652474, 2651924, 2652842, 2652401, 2651775, 2652608, 2651957, 2652098,
+  2650071, 2650334, 2651006, 2652588, 2651082, 2650665, 2649876, 2651408,
+  2650566, 2650525, 2651267, 2648819, 2649767, 2651602, 2649579, 2652217,
+  2650061, 2649593, 2650245, 2649405, 2649384, 2649579, 2649453, 2649980,
+  2650438, 2649637, 2650035, 2649723, 2648647, 2649181, 2649365, 2649094,
+  2649768, 2649020, 2650366, 2649999, 2647924, 2647694, 2648588, 2648440,
+  2649547, 2648503, 2649972, 2648717, 2649203, 2647509, 2649181, 2648191,
+  2647026, 2647594, 2647696, 2647539, 2648366, 2647652, 2646288, 2647592,
+  2647781, 2648062, 2646808, 2647393, 2648297, 2647252, 2647226, 2645808,
+  2648237, 2646411, 2646875, 2645969, 2646009, 2646705, 2647055, 2644623,
+  2646421, 2647615, 2645270, 2644672, 2646687, 2644504, 2646636, 2644545,
+  2645651, 2645328, 2645797, 2645238, 2645875, 2644428, 2645763, 2645696,
+  2646014, 2644295, 2645574, 2645753, 2645191, 2644402, 2644815, 2645404,
+  2645659, 2644639, 2644775, 2644442, 2645266, 2642687, 2643373, 2643965,
+  2644363, 2644561, 2642332, 2643044, 2643750, 2643974, 2642986, 2643351,
+  2644133, 2642986, 2644252, 2642490, 2643756, 2642732, 2641688, 2643759,
+  2641478, 2643789, 2642362, 2643292, 2642230, 2641727, 2643084, 2642060,
+  2642290, 2643105, 2641125, 2643032, 2641581, 2644315, 2643113, 2642603,
+  2641064, 2641438, 2641773, 2643170, 2641170, 2640439, 2641663, 2642020,
+  2641058, 2643020, 2640913, 2641162, 2640433, 2641454, 2641820, 2639207,
+  2641817, 2641035, 2640491, 2640710, 2639914, 2640857, 2640552, 2640751,
+  2642459, 2639824, 2640830, 2639287, 2639931, 2640865, 2641370, 2638484,
+  2640303, 2640579, 2639616, 2638642, 2639384, 2639286, 2641556, 2638624,
+  2639734, 2639022, 2639290, 2638796, 2640045, 2638773, 2640385, 2639315,
+  2637755, 2639745, 2638369, 2639115, 2639895, 2639070, 2638048, 2639309,
+  2638673, 2638328, 2638828, 2637774, 2638135, 2638503, 2639107, 2638847,
+  2637223, 2638283, 2637402, 2638302, 2638015, 2637535, 2637665, 2638021,
+  2636748, 2637526, 2635729, 2637692, 2637318, 2638770, 2636581, 2637938,
+  2636736, 2636341, 2637973, 2638078, 2636191, 2636094, 2637163, 2636835,
+  2635341, 2636413, 2637065, 2635905, 2636609, 2635298, 2636579, 2635364,
+  2637319, 2637188, 2636693, 2634818, 2636249, 2636327, 2634533, 2635339,
+  2636324, 2636758, 2636095, 2635287, 2635939, 2635553, 2636462, 2634896,
+  2635525, 2633669, 2634252, 2635876, 2633910, 2634231, 2636224, 2634577,
+  2633733, 2633624, 2634780, 2635317, 2635652, 2634353, 2633768, 2633885,
+  2633647, 2634936, 2633749, 2632837, 2633763, 2633619, 2633695, 2632471,
+  2634093, 2634081, 2632372, 2634452, 2633060, 2633799, 2634092, 2633492,
+  2632239, 2633846, 2633609, 2632972, 2631825, 2632647, 2633619, 2634146,
+  2630556, 2631710, 2633234, 2633188, 2632327, 2634322, 2630826, 2631788,
+  2631672, 2632231, 2631450, 2632017, 2633690, 2631498, 2631296, 2631771,
+  2631347, 2630940, 2630512, 2631092, 2631975, 2632559, 2631642, 2631751,
+  2631854, 2631539, 2630533, 2630277, 2631878, 2632197, 2630081, 2630339,
+  2629918, 2629426, 2629894, 2631117, 2630930, 2630980, 2629643, 2629904,
+  2629700, 2629762, 2630093, 2629416, 2631018, 2629238, 2631040, 2630196,
+  2630615, 2628983, 2629307, 2629043, 2630428, 2629800, 2630338, 2628791,
+  2630853, 2629101, 2629885, 2630287, 2628770, 2630654, 2630674, 2628422,
+  2630210, 2628885, 2630028, 2627889, 2629265, 2629520, 2628078, 2628360,
+  2628258, 2628234, 2627004, 2630387, 2626928, 2627398, 2628726, 2629128,
+  2627414, 2627392, 2628945, 2627565, 2628454, 2629577, 2627648, 2627811,
+  2628503, 2627847, 2628264, 2626819, 2627397, 2627581, 2627178, 2627754,
+  2626838, 2626811, 2627328, 2626450, 2628206, 2625890, 2627171, 2627136,
+  2627525, 2625909, 2626406, 2627290, 2624743, 2627543, 2627218, 2626860,
+  2625905, 2627790, 2624236, 2624661, 2626228, 2625799, 2625747, 2625375,
+  2625989, 2625543, 2625682, 2624489, 2625255, 2625455, 2625938, 2625512,
+  2625373, 2625479, 2624782, 2626654, 2624627, 2625101, 2624693, 2624198,
+  2626276, 2623817, 2623956, 2625089, 2626746, 2625967, 2623082, 2624933,
+  2624894, 2623804, 2622938, 2624977, 2624214, 2624958, 2624189, 2625649,
+  2623934, 2623529, 2624158, 2623783, 2625346, 2623093, 2623219, 2623704,
+  2625252, 2623322, 2622128, 2623812, 2622807, 2622198, 2625403, 2623042,
+  2623016, 2622949, 2625132, 2624791, 2624187, 2621820, 2623247, 2623127,
+  2622660, 2622937, 2622533, 2622575, 2623821, 2622059, 2623805, 2621129,
+  2622987, 2623599, 2621716, 2622145, 2621661, 2621702, 2622318, 2622350,
+  2622405, 2621342, 2622607, 2621662, 2620983, 2622060, 2621322, 2622997,
+  2621437, 2621240, 2620577, 2620912, 2621637, 2620687, 2622697, 2620098,
+  2621315, 2620434, 2621335, 2620818, 2620842, 2619825, 2621203, 2620549,
+  2619990, 2621180, 2621966, 2620328, 2619697, 2620015, 2620235, 2620527,
+  2619543, 2620751, 2619974, 2620627, 2620128, 2620633, 2620273, 2620172,
+  2620774, 2619280, 2619623, 2618570, 2620377, 2618858, 2619624, 2621355,
+  2621163, 2618569, 2619305, 2620115, 2619624, 2618248, 2618171, 2619213,
+  2617801, 2619436, 2618674, 2618587, 2619021, 2620548, 2618401, 2617407,
+  2617275, 2619574, 2618816, 2618409, 2617133, 2618753, 2618212, 2618220,
+  2617538, 2618249, 2618174, 2617046, 2617912, 2618827, 2618127, 2617622,
+  2616543, 2618526, 2617367, 2617702, 2617514, 2618112, 2617357, 2618734,
+  2617633, 2617562, 2617893, 2616236, 2617722, 2616195, 2618485, 2618044,
+  2617794, 2617006, 2616154, 2617364, 2616481, 2616338, 2616862, 2615559,
+  2616790, 2616402, 2616137, 2615915, 2616257, 2616523, 2615966, 2615313,
+  2616667, 2615852, 2615889, 2616462, 2616470, 2615904, 2617075, 2615961,
+  2617125, 2616205, 2615319, 2615231, 2617235, 2615659, 2616765, 2615983,
+  2616552, 2614583, 2615857, 2614856, 2615289, 2614196, 2615199, 2615203,
+  2614851, 2613974, 2615081, 2614244, 2615848, 2614432, 2615420, 2615140,
+  2613100, 2615293, 2613753, 2613987, 2614423, 2614735, 2614474, 2613969,
+  2613626, 2613847, 2613863, 2614738, 2615012, 2614297, 2612921, 2615538,
+  2613481, 2614220, 2613764, 2614568, 2612599, 2613087, 2614315, 2613614,
+  2612638, 2613655, 2613552, 2613425, 2612712, 2612645, 2613194, 2614461,
+  2614015, 2612899, 2613455, 2613228, 2612222, 2611416, 2612564, 2612591,
+  2612628, 2612160, 2613021, 2613476, 2612758, 2612442, 2613131, 2611534,
+  2612416, 2612146, 2612572, 2613803, 2612021, 2612194, 2612197, 2612096,
+  2612158, 2613060, 2611533, 2613133, 2612053, 2611670, 2610960, 2611090,
+  2610554, 2610821, 2611565, 2611529, 2612440, 2610893, 2611625, 2611435,
+  2611562, 2610752, 2611007, 2610995, 2612232, 2610850, 2610605, 2611950,
+  2608865, 2611414, 2611387, 2611163, 2609552, 2612162, 2611224, 2610328,
+  2610063, 2609919, 2611386, 2609440, 2610833, 2612502, 2610193, 2610401,
+  2608006, 2611153, 2609307, 2608618, 2610213, 2611364, 2610959, 2610216,
+  2609608, 2609395, 2610452, 2610726, 2607926, 2610401, 2611169, 2609110,
+  2610298, 2609707, 2608203, 2609998, 2608557, 2609279, 2610887, 2609868,
+  2607317, 2609191, 2608508, 2609657, 2608464, 2608958, 2608732, 2607373,
+  2607588, 2609471, 2608826, 2608527, 2609681, 2607559, 2606871, 2607974,
+  2607713, 2608189, 2607799, 2608594, 2608096, 2608223, 2608184, 2607707,
+  2607877, 2607571, 2607215, 2608656, 2606246, 2607868, 2607935, 2607794,
+  2606657, 2608154, 2607402, 2608154, 2608032, 2606340, 2606739, 2605715,
+  2607404, 2607070, 2607106, 2607615, 2605115, 2607929, 2606466, 2607211,
+  2607106, 2607137, 2605387, 2605801, 2606559, 2606115, 2606386, 2607539,
+  2606321, 2605081, 2605600, 2606123, 2606604, 2605559, 2607450, 2606761,
+  2605989, 2606190, 2605486, 2606189, 2606369, 2605483, 2605945, 2604840,
+  2604622, 2605807, 2605429, 2604249, 2604290, 2605835, 2605354, 2604571,
+  2604917, 2605730, 2604063, 2607098, 2604504, 2606625, 2605802, 2606403,
+  2605285, 2604528, 2604827, 2606534, 2604796, 2604109, 2605063, 2604019,
+  2604053, 2604563, 2603884, 2604933, 2606335, 2606496, 2604073, 2604732,
+  2604278, 2603383, 2605541, 2604304, 2604887, 2604979, 2603854, 2603676,
+  2603468, 2604075, 2603141, 2604330, 2603682, 2604348, 2603769, 2603173,
+  2603975, 2605091, 2603993, 2603742, 2604044, 2602872, 2604233, 2602505,
+  2603644, 2604056, 2602790, 2602360, 2601843, 2604616, 2601564, 2603600,
+  2602372, 2602724, 2602915, 2602328, 2602273, 2602606, 2603861, 2602982,
+  2602769, 2602559, 2601836, 2602207, 2602599, 2601952, 2601832, 2602270,
+  2602701, 2602925, 2601674, 2601624, 2601768, 2602975, 2603185, 2602534,
+  2601535, 2602760, 2600605, 2602434, 2601886, 2601494, 2600648, 2602589,
+  2601366, 2601536, 2601099, 2601809, 2599993, 2601549, 2602003, 2601398,
+  2601665, 2601549, 2601343, 2601148, 2601646, 2600519, 2600988, 2600913,
+  2601510, 2601097, 2602171, 2600527, 2600586, 2600026, 2600992, 2600954,
+  2598980, 2599488, 2599467, 2600805, 2601590, 2600533, 2600682, 2598843,
+  2600749, 2600116, 2599862, 2601707, 2599248, 2600101, 2598812, 2599703,
+  2600846, 2599081, 2598575, 2600233, 2600468, 2599169, 2600042, 2598671,
+  2599216, 2599351, 2600760, 2599572, 2600203, 2597985, 2599047, 2600049,
+  2597706, 2598907, 2599876, 2599143, 2599385, 2597769, 2598581, 2599873,
+  2598702, 2597997, 2598879, 2598975, 2599967, 2598781, 2597518, 2598284,
+  2598601, 2598060, 2599580, 2599263, 2599894, 2598800, 2598368, 2598142,
+  2598088, 2596666, 2598407, 2596509, 2596332, 2597791, 2598792, 2598110,
+  2598685, 2597274, 2597152, 2597835, 2598443, 2598624, 2597639, 2596968,
+  2597742, 2596789, 2596472, 2597680, 2598133, 2597779, 2597503, 2597745,
+  2597364, 2598055, 2597620, 2596088, 2598265, 2596272, 2597356, 2596955,
+  2596519, 2596307, 2596793, 2597021, 2595561, 2597573, 2597272, 2596811,
+  2597447, 2595677, 2597450, 2596086, 2595868, 2596957, 2596049, 2597342,
+  2596768, 2596563, 2597861, 2596157, 2596707, 2596238, 2594478, 2594989,
+  2595916, 2597159, 2596205, 2595514, 2596471, 2595397, 2595260, 2595334,
+  2595277, 2595921, 2595832, 2596008, 2595595, 2595816, 2595026, 2596402,
+  2596080, 2593238, 2595361, 2595066, 2594955, 2595001, 2594983, 2595371,
+  2594836, 2595986, 2594803, 2596255, 2595484, 2594093, 2594087, 2595061,
+  2595601, 2595766, 2595723, 2594602, 2596213, 2594459, 2594731, 2595129,
+  2594326, 2592466, 2593446, 2594203, 2594656, 2594210, 2593617, 2594234,
+  2593279, 2595831, 2591904, 2594266, 2594280, 2594107, 2593640, 2593008,
+  2594371, 2594318, 2592602, 2594426, 2594187, 2591531, 2593871, 2593313,
+  2593951, 2592979, 2593461, 2592864, 2593678, 2594097, 2594862, 2592897,
+  2591874, 2593570, 2592699, 2592936, 2593570, 2592981, 2591513, 2592834,
+  2593214, 2593000, 2592810, 2592673, 2593323, 2592408, 2592780, 2593117,
+  2593260, 2592756, 2591847, 2591742, 2591398, 2591876, 2590826, 2594061,
+  2593896, 2591956, 2592026, 2593943, 2591684, 2592054, 2592524, 2591124,
+  2592176, 2591880, 2592010, 2590981, 2590410, 2590682, 2591443, 2591357,
+  2593145, 2592096, 2588841, 2593392, 2591966, 2591278, 2591348, 2590802,
+  2592287, 2591470, 2592069, 2591305, 2591193, 2592487, 2591134, 2591897,
+  2589772, 2592545, 2590468, 2591090, 2590888, 2589998, 2589690, 2590983,
+  2591144, 2590828, 2590746, 2589221, 2590917, 2589754, 2589507, 2591241,
+  2590281, 2590311, 2592309, 2590000, 2590092, 2589353, 2588866, 2589076,
+  2590866, 2589909, 2590124, 2590511, 2589869, 2592094, 2590512, 2588867,
+  2590529, 2589511, 2590142, 2589697, 2589677, 2589373, 2589538, 2591687,
+  2590320, 2588879, 2589037, 2589448, 2589539, 2587311, 2589787, 2589551,
+  2589291, 2588323, 2589023, 2589358, 2587906, 2588892, 2588296, 2588523,
+  2590247, 2586990, 2589095, 2589570, 2589560, 2588662, 2588578, 2590107,
+  2587802, 2588565, 2587352, 2589569, 2587734, 2588633, 2588735, 2589058,
+  2589312, 2588710, 2588091, 2588012, 2587877, 2588602, 2588040, 2589315,
+  2586911, 2586007, 2588541, 2587959, 2588430, 2587610, 2587965, 2588198,
+  2588104, 2587553, 2587354, 2586777, 2587995, 2588432, 2586761, 2586759,
+  2586533, 2587820, 2586645, 2586654, 2588072, 2587234, 2588085, 2586207,
+  2586824, 2587647, 2586748, 2586635, 2588088, 2587602, 2587762, 2585345,
+  2586317, 2587543, 2587883, 2588847, 2586037, 2586260, 2586644, 2586187,
+  2586335, 2586247, 2586700, 2584158, 2585922, 2586869, 2585537, 2585359,
+  2586657, 2585490, 2585623, 2585306, 2586409, 2586033, 2586768, 2586813,
+  2586608, 2585739, 2584432, 2587214, 2585923, 2585386, 2586115, 2585851,
+  2586709, 2586075, 2585283, 2586357, 2586420, 2584459, 2585298, 2585538,
+  2584943, 2586740, 2585529, 2585035, 2586167, 2585547, 2585109, 2584293,
+  2583794, 2585215, 2584591, 2584831, 2584283, 2587688, 2584505, 2585303,
+  2582934, 2584359, 2586677, 2584103, 2585076, 2583983, 2584357, 2585783,
+  2585146, 2582762, 2584556, 2583038, 2584513, 2585206, 2583730, 2584268,
+  2585278, 2583590, 2585412, 2583642, 2585185, 2583920, 2583888, 2584552,
+  2584532, 2583117, 2582616, 2584333, 2582990, 2583607, 2584316, 2583665,
+  2582985, 2583520, 2582684, 2583493, 2584236, 2583298, 2583129, 2583363,
+  2584278, 2584330, 2582797, 2581495, 2584170, 2584284, 2582793, 2583273,
+  2583668, 2583094, 2583494, 2584327, 2582724, 2582811, 2585212, 2582373,
+  2580922, 2582698, 2584482, 2583204, 2580988, 2582684, 2583525, 2580704,
+  2583519, 2584124, 2582503, 2581667, 2582507, 2583691, 2582374, 2582339,
+  2582777, 2582796, 2581999, 2582230, 2582553, 2582965, 2583299, 2582377,
+  2581603, 2581850, 2580705, 2583066, 2582396, 2582376, 2581666, 2580148,
+  2581643, 2582048, 2580878, 2580854, 2582160, 2582575, 2582135, 2582166,
+  2580715, 2582521, 2581531, 2580626, 2580923, 2580276, 2581685, 2581467,
+  2579624, 2582256, 2581366, 2581943, 2581000, 2581707, 2580228, 2580610,
+  2581560, 2580828, 2581065, 2580746, 2580775, 2579904, 2580482, 2580497,
+  2581019, 2580479, 2580232, 2579511, 2581111, 2581526, 2579448, 2580832,
+  2580517, 2581227, 2579783, 2580084, 2580836, 2580930, 2580603, 2580820,
+  2579892, 2580246, 2580164, 2580318, 2579860, 2580543, 2579239, 2580510,
+  2581641, 2580074, 2580007, 2579581, 2580566, 2579372, 2579333, 2578341,
+  2578590, 2579727, 2580395, 2578736, 2580051, 2579360, 2580162, 2579937,
+  2579513, 2580882, 2580134, 2579562, 2578797, 2580519, 2579020, 2579600,
+  2580106, 2578011, 2578310, 2580087, 2578626, 2577928, 2579318, 2579248,
+  2578125, 2578914, 2578196, 2579740, 2579774, 2579171, 2579020, 2578109,
+  2579458, 2578973, 2579554, 2578446, 2577920, 2577909, 2577215, 2578924,
+  2579153, 2578183, 2577941, 2578812, 2577845, 2578155, 2578682, 2578010,
+  2576330, 2575549, 2577346, 2576783, 2577952, 2577678, 2578081, 2576865,
+  2577342, 2577172, 2577478, 2577146, 2578197, 2578437, 2578296, 2576395,
+  2576125, 2578490, 2576391, 2575251, 2578113, 2575886, 2578010, 2577972,
+  2577312, 2576748, 2576642, 2578592, 2577312, 2575927, 2577986, 2576944,
+  2578435, 2577954, 2577097, 2576314, 2576721, 2577358, 2577433, 2574634,
+  2577355, 2575965, 2577782, 2576378, 2577315, 2575376, 2576210, 2576673,
+  2576101, 2578645, 2575511, 2576755, 2576864, 2576194, 2576630, 2576153,
+  2575900, 2576343, 2576359, 2576096, 2576192, 2575340, 2575464, 2576466,
+  2575842, 2575239, 2576659, 2576031, 2575755, 2576167, 2575434, 2575439,
+  2574172, 2575968, 2576616, 2575108, 2575674, 2575101, 2576310, 2575352,
+  2575656, 2576024, 2575378, 2575481, 2576030, 2575122, 2575056, 2576216,
+  2576028, 2574710, 2575685, 2574516, 2575083, 2575488, 2575720, 2574446,
+  2574906, 2573524, 2574405, 2575526, 2573841, 2573533, 2574676, 2576022,
+  2574972, 2573938, 2575990, 2574085, 2575676, 2574037, 2573655, 2573990,
+  2575187, 2573903, 2573832, 2573783, 2573428, 2575527, 2574768, 2574849,
+  2573408, 2573970, 2574023, 2574705, 2574077, 2575052, 2573305, 2574836,
+  2572673, 2573440, 2572800, 2572926, 2574919, 2574460, 2575165, 2574799,
+  2572895, 2572504, 2573816, 2572097, 2574324, 2573490, 2572344, 2574594,
+  2573525, 2570779, 2573675, 2572993, 2573530, 2573920, 2573301, 2573456,
+  2571881, 2573781, 2573736, 2571005, 2572357, 2572970, 2573666, 2572516,
+  2573299, 2573662, 2572796, 2572164, 2574140, 2572923, 2573263, 2571875,
+  2572992, 2573650, 2572116, 2570331, 2572508, 2572200, 2571829, 2572531,
+  2573468, 2572615, 2572257, 2573928, 2572563, 2570154, 2572372, 2571920,
+  2571970, 2572403, 2571787, 2571779, 2571836, 2571641, 2572052, 2572786,
+  2573188, 2573066, 2572887, 2571628, 2572414, 2571410, 2571156, 2571053,
+  2570909, 2573020, 2571733, 2572571, 2572056, 2572361, 2572829, 2570569,
+  2570286, 2572834, 2570407, 2570823, 2570418, 2572356, 2571488, 2569177,
+  2571248, 2571429, 2572177, 2571536, 2571895, 2571908, 2570110, 2570371,
+  2570670, 2571459, 2571626, 2570761, 2569950, 2571988, 2568494, 2571186,
+  2571252, 2570411, 2570396, 2571266, 2570560, 2570177, 2569457, 2571389,
+  2570441, 2570787, 2569458, 2570412, 2570160, 2569982, 2569063, 2569087,
+  2569911, 2571081, 2571319, 2569275, 2570448, 2570634, 2569414, 2570593,
+  2571242, 2568726, 2569605, 2571024, 2569997, 2569514, 2568588, 2569591,
+  2570856, 2569994, 2567972, 2570517, 2569678, 2568275, 2567675, 2569898,
+  2570805, 2570224, 2570144, 2569667, 2566952, 2570828, 2569144, 2568593,
+  2569422, 2570663, 2568700, 2569450, 2569787, 2568443, 2569268, 2568948,
+  2568862, 2569168, 2570416, 2567677, 2568920, 2569516, 2569339, 2569055,
+  2568286, 2568830, 2568184, 2568867, 2568668, 2569150, 2568710, 2568582,
+  2567690, 2567620, 2568297, 2569323, 2569761, 2568339, 2568222, 2569551,
+  2568610, 2567890, 2567617, 2568512, 2567155, 2566271, 2567136, 2567276,
+  2567425, 2569353, 2568526, 2567367, 2568680, 2568525, 2568190, 2566656,
+  2568879, 2566237, 2567925, 2567434, 2566278, 2568153, 2568008, 2566862,
+  2567902, 2568831, 2567414, 2567077, 2568209, 2567986, 2568268, 2567276,
+  2568740, 2566244, 2566411, 2567463, 2565751, 2567201, 2566584, 2566766,
+  2568200, 2566334, 2566388, 2568215, 2567538, 2566428, 2566526, 2566891,
+  2567623, 2566044, 2565830, 2567256, 2568042, 2566449, 2567767, 2566833,
+  2566478, 2567843, 2565654, 2566682, 2565897, 2566411, 2566048, 2566528,
+  2565229, 2567435, 2566799, 2566123, 2568194, 2565015, 2566345, 2565937,
+  2566714, 2565139, 2565933, 2565795, 2565954, 2566674, 2567256, 2567189,
+  2565065, 2566000, 2567861, 2564782, 2566547, 2567115, 2566321, 2565460,
+  2566098, 2564592, 2565264, 2564724, 2565148, 2564713, 2565401, 2564647,
+  2564351, 2565315, 2565054, 2565638, 2564704, 2564504, 2565353, 2564651,
+  2566031, 2564720, 2565405, 2564517, 2564964, 2566073, 2564046, 2564866,
+  2564880, 2566353, 2563680, 2565016, 2564351, 2563464, 2565271, 2563826,
+  2564261, 2566832, 2564590, 2565536, 2564511, 2562630, 2563992, 2564855,
+  2564453, 2566422, 2564717, 2563764, 2563339, 2564132, 2564539, 2563493,
+  2565571, 2564717, 2564538, 2563935, 2563905, 2564296, 2564619, 2564048,
+  2563677, 2564940, 2564180, 2563782, 2563521, 2564641, 2563718, 2563998,
+  2564025, 2564367, 2563943, 2564745, 2562640, 2564057, 2563901, 2565304,
+  2563505, 2564613, 2564174, 2562242, 2562907, 2563593, 2563060, 2564343,
+  2563298, 2561835, 2564026, 2563672, 2564305, 2563606, 2564133, 2561774,
+  2563693, 2565275, 2562055, 2562659, 2562045, 2563929, 2563052, 2562899,
+  2564698, 2563986, 2563445, 2563747, 2562496, 2564489, 2563483, 2562308,
+  2563458, 2564222, 2562592, 2563011, 2561894, 2562362, 2561829, 2563212,
+  2561981, 2562091, 2563593, 2562394, 2560083, 2562752, 2562780, 2563488,
+  2562557, 2561022, 2563407, 2562344, 2563574, 2562188, 2560722, 2562482,
+  2563137, 2562419, 2562365, 2560849, 2563032, 2563077, 2562104, 2562406,
+  2561593, 2562170, 2561816, 2563438, 2561122, 2561920, 2561768, 2561082,
+  2561183, 2559965, 2560825, 2562157, 2561295, 2562937, 2562278, 2562742,
+  2560154, 2562663, 2561487, 2559631, 2561421, 2560745, 2561585, 2562986,
+  2561648, 2561732, 2562182, 2560662, 2562365, 2560681, 2561547, 2560404,
+  2560449, 2561224, 2561357, 2560881, 2560499, 2561488, 2560064, 2560348,
+  2560976, 2561656, 2560816, 2560989, 2561013, 2560815, 2559122, 2560147,
+  2560608, 2561700, 2560779, 2560105, 2561277, 2560618, 2559897, 2559512,
+  2560495, 2560284, 2561192, 2560932, 2559779, 2559210, 2561642, 2559274,
+  2559819, 2559945, 2558833, 2560801, 2559623, 2559739, 2559293, 2559085,
+  2559274, 2558579, 2561797, 2559717, 2560541, 2558582, 2559636, 2559043,
+  2560605, 2559520, 2559579, 2558686, 2559488, 2558890, 2559192, 2558592,
+  2557892, 2559329, 2559494, 2560586, 2558672, 2560245, 2558871, 2559729,
+  2560410, 2559116, 2559674, 2558197, 2559666, 2560224, 2557982, 2559131,
+  2559530, 2558179, 2559280, 2559721, 2559138, 2558330, 2558659, 2559833,
+  2557698, 2558707, 2559781, 2559581, 2558410, 2559999, 2557626, 2557887,
+  2558530, 2559012, 2558554, 2558755, 2558331, 2558264, 2558788, 2558674,
+  2558365, 2559116, 2558344, 2558904, 2558378, 2556917, 2558273, 2559464,
+  2558030, 2557774, 2557868, 2556799, 2558351, 2557409, 2557937, 2558195,
+  2556972, 2557556, 2558852, 2557076, 2557372, 2557614, 2557650, 2559352,
+  2556158, 2557659, 2558140, 2558007, 2557374, 2557734, 2558119, 2556880,
+  2558625, 2556084, 2558979, 2558085, 2556754, 2557271, 2555374, 2558413,
+  2557671, 2556832, 2557533, 2556553, 2557059, 2557488, 2556297, 2558263,
+  2556040, 2557168, 2555875, 2557497, 2555617, 2556576, 2555943, 2558126,
+  2557646, 2557238, 2556522, 2556780, 2556320, 2555529, 2558933, 2558091,
+  2557075, 2557286, 2556569, 2557440, 2556268, 2557954, 2556622, 2556539,
+  2556139, 2555831, 2556142, 2556836, 2555262, 2556295, 2556801, 2557862,
+  2556254, 2554603, 2555492, 2555574, 2554491, 2557123, 2555998, 2555970,
+  2557263, 2554770, 2556170, 2557367, 2555168, 2556767, 2556555, 2555822,
+  2555902, 2556010, 2556108, 2556648, 2555917, 2555628, 2555825, 2554647,
+  2556125, 2556896, 2555262, 2556743, 2556928, 2557219, 2554271, 2555861,
+  2555217, 2556201, 2555631, 2555361, 2554612, 2554864, 2556142, 2555677,
+  2555647, 2555262, 2554888, 2555082, 2555991, 2555316, 2556240, 2555052,
+  2555040, 2554297, 2553504, 2554685, 2555646, 2554335, 2554724, 2552816,
+  2556210, 2553993, 2555407, 2553948, 2552969, 2555703, 2555388, 2555579,
+  2553748, 2554070, 2553846, 2554593, 2554521, 2555410, 2554800, 2553573,
+  2554588, 2552985, 2555598, 2553154, 2554709, 2555009, 2555016, 2554586,
+  2552920, 2553144, 2554885, 2555507, 2554011, 2554207, 2553903, 2553614,
+  2555207, 2554053, 2555659, 2552958, 2553119, 2553899, 2553636, 2553495,
+  2554380, 2553474, 2554308, 2553806, 2552541, 2554248, 2554925, 2552759,
+  2553307, 2553149, 2552812, 2552963, 2554265, 2555155, 2552577, 2554083,
+  2553689, 2553296, 2552609, 2554005, 2552745, 2553083, 2554180, 2553072,
+  2553599, 2555591, 2552369, 2553000, 2554078, 2553640, 2552796, 2553753,
+  2552284, 2552708, 2553086, 2552845, 2552903, 2552936, 2551546, 2552239,
+  2552475, 2553792, 2552316, 2553869, 2551992, 2553618, 2553218, 2552372,
+  2552435, 2552037, 2552599, 2550515, 2552472, 2554368, 2553697, 2552701,
+  2553458, 2552385, 2552298, 2554515, 2552876, 2552298, 2551640, 2553231,
+  2552516, 2551825, 2553383, 2550551, 2552202, 2551741, 2551363, 2553321,
+  2552847, 2553099, 2552344, 2551681, 2551661, 2551626, 2551806, 2551687,
+  2552512, 2553161, 2551402, 2550070, 2551637, 2550768, 2552001, 2551723,
+  2550766, 2552203, 2550471, 2551793, 2552932, 2550891, 2550045, 2550885,
+  2552317, 2550203, 2552421, 2550228, 2551321, 2551521, 2553359, 2551506,
+  2550966, 2550618, 2551278, 2551180, 2550977, 2550457, 2549323, 2549917,
+  2550890, 2551410, 2551819, 2551984, 2550860, 2551250, 2550192, 2551202,
+  2551045, 2549193, 2550748, 2552065, 2550543, 2550839, 2550698, 2550333,
+  2549719, 2551367, 2550557, 2549449, 2551086, 2550241, 2551167, 2551285,
+  2550007, 2550773, 2550444, 2549323, 2551602, 2549641, 2550140, 2551835,
+  2550333, 2549252, 2550466, 2547822, 2550396, 2550217, 2550174, 2549614,
+  2550437, 2551024, 2550358, 2550346, 2549663, 2550236, 2551179, 2550456,
+  2549852, 2549981, 2550733, 2548633, 2550249, 2550017, 2551990, 2548253,
+  2550087, 2550004, 2549373, 2550000, 2548315, 2550193, 2549794, 2549550,
+  2549474, 2550067, 2548489, 2550268, 2548461, 2549107, 2549768, 2550698,
+  2548432, 2549876, 2549325, 2549565, 2550662, 2549628, 2549001, 2549512,
+  2550010, 2548720, 2549708, 2549519, 2548405, 2548396, 2548418, 2549080,
+  2550534, 2548950, 2550377, 2546552, 2548999, 2549014, 2549673, 2548269,
+  2549890, 2548001, 2547592, 2549538, 2547727, 2548546, 2547949, 2549276,
+  2546847, 2549882, 2549423, 2548274, 2548861, 2547994, 2548644, 2548875,
+  2548429, 2548300, 2548361, 2549554, 2548102, 2547037, 2547600, 2547428,
+  2548821, 2547861, 2546939, 2547744, 2548975, 2548411, 2548063, 2547721,
+  2547303, 2547793, 2546654, 2547671, 2550388, 2549227, 2547908, 2547534,
+  )
@@ -8,9 +8,6 @@
 # Date        Who  Description
 # 2015/08/28  sgc  Initial version
 #
-# TODO:
-# - add config file reader
-#
 ###############################################################################
 #
 #--- Directory of routines:
@@ -20,11 +17,13 @@
 #------------------------------------------------------------------------------
 
 #--- Python Imports
+#
+# Only what every run needs is imported here ("argparse" is imported by
+# parseCmdLine(), "inspect" only when there is an error to report), so
+# that short runs start quickly.
 
 import sys
 import os
-import argparse
-import subprocess
 
 #--- Project imports
 
@@ -37,9 +36,16 @@ from errmsgs import *
 
 class ArgumentParserError(Exception): pass
 
-class ThrowingArgumentParser(argparse.ArgumentParser):
-    def error(self, message):
-        raise ArgumentParserError(message)
+def throwingArgumentParser( **kwargs ):
+  '''Returns an argparse.ArgumentParser() that raises ArgumentParserError'''
+
+  import argparse
+
+  class ThrowingArgumentParser(argparse.ArgumentParser):
+      def error(self, message):
+          raise ArgumentParserError(message)
+
+  return ThrowingArgumentParser(**kwargs)
 
 # Get path to directory where PRIMES is installed
 
@@ -61,6 +67,12 @@ thisProgramName, thisProgramExt = os.path.splitext(__file__)
 
 thisScriptDir  = sys.path[0]
 
+# The Makefile replaces xxVERSIONxx with the contents of "version.txt"
+# when it installs primes.py as "primes"; run from the source directory,
+# the version is read from "version.txt".
+
+installedVersion = 'xxVERSIONxx'
+
 #------------------------------------------------------------------------------
 #- Main Script
 #------------------------------------------------------------------------------
@@ -74,11 +86,15 @@ def main(argv=None):
 
   diagPrint = 0
 
-  #--- Must have a "version.txt" file to run!
+  #--- Must have a version (installed, or from "version.txt") to run!
 
-  primeslib.thisProgramVersion = getVersionNumberFromFile()
+  if installedVersion != 'xx'+'VERSIONxx':
+    primeslib.thisProgramVersion = installedVersion
+  else:
+    primeslib.thisProgramVersion = getVersionNumberFromFile()
 
   if not primeslib.thisProgramVersion:
+    import inspect
     hdr = diagPrintHdr(inspect.stack(),'primes.py:','main()')
     p_err(hdr)
     p_err('  ERROR: cannot find "version.txt" file!')
@@ -129,7 +145,6 @@ def getVersionNumberFromFile():
 
   errMsg = ''
   versionFileFound = False
-  hdr = diagPrintHdr(inspect.stack(),'primes.py','getVersionNumberFromFile:')
 
   try:
     versionFile = \
@@ -143,6 +158,9 @@ def getVersionNumberFromFile():
       versionFileFound = True
     except IOError as e2:
       errMsg2 = '  ERROR: "./version.txt" not found:'+'\n  '+str(e2)
+      import inspect
+      hdr = diagPrintHdr(inspect.stack(),'primes.py',\
+                         'getVersionNumberFromFile:')
       p_err(hdr)
       p_err(errMsg1)
       p_err(errMsg2)
@@ -168,6 +186,7 @@ def parseCmdLine( argv ):
   diagPrint = 0
 
   if diagPrint:
+    import inspect
     hdr = diagPrintHdr(inspect.stack(),'primes.py:','parseCmdLine()')
     p_dbg(hdr)
     p_dbg('  argv      = '+str(argv))
@@ -204,7 +223,7 @@ def parseCmdLine( argv ):
   #-------------------------------------------------------------------
 
   argParser = \
-  ThrowingArgumentParser( \
+  throwingArgumentParser( \
     prog=thisProgramName, \
     description= \
     thisProgramName+' v'+\
@@ -233,7 +252,7 @@ def parseCmdLine( argv ):
 
   argParser.add_argument( \
     '-c', '--config', \
-    help='config file name' \
+    help='OPTIONAL: config file name (default: primes.conf)' \
     )
 
   # UNADVERTISED
@@ -250,12 +269,79 @@ def parseCmdLine( argv ):
      default=None \
     )
 
+  argParser.add_argument( \
+    '-W', '--wheel', \
+    help='OPTIONAL: trial division wheel modulus, 2 (default), 30 or 210', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-k', '--nth_prime', \
+    help='OPTIONAL: print the k-th prime number then exit', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-w', '--workers', \
+    help='OPTIONAL: number of worker processes for run modes PARALLEL, '+\
+         'GAPS and TUPLES', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-i', '--input_filename', \
+    help='OPTIONAL: name of file of queries to answer ("-" is STDIN)', \
+    default=None \
+    )
+
   argParser.add_argument( \
     '-o', '--output_filename', \
-    help='REQUIRED: name of output file', \
+    help='OPTIONAL: name of output file (default is STDOUT)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-C', '--checkpoint', \
+    help='OPTIONAL: name of file in which to checkpoint the search', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-T', '--checkpoint_interval', \
+    help='OPTIONAL: seconds between checkpoints (default 60)', \
     default=None \
     )
 
+  argParser.add_argument( \
+    '-r', '--resume', \
+    help='OPTIONAL: resume the search from its checkpoint file', \
+    action='store_true' \
+    )
+
+  argParser.add_argument( \
+    '-p', '--progress', \
+    help='OPTIONAL: seconds between progress reports (default: none)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-P', '--progress_filename', \
+    help='OPTIONAL: name of JSON-lines file for progress reports', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-f', '--output_format', \
+    help='OPTIONAL: output file format, TEXT (default) or TABLE', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-n', '--no_annotate', \
+    help='OPTIONAL: do not print the "[divisions]" count after each prime', \
+    action='store_true' \
+    )
+
   argParser.add_argument( \
     '-v', '--version', \
     help='OPTIONAL: print version number then exit', \
@@ -310,18 +396,24 @@ def usage():
     '\n'+\
     '\n'+\
     'primes \ \n'+\
-    '  -i/--input_file  <input_file> \ \n'+\
     '  -o/--output_file <output_file> \ \n'+\
     '  -m/--mode        <run_mode> \ \n'+\
+    '  [ -c/--config <config_file> ] \ \n'+\
+    '  [ -W/--wheel <modulus> ] \ \n'+\
+    '  [ -k/--nth_prime <k> ] \ \n'+\
+    '  [ -w/--workers <n> ] \ \n'+\
+    '  [ -C/--checkpoint <checkpoint_file> ] \ \n'+\
+    '  [ -T/--checkpoint_interval <seconds> ] \ \n'+\
+    '  [ -r/--resume ] \ \n'+\
+    '  [ -p/--progress <seconds> ] \ \n'+\
+    '  [ -P/--progress_filename <progress_file> ] \ \n'+\
+    '  [ -f/--output_format <format> ] \ \n'+\
+    '  [ -i/--input_filename <query_file> ] \ \n'+\
+    '  [ -n/--no_annotate ] \ \n'+\
     '  [ -h/--help ] \ \n'+\
     '  [ -v/--version ] \ \n'+\
     '  [ -x/--examples ] \ \n'+\
     '\n'+\
-    'REQUIRED ARGUMENTS:\n'+\
-    '\n'+\
-    '-i|--input:\n'+\
-    '  Name of input file\n'+\
-    '\n'+\
     'OPTIONAL ARGUMENTS []:\n'+\
     '\n'+\
     '[-o|--output] :\n'+\
@@ -330,6 +422,60 @@ def usage():
     '[-m|--mode] :\n'+\
     '  Name of run mode. Valid run mode names are:\n'+\
     '  '+str(primeslib.validRunModes)+'\n'\
+    '  Without -e|--end_search, the sieve run modes (SIEVE, PARALLEL,\n'+\
+    '  NUMPY, CTYPES) search forever with an unbounded sieve.\n'+\
+    '\n'+\
+    '[-c|--config] :\n'+\
+    '  Name of config file (default: primes.conf, if installed). Sets\n'+\
+    '  the default run mode and the range cache used by the sieve run\n'+\
+    '  modes (cache_dir, cache_max_bytes, cache_memory_blocks).\n'+\
+    '\n'+\
+    '[-W|--wheel] :\n'+\
+    '  Wheel used by trial division: only integers prime to the wheel\n'+\
+    '  modulus are tested or used as divisors. Valid wheels are:\n'+\
+    '  '+str(primeslib.validWheels)+'\n'\
+    '\n'+\
+    '[-k|--nth_prime] :\n'+\
+    '  Print the k-th prime number (2 is the 1st) then exit.\n'+\
+    '\n'+\
+    '[-w|--workers] :\n'+\
+    '  Number of worker processes used in run mode PARALLEL\n'+\
+    '  (default: one per CPU), and in run modes GAPS and TUPLES\n'+\
+    '  (default: none).\n'+\
+    '\n'+\
+    '[-C|--checkpoint] :\n'+\
+    '  Name of a file in which the progress of the search is saved\n'+\
+    '  every -T|--checkpoint_interval seconds (default 60).\n'+\
+    '\n'+\
+    '[-r|--resume] :\n'+\
+    '  Restart the search where its -C|--checkpoint file left off,\n'+\
+    '  appending to the -o|--output_filename file.\n'+\
+    '\n'+\
+    '[-i|--input_filename] :\n'+\
+    '  Answer the queries in this file ("-" for STDIN) instead of\n'+\
+    '  searching, one per line: "count 0 1000000", "primes 90 110",\n'+\
+    '  "is_prime 97", "next_prime n", "prev_prime n", "factorize n",\n'+\
+    '  "nth_prime k", "prime_pi x", or the same as a JSON object\n'+\
+    '  {"id": 7, "op": "count", "a": 0, "b": 1000000}. Each answer\n'+\
+    '  is one JSON line {"id": 7, "result": 78498}, in the order of\n'+\
+    '  the queries (the id of a plain query is its line number).\n'+\
+    '\n'+\
+    '[-p|--progress] :\n'+\
+    '  Report the progress of the search (primes found, divisions,\n'+\
+    '  rate) to STDERR every <seconds> seconds.\n'+\
+    '\n'+\
+    '[-P|--progress_filename] :\n'+\
+    '  Write the progress reports to this file instead, one JSON\n'+\
+    '  object per line, ending with a "done" report that includes\n'+\
+    '  the time spent in each phase (default interval 10 seconds).\n'+\
+    '\n'+\
+    '[-f|--output_format] :\n'+\
+    '  TEXT (one prime per line) or TABLE (binary prime table, which\n'+\
+    '  requires -e and -o). Valid output formats are:\n'+\
+    '  '+str(primeslib.validOutputFormats)+'\n'\
+    '\n'+\
+    '[-n|--no_annotate] :\n'+\
+    '  Print each prime without its "[divisions]" count.\n'+\
     '\n'+\
     '[-h|--help] :\n'+\
     '  Print "usage()" message then exit.\n'+\
@@ -356,9 +502,10 @@ def examples():
     'PRIMES for mission "'+str(primesMissionID)+'"; examples:\n'+\
     '\n'+\
     'primes \\\n'+\
-    '  -i input_file \\\n'+\
     '  -o output_file \\\n'+\
-    '  -m PRIMES_MODE\n')
+    '  -m PRIMES_MODE\n'+\
+    '\n'+\
+    'echo "count 0 1000000" | primes -i - -o output_file\n')
 
   # end function examples() ///////////////////////////////////////////////////
 
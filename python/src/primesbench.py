@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+###############################################################################
+# primesbench.py
+#
+# Benchmark suite for the PRIMES search engines.
+#
+# Runs every available engine (trial division variants, sieve variants,
+# parallel sieve, Miller-Rabin, the C program and its library) over a
+# matrix of interval sizes and offsets and reports, for each run, the
+# number of primes found, wall clock and CPU time, peak resident set
+# size, and primes per second. Results are printed as a table and may
+# be written as JSON ("-o|--output_filename") so that releases can be
+# compared.
+#
+# Each run is made in a child process so that its CPU time (as returned
+# by os.wait4()) and peak RSS belong to that run alone. Python engines
+# only count primes (no output is formatted); the C program prints its
+# primes to a pipe that this script reads and counts.
+#
+# The peak RSS is the child's VmHWM, read from /proc/<pid>/status as the
+# child starts to exit (the child is traced with ptrace(2) to stop it
+# there). The ru_maxrss of os.wait4() cannot be used: Linux counts in it
+# the copy of this script that the child was forked from, so that every
+# run would report at least the RSS of this script. Where children
+# cannot be traced, ru_maxrss is reported all the same; the RSS of this
+# script is reported next to it as "driver_rss_kb" so that such values
+# can be told apart.
+#
+# With "-U|--startup", it instead times the start up of the primes
+# command (a short search, compared with starting Python alone, with
+# importing primeslib and with loading its small primes table), and
+# with "-L|--startup_limit" fails when the command takes longer than
+# that to run, so that slow imports do not creep back in.
+#
+###############################################################################
+#
+#--- Directory of routines:
+#
+# (egrep 'class|def' primesbench.py > primesbench.routines)
+#
+# def main(argv=None):
+# def parseCmdLine( argv ):
+# def runCase( engine, lo, hi ):
+# def caseCommand( engine, lo, hi, cProgram ):
+# def loadPtrace():
+# def traceMe():
+# def readOutput( stdout, output ):
+# def waitChild( pid, traced ):
+# def readPeakRSS( pid ):
+# def measure( cmd, timeout ):
+# def runBenchmarks( engines, sizes, offsets, timeout, cProgram ):
+# def printResults( results, header=True ):
+# def runStartup( runs, primesScript, timeout ):
+# def printStartup( results ):
+#
+#------------------------------------------------------------------------------
+
+#--- Python Imports
+
+import sys
+import os
+import time
+import resource
+import threading
+import json
+import platform
+import datetime
+import argparse
+import signal
+import subprocess
+
+#--- Project imports
+
+import primeslib
+
+#--- Global variables
+
+thisScriptDir = os.path.dirname(os.path.abspath(__file__))
+
+# Engines: name -> (run mode, trial division wheel). "C" is the C
+# program (c/src/primes) dividing by trial, "C_SIEVE" its threaded
+# segmented sieve writing raw binary primes; "CTYPES" is the same sieve
+# called through libprimes.so.
+
+benchEngines = { \
+  'DEFAULT'      : ('DEFAULT',      2), \
+  'WHEEL30'      : ('DEFAULT',      30), \
+  'WHEEL210'     : ('DEFAULT',      210), \
+  'TRIAL_PRIMES' : ('TRIAL_PRIMES', 2), \
+  'SIEVE'        : ('SIEVE',        2), \
+  'NUMPY'        : ('NUMPY',        2), \
+  'PARALLEL'     : ('PARALLEL',     2), \
+  'MILLER_RABIN' : ('MILLER_RABIN', 2), \
+  'CTYPES'       : ('CTYPES',       2), \
+  'C'            : (None,           None), \
+  'C_SIEVE'      : (None,           None) }
+
+defaultSizes   = [10**4, 10**5, 10**6]
+defaultOffsets = [0, 10**9, 10**12]
+defaultTimeout = 60.0
+
+defaultCProgram = \
+  os.path.join(thisScriptDir, '..', '..', 'c', 'src', 'primes')
+
+# ptrace(2) requests, options and events used by measure() (Linux values)
+
+PTRACE_TRACEME     = 0
+PTRACE_CONT        = 7
+PTRACE_SETOPTIONS  = 0x4200
+PTRACE_O_TRACEEXIT = 0x40
+PTRACE_O_EXITKILL  = 0x100000
+PTRACE_EVENT_EXIT  = 6
+
+ptrace       = None
+ptraceLoaded = False
+
+# "-U|--startup": the primes command timed (primes.py in the source
+# directory, the installed "primes" script otherwise)
+
+defaultPrimesScript = os.path.join(thisScriptDir, 'primes.py')
+if not os.path.exists(defaultPrimesScript):
+  defaultPrimesScript = os.path.join(thisScriptDir, 'primes')
+
+#------------------------------------------------------------------------------
+#- Main Script
+#------------------------------------------------------------------------------
+
+def main(argv=None):
+  '''Main program - PRIMESBENCH'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  args = parseCmdLine(argv)
+
+  # Child process: run one case and report the number of primes found
+
+  if args.case:
+    engine, lo, hi = args.case
+    print(runCase(engine, int(lo), int(hi)))
+    return 0
+
+  # Start up benchmark
+
+  if args.startup:
+    results = runStartup(int(args.startup), args.primes_script, \
+                         float(args.timeout))
+    printStartup(results)
+
+    if args.output_filename:
+      with open(args.output_filename, 'w') as f:
+        json.dump({'version' : primeslib.thisProgramVersion, \
+                   'startup' : results}, f, indent=2)
+        f.write('\n')
+
+    primesRun = results[-1]
+    if primesRun['status'] != 'ok':
+      return 1
+    if args.startup_limit and \
+       primesRun['median_ms'] > float(args.startup_limit):
+      primeslib.p_err('ERROR: median start up time of "'+\
+                      primesRun['command']+'" is '+\
+                      '%.1f' % primesRun['median_ms']+' ms, above the '+\
+                      'limit of '+str(args.startup_limit)+' ms')
+      return 1
+    return 0
+
+  engines = args.engines.split(',') if args.engines else list(benchEngines)
+  sizes   = [int(float(s)) for s in args.sizes.split(',')] \
+            if args.sizes else defaultSizes
+  offsets = [int(float(s)) for s in args.offsets.split(',')] \
+            if args.offsets else defaultOffsets
+
+  for engine in engines:
+    if not engine in benchEngines:
+      primeslib.p_err('ERROR: unknown engine "'+engine+'" : valid engines '+\
+                      'are : '+str(list(benchEngines)))
+      return 2
+
+  # Results are printed as each run completes
+
+  results = runBenchmarks(\
+    engines, sizes, offsets, float(args.timeout), args.c_program)
+
+  if args.output_filename:
+    report = { \
+      'version'   : primeslib.thisProgramVersion, \
+      'timestamp' : datetime.datetime.now().isoformat(), \
+      'python'    : sys.version.split()[0], \
+      'platform'  : platform.platform(), \
+      'cpus'      : os.cpu_count(), \
+      'results'   : results }
+    with open(args.output_filename, 'w') as f:
+      json.dump(report, f, indent=2)
+      f.write('\n')
+
+  return 0
+
+  # end main()
+
+#------------------------
+# function parseCmdLine()
+#------------------------
+
+def parseCmdLine( argv ):
+  '''Parse the command line'''
+
+  argParser = argparse.ArgumentParser( \
+    prog='primesbench', \
+    description='Benchmarks the PRIMES search engines' \
+    )
+
+  argParser.add_argument( \
+    '-E', '--engines', \
+    help='comma separated engines to run (default: all) : '+\
+         str(list(benchEngines)), \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-S', '--sizes', \
+    help='comma separated interval sizes (default: 1e4,1e5,1e6)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-O', '--offsets', \
+    help='comma separated interval start points (default: 0,1e9,1e12)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-t', '--timeout', \
+    help='seconds allowed for each run (default: 60)', \
+    default=defaultTimeout \
+    )
+
+  argParser.add_argument( \
+    '-c', '--c_program', \
+    help='path to the C program (default: c/src/primes)', \
+    default=defaultCProgram \
+    )
+
+  argParser.add_argument( \
+    '-U', '--startup', \
+    help='time this many start ups of the primes command (instead of '+\
+         'the engines)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-L', '--startup_limit', \
+    help='with -U, fail if the median start up takes more milliseconds', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-p', '--primes_script', \
+    help='path to the primes command (default: primes.py)', \
+    default=defaultPrimesScript \
+    )
+
+  argParser.add_argument( \
+    '-o', '--output_filename', \
+    help='name of JSON file for the results', \
+    default=None \
+    )
+
+  # UNADVERTISED: run a single case (used by the child processes)
+  argParser.add_argument( \
+    '--case', \
+    nargs=3, \
+    help=argparse.SUPPRESS \
+    )
+
+  return argParser.parse_args(argv)
+
+  # end function parseCmdLine() ///////////////////////////////////////////////
+
+#------------------------------------------------------------------------------
+# FUNCTIONS
+#------------------------------------------------------------------------------
+
+#-------------------
+# function runCase()
+#-------------------
+
+def runCase( engine, lo, hi ):
+  '''Returns the number of primes in [lo, hi] found by "engine"'''
+
+  class BenchParameters(object):
+    pass
+
+  rp = BenchParameters()
+  rp.run_mode, rp.wheel = benchEngines[engine]
+  rp.workers = None
+
+  gen      = primeslib.PrimesGenerator(rp)
+  n_primes = 0
+
+  # Trial division engines are run directly; iter_prime_chunks() would
+  # hand high, narrow intervals over to Miller-Rabin.
+
+  if rp.run_mode in ('DEFAULT', 'TRIAL_PRIMES'):
+    for x, i_div in gen.iterTrialDivision(lo, hi):
+      n_primes += 1
+    # Trial division reports 1 and not 2
+    n_primes += (lo <= 2 <= hi) - (lo <= 1 <= hi)
+  else:
+    for primes in gen.iter_prime_chunks(lo, hi):
+      n_primes += len(primes)
+
+  return n_primes
+
+  # end function runCase() ////////////////////////////////////////////////////
+
+#-----------------------
+# function caseCommand()
+#-----------------------
+
+def caseCommand( engine, lo, hi, cProgram ):
+  '''Returns the command line that runs one benchmark case'''
+
+  if engine == 'C':
+    return [cProgram, '-s', str(lo), '-e', str(hi + 1)]
+
+  if engine == 'C_SIEVE':
+    return [cProgram, '-m', 'sieve', '-b', '-s', str(lo), '-e', str(hi + 1)]
+
+  return [sys.executable, os.path.abspath(__file__), \
+          '--case', engine, str(lo), str(hi)]
+
+  # end function caseCommand() ////////////////////////////////////////////////
+
+#----------------------
+# function loadPtrace()
+#----------------------
+
+def loadPtrace():
+  '''Returns ptrace() from the C library, or None where it is not found'''
+
+  global ptrace, ptraceLoaded
+
+  if ptraceLoaded:
+    return ptrace
+  ptraceLoaded = True
+
+  if not sys.platform.startswith('linux'):
+    return None
+
+  # ctypes is imported here, not by the "--case" children being measured
+
+  import ctypes
+
+  try:
+    ptrace = ctypes.CDLL(None, use_errno=True).ptrace
+  except (OSError, AttributeError):
+    return None
+  ptrace.restype  = ctypes.c_long
+  ptrace.argtypes = [ctypes.c_long, ctypes.c_long, \
+                     ctypes.c_void_p, ctypes.c_void_p]
+
+  return ptrace
+
+  # end function loadPtrace() /////////////////////////////////////////////////
+
+#-------------------
+# function traceMe()
+#-------------------
+
+def traceMe():
+  '''Asks (in a forked child, before its exec) to be traced by its parent'''
+
+  # subprocess.Popen() raises SubprocessError in the parent on failure
+
+  if ptrace(PTRACE_TRACEME, 0, None, None) != 0:
+    raise OSError('ptrace(PTRACE_TRACEME) failed')
+
+  # end function traceMe() ////////////////////////////////////////////////////
+
+#----------------------
+# function readOutput()
+#----------------------
+
+def readOutput( stdout, output ):
+  '''Reads stdout to its end; counts it into output (see measure())'''
+
+  while True:
+    data = os.read(stdout.fileno(), 2**16)
+    if not data:
+      break
+    output[0] += data.count(b']')
+    output[1] += len(data)
+    output[2]  = (output[2] + data)[-256:]
+
+  # end function readOutput() /////////////////////////////////////////////////
+
+#---------------------
+# function waitChild()
+#---------------------
+
+def waitChild( pid, traced ):
+  '''Waits for child pid to exit; returns (exit status, usage, VmHWM)'''
+
+  # A traced child stops with SIGTRAP after its exec, where it is told
+  # to stop again as it starts to exit: its memory is still mapped then,
+  # so /proc reports its peak RSS. Other signals are passed on to it.
+
+  peak  = None
+  first = True
+
+  while True:
+    pid, exitStatus, usage = os.wait4(pid, 0)
+    if not traced or not os.WIFSTOPPED(exitStatus):
+      return exitStatus, usage, peak
+    sig = os.WSTOPSIG(exitStatus)
+    if first and sig == signal.SIGTRAP:
+      ptrace(PTRACE_SETOPTIONS, pid, None, \
+             PTRACE_O_TRACEEXIT | PTRACE_O_EXITKILL)
+      sig = 0
+    elif exitStatus >> 16 == PTRACE_EVENT_EXIT:
+      peak = readPeakRSS(pid)
+      sig  = 0
+    first = False
+    ptrace(PTRACE_CONT, pid, None, sig)
+
+  # end function waitChild() //////////////////////////////////////////////////
+
+#-----------------------
+# function readPeakRSS()
+#-----------------------
+
+def readPeakRSS( pid ):
+  '''Returns the VmHWM (peak RSS in kB) of process pid, or None'''
+
+  try:
+    with open('/proc/'+str(pid)+'/status') as f:
+      for line in f:
+        if line.startswith('VmHWM:'):
+          return int(line.split()[1])
+  except (OSError, ValueError, IndexError):
+    pass
+
+  return None
+
+  # end function readPeakRSS() ////////////////////////////////////////////////
+
+#-------------------
+# function measure()
+#-------------------
+
+def measure( cmd, timeout ):
+  '''Runs cmd; returns (status, output, wall, cpu, max RSS in kB)'''
+
+  # "output" is the number of ']' characters the command printed (one
+  # per prime for the C program), the number of bytes it printed, and
+  # its last line of output.
+
+  # The child is traced (see waitChild()) where ptrace() can be used;
+  # the tracer is the thread that forks it, so that thread waits for it
+  # while another reads its output so that it never blocks on a full
+  # pipe. The clock starts once Popen() returns, after the exec of the
+  # child: forking this script (slower with the preexec_fn that traces)
+  # is not part of the run.
+
+  traced = False
+  proc   = None
+
+  if loadPtrace() != None:
+    try:
+      proc   = subprocess.Popen(cmd, stdout=subprocess.PIPE, \
+                                stderr=subprocess.DEVNULL, preexec_fn=traceMe)
+      traced = True
+    except subprocess.SubprocessError:
+      pass
+  if proc == None:
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, \
+                            stderr=subprocess.DEVNULL)
+
+  t_start = time.perf_counter()
+  output  = [0, 0, b'']
+  reader = threading.Thread(target=readOutput, args=(proc.stdout, output))
+  reader.start()
+
+  # Kill the child at the deadline (with os.kill(): Popen.kill() would
+  # poll, and so reap, the stops of a traced child)
+
+  timedOut = threading.Event()
+  def kill():
+    timedOut.set()
+    os.kill(proc.pid, signal.SIGKILL)
+  timer = threading.Timer(timeout, kill)
+  timer.start()
+
+  exitStatus, usage, peak = waitChild(proc.pid, traced)
+  timer.cancel()
+  proc.returncode = os.waitstatus_to_exitcode(exitStatus)
+
+  reader.join()
+  proc.stdout.close()
+
+  wall = time.perf_counter() - t_start
+  cpu  = usage.ru_utime + usage.ru_stime
+
+  status = 'ok'
+  if timedOut.is_set():
+    status = 'timeout'
+  elif proc.returncode != 0:
+    status = 'exit status '+str(proc.returncode)
+
+  # Untraced, fall back on ru_maxrss (which includes the forked copy of
+  # this script, see the header)
+
+  if peak == None:
+    peak = usage.ru_maxrss
+
+  n_bracket, n_bytes, tail = output
+  lastLine = tail.rstrip().split(b'\n')[-1].decode(errors='replace')
+
+  return status, (n_bracket, n_bytes, lastLine), wall, cpu, peak
+
+  # end function measure() ////////////////////////////////////////////////////
+
+#-------------------------
+# function runBenchmarks()
+#-------------------------
+
+def runBenchmarks( engines, sizes, offsets, timeout, cProgram ):
+  '''Runs every engine over [offset, offset+size); returns the results'''
+
+  try:
+    import numpy
+    haveNumpy = True
+  except ImportError:
+    haveNumpy = False
+
+  results = []
+
+  for engine in engines:
+    for offset in offsets:
+      for size in sizes:
+
+        lo = offset
+        hi = offset + size - 1
+
+        result = { \
+          'engine'       : engine, \
+          'start'        : lo, \
+          'end'          : hi, \
+          'primes'       : None, \
+          'wall_s'       : None, \
+          'cpu_s'        : None, \
+          'max_rss_kb'   : None, \
+          'driver_rss_kb': None, \
+          'primes_per_s' : None, \
+          'status'       : 'ok' }
+
+        if engine == 'NUMPY' and not haveNumpy:
+          result['status'] = 'skipped (no NumPy)'
+        elif engine in ('C', 'C_SIEVE') and not os.access(cProgram, os.X_OK):
+          result['status'] = 'skipped (no C program)'
+        elif engine == 'CTYPES' and primeslib.loadCLibrary() == None:
+          result['status'] = 'skipped (no C library)'
+
+        if result['status'] == 'ok':
+          status, output, wall, cpu, rss = \
+            measure(caseCommand(engine, lo, hi, cProgram), timeout)
+          result['status']     = status
+          result['wall_s']     = wall
+          result['cpu_s']      = cpu
+          result['max_rss_kb'] = rss
+          result['driver_rss_kb'] = \
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+          if status == 'ok':
+            if engine == 'C':
+              # The C program (like DEFAULT) prints 1 and not 2
+              n_primes  = output[0]
+              n_primes += (lo <= 2 <= hi) - (lo <= 1 <= hi)
+            elif engine == 'C_SIEVE':
+              # 8 bytes per prime
+              n_primes = output[1]//8
+            else:
+              n_primes = int(output[2])
+            result['primes']       = n_primes
+            result['primes_per_s'] = n_primes / wall if wall > 0 else None
+
+        results.append(result)
+        printResults([result], header=(len(results) == 1))
+
+  return results
+
+  # end function runBenchmarks() //////////////////////////////////////////////
+
+#------------------------
+# function printResults()
+#------------------------
+
+def printResults( results, header=True ):
+  '''Prints benchmark results as a table'''
+
+  if header:
+    print('%-13s %15s %10s %9s %10s %10s %10s %10s %12s  %s' % ( \
+      'engine', 'start', 'size', 'primes', 'wall_s', 'cpu_s', \
+      'rss_kb', 'driver_kb', 'primes/s', 'status'))
+
+  for r in results:
+    def fmt(v, f):
+      return f % v if v != None else '-'
+    print('%-13s %15d %10d %9s %10s %10s %10s %10s %12s  %s' % ( \
+      r['engine'], r['start'], r['end'] - r['start'] + 1, \
+      fmt(r['primes'], '%d'), fmt(r['wall_s'], '%.3f'), \
+      fmt(r['cpu_s'], '%.3f'), fmt(r['max_rss_kb'], '%d'), \
+      fmt(r['driver_rss_kb'], '%d'), fmt(r['primes_per_s'], '%.0f'), \
+      r['status']))
+  sys.stdout.flush()
+
+  # end function printResults() ///////////////////////////////////////////////
+
+#----------------------
+# function runStartup()
+#----------------------
+
+def runStartup( runs, primesScript, timeout ):
+  '''Times "runs" start ups of Python, primeslib and the primes command'''
+
+  # The primes command searches a tiny range, so its time is nearly all
+  # start up: interpreter, imports, argument parsing and version lookup
+
+  commands = [ \
+    ('python', [sys.executable, '-c', 'pass']), \
+    ('import primeslib', [sys.executable, '-c', \
+      'import sys; sys.path.insert(0, '+repr(thisScriptDir)+'); '+\
+      'import primeslib']), \
+    ('small primes table', [sys.executable, '-c', \
+      'import sys; sys.path.insert(0, '+repr(thisScriptDir)+'); '+\
+      'import primeslib; primeslib.loadSmallPrimes()']), \
+    ('primes -s 0 -e 100', [sys.executable, primesScript, \
+      '-s', '0', '-e', '100'])]
+
+  results = []
+
+  for name, cmd in commands:
+    walls  = []
+    status = 'ok'
+    for i in range(runs):
+      status, output, wall, cpu, rss = measure(cmd, timeout)
+      if status != 'ok':
+        break
+      walls.append(wall*1000)
+    walls.sort()
+    results.append({ \
+      'command'   : name, \
+      'runs'      : len(walls), \
+      'median_ms' : walls[len(walls)//2] if walls else None, \
+      'min_ms'    : walls[0] if walls else None, \
+      'status'    : status })
+
+  return results
+
+  # end function runStartup() /////////////////////////////////////////////////
+
+#------------------------
+# function printStartup()
+#------------------------
+
+def printStartup( results ):
+  '''Prints start up benchmark results as a table'''
+
+  print('%-20s %6s %10s %10s  %s' % ( \
+    'command', 'runs', 'median_ms', 'min_ms', 'status'))
+
+  for r in results:
+    def fmt(v, f):
+      return f % v if v != None else '-'
+    print('%-20s %6d %10s %10s  %s' % ( \
+      r['command'], r['runs'], fmt(r['median_ms'], '%.1f'), \
+      fmt(r['min_ms'], '%.1f'), r['status']))
+  sys.stdout.flush()
+
+  # end function printStartup() ///////////////////////////////////////////////
+
+
+#--------------------------------------------------------
+# Prevent interactive use from exiting Python interpreter
+#--------------------------------------------------------
+
+if __name__ == '__main__':
+  sys.exit(main())
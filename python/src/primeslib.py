@@ -32,6 +32,170 @@
 #   def address(self, value):
 #
 # def createRunParameters( args ):
+# def readConfFile( confFile ):
+#
+# def wheelTables( modulus ):
+# def sieveBasePrimes( limit ):
+# def oddSieve( limit ):
+# def wheel30Primes( bitmap, base ):
+#
+# class Wheel30Sieve(object):
+#   def __init__(self, lo, hi, basePrimes=None):
+#   def sieve(self, basePrimes):
+#   def clip(self):
+#   def count(self):
+#   def primes(self):
+#
+# def wheel30Segments( lo, hi, segmentSize=None, basePrimes=None ):
+# def sieveCount( lo, hi ):
+#
+# def loadSmallPrimes():
+# def sieveSmallPrimes():
+# def smallPrimes( lo, hi ):
+# def isSmallPrime( n ):
+# def writeSmallPrimesModule( filename ):
+#
+# def segmentedSieve( lo, hi, segmentSize=None, basePrimes=None ):
+# def unboundedSieve( lo, segmentSize=None ):
+#
+# class PrimeCache(object):
+#   def __init__(self, maxPrimes=None):
+#   def full(self):
+#   def extend(self, n):
+#   def discovered(self, x, isPrime):
+#
+# def numpySieve( lo, hi, segmentSize=None, basePrimes=None ):
+#
+# def initSieveWorker( basePrimes ):
+# def sieveChunk( lo, hi ):
+# def parallelSieve( lo, hi, workers=None, chunkSize=None ):
+#
+# def loadCLibrary():
+# def fill_primes( lo, hi, buf ):
+# def count_primes_c( lo, hi, threads=None ):
+# def cSieve( lo, hi, chunkSize=None ):
+#
+# def isStrongProbablePrime( n, a ):
+# def jacobi( a, n ):
+# def isStrongLucasProbablePrime( n ):
+# def is_prime( n ):
+# def next_prime( n ):
+# def prev_prime( n ):
+# def millerRabinPrimes( lo, hi, chunkSize=None ):
+# def useMillerRabin( lo, hi, cSieve=False ):
+#
+# def loadPiTable():
+# def writePiTableModule( filename ):
+# def prime_pi( x ):
+# def primePiNumpy( x, numpy ):
+# def count_primes( a, b, threads=None ):
+# def nth_prime( k ):
+# def nthPrimeIn( lo, hi, k ):
+#
+# def factorTrialPrimes():
+# def pollardRhoBrent( n ):
+# def perfectPower( n ):
+# def factorize( n ):
+# def factorize_many( numbers ):
+# def spfSieve( limit ):
+# def spfFactorize( n, spf ):
+# def factorRange( lo, hi, segmentSize=None ):
+# def formatFactors( n, factors ):
+#
+# class GapStats(object):
+#   def __init__(self, primes=None):
+#   def analyze(self, primes):
+#   def add(self, primes):
+#   def merge(self, other):
+#   def maxGap(self):
+#   def tupleTotals(self):
+#
+# def gapStatsChunk( lo, hi ):
+# def parallelGapStats( lo, hi, workers=None, chunkSize=None ):
+#
+# def parseQuery( line, lineNum ):
+# def answerQuery( op, args ):
+# def queryError( e ):
+# def coalesceRanges( ranges ):
+# def answerSpan( chunks, group ):
+# def batchQueries( inFile ):
+#
+# class PrimesWriter(object):
+#   def __init__(self, outFile=None, annotate=True, batchSize=None):
+#   def write(self, x, i_div=None):
+#   def writeChunk(self, primes):
+#   def writeBuffer(self):
+#   def flush(self):
+#
+# class Checkpoint(object):
+#   def __init__(self, filename, interval=None):
+#   def due(self):
+#   def load(self):
+#   def save(self, state):
+#
+# class Metrics(object):
+#   def __init__(self):
+#   def start(self):
+#   def stop(self, phase, t_ns):
+#   def elapsed(self):
+#   def snapshot(self, x=None):
+#
+# class ProgressReporter(object):
+#   def __init__(self, outFile=None):
+#   def __call__(self, event, metrics, x):
+#
+# class PrimesGenerator(object):
+#   def __init__(self, runParams=None):
+#   def run_params(self):
+#   def run_params(self, value):
+#   def runMode(self):
+#   def iterTrialDivision(self, i_start, i_end):
+#   def iterWheelTrialDivision(self, i_start, i_end, modulus):
+#   def iterPrimeTrialDivision(self, i_start, i_end):
+#   def iter_prime_chunks(self, start, end, chunkSize=None):
+#   def iterEngineChunks(self, start, end, chunkSize=None):
+#   def iterSieveChunks(self, start, end):
+#   def iter_primes(self, start, end):
+#   def iter_primes_unbounded(self, start):
+#   def printPrimes(self):
+#   def outputWriter(self):
+#   def startProgress(self):
+#   def reportProgress(self, event, x):
+#   def periodicTasks(self, writer, x):
+#   def startCheckpointing(self, i_start, i_end):
+#   def saveCheckpoint(self, writer, x):
+#   def printPrimesSieve(self, i_start, i_end):
+#   def printPrimeCount(self, i_start, i_end):
+#   def printFactors(self, i_start, i_end):
+#   def printPrimeGaps(self, i_start, i_end):
+#   def answerQueries(self):
+#   def printNthPrime(self, k):
+#   def writePrimeTable(self, i_start, i_end):
+#
+# def writePrimeTable( outFile, lo, hi, primeChunks, blockBytes=None ):
+# def writeSievedTable( outFile, lo, hi, blockBytes, nblocks ):
+#
+# class PrimeTable(object):
+#   def __init__(self, filename):
+#   def close(self):
+#   def bitPosition(self, n):
+#   def contains(self, n):
+#   def primes_in(self, a, b):
+#   def pi(self, n):
+#
+# class RangeCache(object):
+#   def __init__(self, directory, maxBytes=None, memoryBlocks=None, \
+#                span=None):
+#   def blockPath(self, b):
+#   def get(self, b):
+#   def has(self, b):
+#   def remember(self, b, bitmap):
+#   def put(self, b, bitmap):
+#   def evict(self):
+#   def decode(self, b, bitmap, lo, hi):
+#   def primeChunks(self, lo, hi, engine):
+#   def computeBlocks(self, b_first, b_last, lo, hi, engine):
+#   def finishBlock(self, b, bitmap, lo, hi):
 #
 # class IntelHex80(object):
 #   def __init__(self, runParams):
@@ -63,12 +227,23 @@
 #------------------------------------------------------------------------------
 
 #--- Python imports
+#
+# Modules that only some run modes need (json, mmap, numpy, ctypes,
+# concurrent.futures) are imported where they are used, so that they
+# do not slow down the start of every run.
 
 import sys
 import os
-import argparse
 import datetime
 import math
+import operator
+import struct
+import time
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque, OrderedDict
+from itertools import accumulate, compress, islice
 
 #--- Project imports
 
@@ -95,31 +270,149 @@ p_out = p_stdout
 p_err = p_stderr
 p_dbg = p_stderr
 
-# Print function used to time things. Calls "p_dbg" to actually print
-# things out.
+#--- Global variables
 
-t_0    = datetime.datetime.now()
-t_last = t_0
+validRunModes      = [ \
+  'DEFAULT', 'SPECIAL', 'SIEVE', 'PARALLEL', 'NUMPY', 'MILLER_RABIN', \
+  'COUNT', 'TRIAL_PRIMES', 'FACTOR', 'CTYPES', 'GAPS', 'TUPLES']
 
-def ptime(s):
+# Maximum number of primes held by the prime divisor cache (8 bytes
+# each); 2**21 primes cover all divisors up to about 3.4e7, i.e. trial
+# division of candidates up to about 1e15.
 
-  global p_dbg, t_0, t_last
+primeCacheMaxPrimes = 2**21
+primeCache          = None
 
-  t_now         = datetime.datetime.now()
-  t_since_start = t_now - t_0
-  t_since_last  = t_now - t_last
-  t_last        = t_now
+# "-W|--wheel": moduli of the wheels available to trial division
 
-  p_dbg(\
-    str(t_since_start)+' # '+\
-    str(t_since_last)+' # '+\
-    s)
+validWheels        = [2, 30, 210]
 
-#--- Global variables
+# Run modes that use the segmented sieve (the unbounded sieve when there
+# is no end_search)
 
-validRunModes      = ['DEFAULT', 'SPECIAL']
+sieveRunModes      = ['SIEVE', 'PARALLEL', 'NUMPY', 'CTYPES']
 thisProgramVersion = ''
 
+# Number of odd integers held in one segment of the NumPy sieve (one
+# byte each), chosen so that a segment stays resident in L2 cache.
+
+sieveSegmentSize   = 2**18
+
+# Number of bitmap bytes in one segment of the wheel-30 sieve (30
+# integers each, see class Wheel30Sieve), also sized for L2 cache.
+
+wheelSegmentBytes  = 2**17
+
+# Beyond (unboundedSegmentRatio*wheelSegmentBytes)**2 the segments of the
+# unbounded sieve hold sqrt(x)/unboundedSegmentRatio bytes, but never
+# more than unboundedMaxSegment bytes (see unboundedSieve()).
+
+unboundedSegmentRatio = 2
+unboundedMaxSegment   = 2**20
+
+# Number of integers in each chunk of work handed to a worker process
+# in "PARALLEL" run mode.
+
+parallelChunkSize  = 2**24
+
+# Maximum number of primes per list yielded by the C sieve library in
+# "CTYPES" run mode (the size of the buffer it fills).
+
+cSieveChunkSize    = 2**16
+
+# Ranges above millerRabinThreshold that are narrower than sqrt(end) are
+# searched by testing each candidate with Miller-Rabin instead of by
+# trial division or sieving (see useMillerRabin()). Where the C sieve
+# is the alternative, only while (integers) x (bit length) is below
+# sqrt(end)/64 and millerRabinMaxCost (about 2 s of Miller-Rabin).
+
+millerRabinThreshold = 2**32
+millerRabinMaxCost   = 2**24
+
+# nth_prime(k) sieves directly (rather than counting with prime_pi())
+# when the k-th prime is known to be below nthPrimeSieveLimit.
+
+nthPrimeSieveLimit   = 2**20
+
+# count_primes(a, b) sieves ranges narrower than countSieveSpan (with
+# the C library if it is there) and otherwise uses prime_pi()
+
+countSieveSpan       = 2**32
+
+# prime_pi(x) and nth_prime(k) start from the nearest multiple of
+# piTableBlock below piTableLimit, whose prime count is looked up in
+# the prime counting table (see loadPiTable()), loaded on first use.
+# nth_prime() counts primes piTableWindow integers at a time.
+
+piTableBlock         = 2**26
+piTableLimit         = 2**38
+piTable              = None
+piTableLoaded        = False
+piTableWindow        = 2**22
+
+# Primes below smallPrimesLimit are looked up in the small primes table
+# (a wheel-30 bitmap, see loadSmallPrimes()), loaded on first use.
+
+smallPrimesLimit     = 2**20
+smallPrimesBitmap    = None
+
+# factorize() divides by the primes below factorTrialLimit before
+# turning to Pollard-Rho. factorize_many() and factorRange() look up
+# numbers up to factorSpfLimit in a smallest prime factor table (4 bytes
+# per number, at least factorSpfMinTable long), factorBatchSize numbers
+# at a time.
+
+factorTrialLimit     = 2**10
+factorSmallPrimes    = None
+factorSpfLimit       = 2**22
+factorSpfMinTable    = 2**16
+factorBatchSize      = 4096
+spfTable             = None
+
+# Maximum number of primes per list yielded by the trial division
+# engine through PrimesGenerator.iter_prime_chunks().
+
+primesChunkSize    = 4096
+
+# Output is formatted outputBatchSize primes at a time and written
+# through a buffer of outputBufferSize bytes (see class PrimesWriter).
+
+outputBatchSize    = 8192
+outputBufferSize   = 2**20
+
+# "-C|--checkpoint": default number of seconds between checkpoints, and
+# number of primes found by trial division between checks of the clock
+# (for checkpoints and progress reports)
+
+checkpointInterval = 60.0
+checkpointCheckEvery = 1024
+
+# "-f|--output_format": TEXT is one prime per line, TABLE is the binary
+# prime table file format read by class PrimeTable.
+
+validOutputFormats = ['TEXT', 'TABLE']
+
+# "-p|--progress": default number of seconds between progress reports
+
+progressInterval   = 10.0
+
+# Config file read when there is no "-c|--config" (installed next to
+# this file), and the names it may set
+
+defaultConfPath    = \
+  os.path.join(os.path.dirname(os.path.abspath(__file__)), 'primes.conf')
+
+validConfNames     = [ \
+  'run_mode', 'cache_dir', 'cache_max_bytes', 'cache_memory_blocks']
+
+# Range cache (see class RangeCache): integers per cached block (a
+# multiple of 30, giving 2**15 bitmap bytes), default limit on the size
+# of the cache directory and default number of blocks held in memory
+
+cacheBlockSpan     = 30*2**15
+cacheMaxBytes      = 2**28
+cacheMemoryBlocks  = 64
+
 
 #------------------------------------------------------------------------------
 # class RunParameters
@@ -146,6 +439,20 @@ class RunParameters(object):
     self.__output_filename = None
     self.__output_file     = None
     self.__run_mode        = None
+    self.__workers         = None
+    self.__wheel           = 2
+    self.__nth_prime       = None
+    self.__checkpoint_filename = None
+    self.__checkpoint_interval = None
+    self.__resume          = False
+    self.__progress_interval = None
+    self.__progress_filename = None
+    self.__progress_file     = None
+    self.__cache_dir           = None
+    self.__cache_max_bytes     = None
+    self.__cache_memory_blocks = None
+    self.__output_format   = 'TEXT'
+    self.__annotate        = True
     self.__diag_print      = None
 
     #==========================
@@ -190,7 +497,13 @@ class RunParameters(object):
 
   @end_search.setter
   def end_search(self, value):
-    self.__end_search = int(value)
+
+    # None means "search forever"
+
+    if value == None:
+      self.__end_search = None
+    else:
+      self.__end_search = int(value)
     # end RunParameters::end_search.setter //////////////////////////////////
 
   #--- args (object)
@@ -277,11 +590,14 @@ class RunParameters(object):
       self.__input_file     = None
       raise ArgumentError('pyapplib.py - ', self.errList)
 
-    # Try to open the input file
+    # Try to open the input file ("-" is STDIN)
 
     try:
       self.__input_filename = value
-      self.input_file = open(value,'r')
+      if value == '-':
+        self.input_file = sys.stdin
+      else:
+        self.input_file = open(value,'r')
     except IOError as e:
       self.errors += 1
       errMsg = \
@@ -329,9 +645,18 @@ class RunParameters(object):
 
     # Try to open the output file
 
+    # A prime table is a binary file
+
+    if self.output_format == 'TABLE':
+      openMode = 'wb'
+    elif self.resume:
+      openMode = 'a'
+    else:
+      openMode = 'w'
+
     try:
       self.__output_filename = value
-      self.output_file = open(value,'w')
+      self.output_file = open(value,openMode,buffering=outputBufferSize)
     except IOError as e:
       self.errors += 1
       errMsg = \
@@ -398,6 +723,396 @@ class RunParameters(object):
     # end RunParameters::run_mode.setter //////////////////////////////////////
 
 
+  #--- workers (integer)
+  #
+  # Number of worker processes in "PARALLEL" run mode; None means one
+  # per CPU.
+
+  @property
+  def workers(self):
+    return self.__workers
+
+  @workers.setter
+  def workers(self, value):
+
+    if value == None:
+      self.__workers = None
+      return
+
+    # "-w|--workers" must be a positive integer
+    try:
+      workers = int(value)
+    except ValueError:
+      workers = 0
+
+    if workers < 1:
+      self.errors += 1
+      errMsg  = 'Invalid number of workers "'+str(value)+'" : '
+      errMsg += 'must be a positive integer'
+      errInfo = ['workers.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__workers = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__workers = workers
+
+    # end RunParameters::workers.setter ///////////////////////////////////////
+
+  #--- wheel (integer)
+  #
+  # Wheel modulus used by trial division: 2 (odd numbers only, the
+  # original algorithm), 30 or 210
+
+  @property
+  def wheel(self):
+    return self.__wheel
+
+  @wheel.setter
+  def wheel(self, value):
+
+    global validWheels
+
+    if value == None:
+      self.__wheel = 2
+      return
+
+    # "-W|--wheel" must be one of the valid wheel moduli
+    try:
+      wheel = int(value)
+    except ValueError:
+      wheel = None
+
+    if not wheel in validWheels:
+      self.errors += 1
+      errMsg = \
+        'Unknown wheel "'+str(value)+'" : valid wheels are :'+\
+        str(validWheels)
+      errInfo = ['wheel.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__wheel = 2
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__wheel = wheel
+
+    # end RunParameters::wheel.setter /////////////////////////////////////////
+
+  #--- nth_prime (integer)
+  #
+  # If set, print only the nth_prime-th prime
+
+  @property
+  def nth_prime(self):
+    return self.__nth_prime
+
+  @nth_prime.setter
+  def nth_prime(self, value):
+
+    if value == None:
+      self.__nth_prime = None
+      return
+
+    # "-k|--nth_prime" must be a positive integer
+    try:
+      k = int(value)
+    except ValueError:
+      k = 0
+
+    if k < 1:
+      self.errors += 1
+      errMsg  = 'Invalid prime number index "'+str(value)+'" : '
+      errMsg += 'must be a positive integer'
+      errInfo = ['nth_prime.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__nth_prime = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__nth_prime = k
+
+    # end RunParameters::nth_prime.setter /////////////////////////////////////
+
+  #--- checkpoint_filename (string)
+
+  @property
+  def checkpoint_filename(self):
+    return self.__checkpoint_filename
+
+  @checkpoint_filename.setter
+  def checkpoint_filename(self, value):
+
+    # "-C|--checkpoint" must be a string
+    if value != None and not isinstance(value,str):
+      self.errors += 1
+      errMsg = 'Invalid checkpoint file name "'+str(value)+\
+               '" : must be of type "str"'
+      errInfo = ['checkpoint_filename.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__checkpoint_filename = None
+      raise ArgumentError('pyapplib.py - ', self.errList)
+
+    self.__checkpoint_filename = value
+
+    # end RunParameters::checkpoint_filename.setter ///////////////////////////
+
+  #--- checkpoint_interval (float, seconds)
+
+  @property
+  def checkpoint_interval(self):
+    return self.__checkpoint_interval
+
+  @checkpoint_interval.setter
+  def checkpoint_interval(self, value):
+
+    if value == None:
+      self.__checkpoint_interval = None
+      return
+
+    # "-T|--checkpoint_interval" must be a positive number
+    try:
+      interval = float(value)
+    except ValueError:
+      interval = 0.0
+
+    if not interval > 0.0:
+      self.errors += 1
+      errMsg  = 'Invalid checkpoint interval "'+str(value)+'" : '
+      errMsg += 'must be a positive number of seconds'
+      errInfo = ['checkpoint_interval.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__checkpoint_interval = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__checkpoint_interval = interval
+
+    # end RunParameters::checkpoint_interval.setter ///////////////////////////
+
+  #--- resume (boolean)
+  #
+  # Restart the search from its checkpoint file; the output file is then
+  # opened for appending rather than rewritten
+
+  @property
+  def resume(self):
+    return self.__resume
+
+  @resume.setter
+  def resume(self, value):
+    self.__resume = bool(value)
+    # end RunParameters::resume.setter ////////////////////////////////////////
+
+  #--- progress_interval (float, seconds)
+  #
+  # Seconds between progress reports; None if there are none
+
+  @property
+  def progress_interval(self):
+    return self.__progress_interval
+
+  @progress_interval.setter
+  def progress_interval(self, value):
+
+    if value == None:
+      self.__progress_interval = None
+      return
+
+    # "-p|--progress" must be a positive number
+    try:
+      interval = float(value)
+    except ValueError:
+      interval = 0.0
+
+    if not interval > 0.0:
+      self.errors += 1
+      errMsg  = 'Invalid progress interval "'+str(value)+'" : '
+      errMsg += 'must be a positive number of seconds'
+      errInfo = ['progress_interval.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__progress_interval = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__progress_interval = interval
+
+    # end RunParameters::progress_interval.setter /////////////////////////////
+
+  #--- progress_filename (string)
+  #
+  # Progress reports go to this file as JSON lines (to STDERR as text
+  # when there is no progress file)
+
+  @property
+  def progress_filename(self):
+    return self.__progress_filename
+
+  @progress_filename.setter
+  def progress_filename(self, value):
+
+    if value == None:
+      self.__progress_filename = None
+      self.__progress_file     = None
+      return
+
+    # "-P|--progress_filename" must be a string
+    if not isinstance(value,str):
+      self.errors += 1
+      errMsg = 'Invalid progress file name "'+str(value)+\
+               '" : must be of type "str"'
+      errInfo = ['progress_filename.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__progress_filename = None
+      raise ArgumentError('pyapplib.py - ', self.errList)
+
+    # A resumed search adds to the reports of the earlier run(s)
+
+    if self.resume:
+      openMode = 'a'
+    else:
+      openMode = 'w'
+
+    try:
+      self.__progress_filename = value
+      self.__progress_file     = open(value, openMode)
+    except IOError as e:
+      self.errors += 1
+      errMsg = \
+        'Error opening progress file "'+str(value)+'"\n'+\
+        '  IOError message = "'+str(e)+'"'
+      errInfo = ['progress_filename.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__progress_file = None
+      raise ArgumentError('pyapplib.py - ', self.errList)
+
+    # end RunParameters::progress_filename.setter /////////////////////////////
+
+  #--- progress_file (file handle)
+
+  @property
+  def progress_file(self):
+    return self.__progress_file
+
+  #--- cache_dir (string)
+  #
+  # Directory of the range cache (see class RangeCache); None if there
+  # is no cache
+
+  @property
+  def cache_dir(self):
+    return self.__cache_dir
+
+  @cache_dir.setter
+  def cache_dir(self, value):
+    if value == None or value == '':
+      self.__cache_dir = None
+    else:
+      self.__cache_dir = os.path.expanduser(value)
+    # end RunParameters::cache_dir.setter /////////////////////////////////////
+
+  #--- cache_max_bytes (integer)
+
+  @property
+  def cache_max_bytes(self):
+    return self.__cache_max_bytes
+
+  @cache_max_bytes.setter
+  def cache_max_bytes(self, value):
+
+    if value == None:
+      self.__cache_max_bytes = None
+      return
+
+    # "cache_max_bytes" must be a positive number (e.g. 2.5e8)
+    try:
+      maxBytes = int(float(value))
+    except ValueError:
+      maxBytes = 0
+
+    if maxBytes <= 0:
+      self.errors += 1
+      errMsg  = 'Invalid cache_max_bytes "'+str(value)+'" : '
+      errMsg += 'must be a positive number of bytes'
+      errInfo = ['cache_max_bytes.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__cache_max_bytes = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__cache_max_bytes = maxBytes
+
+    # end RunParameters::cache_max_bytes.setter ///////////////////////////////
+
+  #--- cache_memory_blocks (integer)
+
+  @property
+  def cache_memory_blocks(self):
+    return self.__cache_memory_blocks
+
+  @cache_memory_blocks.setter
+  def cache_memory_blocks(self, value):
+
+    if value == None:
+      self.__cache_memory_blocks = None
+      return
+
+    # "cache_memory_blocks" must be a positive integer
+    try:
+      blocks = int(value)
+    except ValueError:
+      blocks = 0
+
+    if blocks <= 0:
+      self.errors += 1
+      errMsg  = 'Invalid cache_memory_blocks "'+str(value)+'" : '
+      errMsg += 'must be a positive integer'
+      errInfo = ['cache_memory_blocks.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__cache_memory_blocks = None
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__cache_memory_blocks = blocks
+
+    # end RunParameters::cache_memory_blocks.setter ///////////////////////////
+
+  #--- output_format (string)
+
+  @property
+  def output_format(self):
+    return self.__output_format
+
+  @output_format.setter
+  def output_format(self, value):
+
+    global validOutputFormats
+
+    if value == None:
+      self.__output_format = 'TEXT'
+      return
+
+    # "-f|--output_format" must be one of the valid output formats
+    if not value in validOutputFormats:
+      self.errors += 1
+      errMsg = \
+        'Unknown output format "'+str(value)+'" : valid formats are :'+\
+        str(validOutputFormats)
+      errInfo = ['output_format.setter', errMsg]
+      self.errList.append(errInfo)
+      self.__output_format = 'TEXT'
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.__output_format = value
+
+    # end RunParameters::output_format.setter /////////////////////////////////
+
+  #--- annotate (boolean)
+  #
+  # When true each prime found by trial division is printed followed by
+  # the number of divisions it took, e.g. "101 [5]"
+
+  @property
+  def annotate(self):
+    return self.__annotate
+
+  @annotate.setter
+  def annotate(self, value):
+    self.__annotate = bool(value)
+    # end RunParameters::annotate.setter //////////////////////////////////////
+
   #--- diag_print (list of strings)
 
   @property
@@ -451,35 +1166,2319 @@ def createRunParameters( args ):
 
   rp.args = args
 
-  rp.start_search = args.start_search
-  rp.end_search   = args.end_search
-  rp.run_mode     = args.run_mode
-  rp.diag_print   = args.diag_print
+  # Settings from the config file ("-c|--config", else primes.conf if
+  # there is one); the command line overrides them
 
-  return rp
+  conf = {}
 
-  # end createRunParameters
+  if args.config != None:
+    rp.conf_path = args.config
+  elif os.path.exists(defaultConfPath):
+    rp.conf_path = defaultConfPath
 
+  if rp.conf_file != None:
+    conf = readConfFile(rp.conf_file)
+    rp.conf_file.close()
 
-#------------------------------------------------------------------------------
-# class PrimesGenerator
-#------------------------------------------------------------------------------
+  rp.cache_dir           = conf.get('cache_dir')
+  rp.cache_max_bytes     = conf.get('cache_max_bytes')
+  rp.cache_memory_blocks = conf.get('cache_memory_blocks')
 
-class PrimesGenerator(object):
-  '''Generates prime numbers between args.start_search and args.end_search'''
+  if args.input_filename != None:
+    rp.input_filename = args.input_filename
 
-  def __init__(self, runParams):
+  rp.start_search  = args.start_search
+  rp.end_search    = args.end_search
+  if args.run_mode != None:
+    rp.run_mode    = args.run_mode
+  else:
+    rp.run_mode    = conf.get('run_mode')
+  rp.workers       = args.workers
+  rp.wheel         = args.wheel
+  rp.nth_prime     = args.nth_prime
+  rp.annotate      = not args.no_annotate
+  rp.diag_print    = args.diag_print
+  rp.output_format = args.output_format
 
-    #==================================
-    # Class Properties:
-    #   - include setter, getter
-    #   - may be checked at assign time
-    #==================================
+  rp.checkpoint_filename = args.checkpoint
+  rp.checkpoint_interval = args.checkpoint_interval
+  rp.resume              = args.resume
 
-    self.__run_params   = None
+  if rp.resume and rp.checkpoint_filename == None:
+    rp.errors += 1
+    errInfo = ['createRunParameters', '-r|--resume requires -C|--checkpoint']
+    rp.errList.append(errInfo)
+    raise ArgumentError('pyapplib.py - ',rp.errList)
 
-    #==========================
-    # Class variables
+  # A prime table is written in one go, so it cannot be checkpointed
+
+  if rp.checkpoint_filename != None and rp.output_format == 'TABLE':
+    rp.errors += 1
+    errInfo = ['createRunParameters', \
+               '-C|--checkpoint cannot be used with -f|--output_format TABLE']
+    rp.errList.append(errInfo)
+    raise ArgumentError('pyapplib.py - ',rp.errList)
+
+  # A progress file alone turns progress reports on (resume decides how
+  # the progress file is opened)
+
+  rp.progress_interval = args.progress
+  rp.progress_filename = args.progress_filename
+
+  if rp.progress_filename != None and rp.progress_interval == None:
+    rp.progress_interval = progressInterval
+
+  # output_format and resume decide how the output file is opened
+
+  if args.output_filename != None:
+    rp.output_filename = args.output_filename
+
+  return rp
+
+  # end createRunParameters
+
+
+#------------------------------------------------------------------------------
+# readConfFile()
+#
+# Reads a config file ("-c|--config", or primes.conf) of "name = value"
+# lines; blank lines and lines starting with "#" are ignored. Returns a
+# dictionary of the values (as strings).
+#------------------------------------------------------------------------------
+
+def readConfFile( confFile ):
+  '''Returns the settings in config file confFile'''
+
+  global validConfNames
+
+  conf = {}
+
+  for lineNum, line in enumerate(confFile, 1):
+    line = line.strip()
+    if line == '' or line.startswith('#'):
+      continue
+    name, sep, value = line.partition('=')
+    name  = name.strip()
+    value = value.strip()
+    if sep == '' or not name in validConfNames:
+      errMsg  = 'Config file "'+str(confFile.name)+'" line '+str(lineNum)
+      errMsg += ' : "'+line+'" is not "name = value" with name one of '
+      errMsg += str(validConfNames)
+      errInfo = ['readConfFile', errMsg]
+      raise ArgumentError('primeslib.py - ',[errInfo])
+    conf[name] = value
+
+  return conf
+
+  # end readConfFile()
+
+
+#------------------------------------------------------------------------------
+# wheelTables()
+#
+# Returns the residues mod "modulus" that are prime to it (in increasing
+# order, starting with 1) and the gaps between consecutive residues;
+# gaps[i] steps from residues[i] to the next one, wrapping around.
+#------------------------------------------------------------------------------
+
+def wheelTables( modulus ):
+  '''Returns (residues, gaps) of the wheel with the given modulus'''
+
+  residues = [r for r in range(modulus) if math.gcd(r, modulus) == 1]
+  gaps     = [b - a for a, b in zip(residues, residues[1:])]
+  gaps.append(modulus + residues[0] - residues[-1])
+
+  return residues, gaps
+
+  # end wheelTables()
+
+
+#------------------------------------------------------------------------------
+# sieveBasePrimes()
+#
+# Returns the list of all primes <= limit. Used to compute the "base"
+# primes (those <= sqrt(end)) that drive the segmented sieve. Primes
+# below smallPrimesLimit are read from the small primes table (see
+# smallPrimes()); larger limits run oddSieve(), a plain (unsegmented)
+# odd-only Sieve of Eratosthenes.
+#------------------------------------------------------------------------------
+
+def sieveBasePrimes( limit ):
+  '''Returns list of primes <= limit'''
+
+  global smallPrimesLimit
+
+  if limit < smallPrimesLimit:
+    return smallPrimes(2, limit)
+
+  return oddSieve(limit)
+
+  # end sieveBasePrimes()
+
+def oddSieve( limit ):
+  '''Returns list of primes <= limit (plain odd-only sieve)'''
+
+  if limit < 2:
+    return []
+  if limit < 3:
+    return [2]
+
+  # sieve[i] represents the odd number 2*i+1
+
+  n     = limit//2 + (limit % 2)
+  sieve = bytearray([1]) * n
+  sieve[0] = 0
+
+  for i in range(1, (math.isqrt(limit) - 1)//2 + 1):
+    if sieve[i]:
+      p     = 2*i + 1
+      start = p*p//2
+      sieve[start::p] = bytes(len(range(start, n, p)))
+
+  return [2] + list(compress(range(1, 2*n, 2), sieve))
+
+  # end oddSieve()
+
+
+#------------------------------------------------------------------------------
+# Wheel-30 bitmaps
+#
+# A wheel-30 bitmap holds one byte per 30 consecutive integers, starting
+# at a multiple of 30 ("base"), and one bit for each of the 8 residues
+# mod 30 that are prime to 30: byte i, bit j represents
+# base + 30*i + wheel30Residues[j]. This is the layout of the prime
+# table file, of the range cache blocks and of class Wheel30Sieve.
+#------------------------------------------------------------------------------
+
+wheel30Residues   = (1, 7, 11, 13, 17, 19, 23, 29)
+
+# wheel30Bit[r] = bit number for residue r mod 30 (None if not prime to 30)
+
+wheel30Bit        = [None]*30
+for j, r in enumerate(wheel30Residues):
+  wheel30Bit[r] = j
+
+# wheel30Offsets[b] = residues represented by the set bits of byte b
+
+wheel30Offsets    = [ \
+  tuple(r for j, r in enumerate(wheel30Residues) if b & (1 << j)) \
+  for b in range(256)]
+
+# wheel30Planes[j] maps a bitmap byte to its bit j, and wheel30Clear[j]
+# maps it to itself with bit j cleared (both for bytes.translate())
+
+wheel30Planes     = [bytes((b >> j) & 1 for b in range(256)) for j in range(8)]
+wheel30Clear      = [bytes(b & ~(1 << j) for b in range(256)) for j in range(8)]
+
+def wheel30Primes( bitmap, base ):
+  '''Returns, in increasing order, the integers whose bits are set'''
+
+  # Each of the 8 bit planes selects, with compress(), the integers
+  # with one residue mod 30; the 8 runs are then merged by sort().
+
+  end    = base + 30*len(bitmap)
+  primes = []
+  for j, r in enumerate(wheel30Residues):
+    primes.extend(compress(range(base + r, end, 30), \
+                           bitmap.translate(wheel30Planes[j])))
+  primes.sort()
+
+  return primes
+
+  # end wheel30Primes()
+
+
+#------------------------------------------------------------------------------
+# class Wheel30Sieve
+#
+# Sieve of Eratosthenes of [lo, hi] held as a wheel-30 bitmap, so that
+# only the integers prime to 30 are represented, 8 bits per 30 integers
+# (about 33 MB for a range of 10**9, against 500 MB for one byte per odd
+# integer). The multiples of a base prime p with one residue mod 30 all
+# share a bit and lie p bytes apart, so each base prime is crossed off
+# with 8 extended slices of the bitmap, every slice rewritten through a
+# bytes.translate() table that clears that bit. count() is a popcount
+# of the whole bitmap; primes() decodes it with wheel30Primes(). Bits of
+# integers outside [lo, hi] are cleared, as is the bit of 1; 2, 3 and 5
+# are not in the bitmap and are added by count() and primes().
+#------------------------------------------------------------------------------
+
+class Wheel30Sieve(object):
+  '''Bit-packed (wheel-30) sieve of the integers in [lo, hi]'''
+
+  def __init__(self, lo, hi, basePrimes=None):
+
+    lo = max(lo, 0)
+
+    self.lo     = lo
+    self.hi     = hi
+    self.base   = 30*(lo//30)
+    self.bits   = bytearray(b'\xff')*max(hi//30 - lo//30 + 1, 0)
+    self.small  = [p for p in (2, 3, 5) if lo <= p <= hi]
+
+    if self.bits:
+      if basePrimes == None:
+        basePrimes = sieveBasePrimes(math.isqrt(hi))
+      self.sieve(basePrimes)
+      self.clip()
+
+  #--- Cross off the multiples of the base primes (7 <= p <= sqrt(top))
+
+  def sieve(self, basePrimes):
+
+    bits = self.bits
+    base = self.base
+    n    = len(bits)
+    top  = base + 30*n - 1
+
+    for p in basePrimes:
+      if p < 7:
+        continue
+      if p*p > top:
+        break
+
+      # Multiples p*m with m >= p (smaller ones have a smaller factor)
+      # and p*m >= base, one run for each residue of m mod 30
+
+      m0 = max(p, -(-base//p))
+      for r in wheel30Residues:
+        i, v = divmod(p*(m0 + (r - m0) % 30) - base, 30)
+        if i < n:
+          bits[i::p] = bits[i::p].translate(wheel30Clear[wheel30Bit[v]])
+
+  #--- Clear the bits of 1 and of the integers outside [lo, hi]
+
+  def clip(self):
+
+    bits  = self.bits
+    first = self.base
+    last  = self.base + 30*(len(bits) - 1)
+
+    for j, r in enumerate(wheel30Residues):
+      if first + r < self.lo or first + r == 1:
+        bits[0] &= ~(1 << j)
+      if last + r > self.hi:
+        bits[-1] &= ~(1 << j)
+
+  def count(self):
+    '''Returns the number of primes in [lo, hi]'''
+    return len(self.small) + \
+           int.from_bytes(self.bits, 'little').bit_count()
+
+  def primes(self):
+    '''Returns the list of primes in [lo, hi]'''
+    return self.small + wheel30Primes(self.bits, self.base)
+
+  # end class Wheel30Sieve ////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# wheel30Segments()
+#
+# Generator that sieves [lo, hi] one segment of segmentSize bitmap bytes
+# (30*segmentSize integers) at a time, and yields a Wheel30Sieve for
+# every segment. Every segment but the first starts at a multiple of 30,
+# so the bitmaps of the segments, one after the other, make up the
+# bitmap of [lo, hi]. basePrimes, if given, must include every prime
+# <= sqrt(hi).
+#------------------------------------------------------------------------------
+
+def wheel30Segments( lo, hi, segmentSize=None, basePrimes=None ):
+  '''Yields a Wheel30Sieve for each segment of [lo, hi]'''
+
+  global wheelSegmentBytes
+
+  if segmentSize == None:
+    segmentSize = wheelSegmentBytes
+
+  lo = max(lo, 0)
+  if hi < lo:
+    return
+
+  if basePrimes == None:
+    basePrimes = sieveBasePrimes(math.isqrt(hi))
+
+  seg_lo = lo
+  while seg_lo <= hi:
+    seg_hi = min(30*(seg_lo//30 + segmentSize) - 1, hi)
+    yield Wheel30Sieve(seg_lo, seg_hi, basePrimes)
+    seg_lo = seg_hi + 1
+
+  # end wheel30Segments()
+
+def sieveCount( lo, hi ):
+  '''Returns the number of primes in [lo, hi], by popcount of the sieve'''
+  return sum(sieve.count() for sieve in wheel30Segments(lo, hi))
+
+
+#------------------------------------------------------------------------------
+# Small primes table
+#
+# The primes below smallPrimesLimit are kept as one wheel-30 bitmap
+# (34953 bytes for 2**20). "make" bakes it into the generated module
+# smallprimes.py (see writeSmallPrimesModule()), installed next to this
+# file, as a bytes constant; loadSmallPrimes() imports it the first time
+# the table is needed. Where the module is missing (as when running
+# from the source tree) or was made for another limit, the table is
+# sieved instead. The table answers is_prime() for small n and supplies
+# base primes (sieveBasePrimes()) and trial division divisors.
+#------------------------------------------------------------------------------
+
+def loadSmallPrimes():
+  '''Returns the wheel-30 bitmap of the primes below smallPrimesLimit'''
+
+  global smallPrimesBitmap, smallPrimesLimit
+
+  if smallPrimesBitmap == None:
+    try:
+      import smallprimes
+      if smallprimes.limit != smallPrimesLimit:
+        raise ImportError('smallprimes.py limit is not '+str(smallPrimesLimit))
+      smallPrimesBitmap = smallprimes.bitmap
+    except ImportError:
+      smallPrimesBitmap = sieveSmallPrimes()
+
+  return smallPrimesBitmap
+
+  # end loadSmallPrimes()
+
+def sieveSmallPrimes():
+  '''Sieves the small primes table (for loadSmallPrimes())'''
+
+  global smallPrimesLimit
+
+  limit = smallPrimesLimit - 1
+  return bytes(Wheel30Sieve(0, limit, oddSieve(math.isqrt(limit))).bits)
+
+  # end sieveSmallPrimes()
+
+def smallPrimes( lo, hi ):
+  '''Returns the list of primes in [lo, hi] (hi < smallPrimesLimit)'''
+
+  lo = max(lo, 0)
+  if hi < lo:
+    return []
+
+  bitmap = loadSmallPrimes()
+  first  = lo//30
+  primes = [p for p in (2, 3, 5) if lo <= p <= hi] + \
+           wheel30Primes(bitmap[first:hi//30 + 1], 30*first)
+
+  if primes and (primes[0] < lo or primes[-1] > hi):
+    primes = primes[bisect_left(primes, lo):bisect_right(primes, hi)]
+
+  return primes
+
+  # end smallPrimes()
+
+def isSmallPrime( n ):
+  '''Returns True if n is prime (0 <= n < smallPrimesLimit)'''
+
+  i, r = divmod(n, 30)
+  if wheel30Bit[r] == None:
+    return n in (2, 3, 5)
+  return loadSmallPrimes()[i] >> wheel30Bit[r] & 1 == 1
+
+  # end isSmallPrime()
+
+#------------------------------------------------------------------------------
+# writeSmallPrimesModule()
+#
+# Writes the Python module smallprimes.py (to filename), holding the
+# small primes table as the bytes constant "bitmap" and its limit as
+# "limit". Run by the Makefile:
+#
+#   python3 -c 'import primeslib; primeslib.writeSmallPrimesModule("smallprimes.py")'
+#------------------------------------------------------------------------------
+
+def writeSmallPrimesModule( filename ):
+  '''Writes the small primes table as a Python module'''
+
+  global smallPrimesLimit
+
+  bitmap = sieveSmallPrimes()
+
+  with open(filename, 'w') as f:
+    f.write('# smallprimes.py\n#\n')
+    f.write('# Generated by primeslib.writeSmallPrimesModule(); do not edit.\n')
+    f.write('# Wheel-30 bitmap of the primes below "limit" (see primeslib.py).\n\n')
+    f.write('limit  = '+str(smallPrimesLimit)+'\n\n')
+    f.write('bitmap = (\n')
+    for i in range(0, len(bitmap), 32):
+      f.write('  '+repr(bitmap[i:i + 32])+'\n')
+    f.write('  )\n')
+
+  # end writeSmallPrimesModule()
+
+
+#------------------------------------------------------------------------------
+# segmentedSieve()
+#
+# Generator that sieves the interval [lo, hi] one segment at a time and
+# yields, for every segment, the list of primes found in it (in
+# increasing order). Segments are bit-packed wheel-30 sieves (class
+# Wheel30Sieve) of segmentSize bytes, 30 integers per byte, so memory
+# use is bounded by the segment size (plus the base primes, which are
+# sieved once up to sqrt(hi)) no matter how wide [lo, hi] is.
+# basePrimes, if given, must include every prime <= sqrt(hi).
+#------------------------------------------------------------------------------
+
+def segmentedSieve( lo, hi, segmentSize=None, basePrimes=None ):
+  '''Yields lists of primes in [lo, hi], one list per sieve segment'''
+
+  if hi < 2 or hi < lo:
+    return
+
+  for sieve in wheel30Segments(lo, hi, segmentSize, basePrimes):
+    yield sieve.primes()
+
+  # end segmentedSieve()
+
+
+#------------------------------------------------------------------------------
+# unboundedSieve()
+#
+# Generator that sieves the integers >= lo forever, one wheel-30
+# segment of segmentSize bytes at a time, and yields the list of primes
+# of every segment (as segmentedSieve() does for a bounded interval).
+# The base primes are grown on demand: when sqrt of the end of the next
+# segment passes the largest base prime sieved so far, the base primes
+# up to twice that limit are sieved and appended, so they are extended
+# only a logarithmic number of times and the work per segment stays
+# close to that of a bounded sieve of the same range.
+#------------------------------------------------------------------------------
+
+def unboundedSieve( lo, segmentSize=None ):
+  '''Yields lists of the primes >= lo, one list per sieve segment, forever'''
+
+  global unboundedMaxSegment, unboundedSegmentRatio, wheelSegmentBytes
+
+  if segmentSize == None:
+    segmentSize = wheelSegmentBytes
+
+  seg_lo     = max(lo, 0)
+  baseLimit  = 0
+  basePrimes = []
+
+  while True:
+
+    # Segments grow with sqrt(seg_lo), so that the work per segment
+    # spent on base primes that hardly hit it stays a fraction of the
+    # whole (up to a limit on the length of the lists of primes)
+
+    nbytes = max(segmentSize, min(unboundedMaxSegment, \
+                 math.isqrt(seg_lo)//unboundedSegmentRatio))
+    seg_hi = 30*(seg_lo//30 + nbytes) - 1
+
+    root = math.isqrt(seg_hi)
+    if root > baseLimit:
+      newLimit = max(root, 2*baseLimit)
+      for primes in segmentedSieve(baseLimit + 1, newLimit, \
+                                   basePrimes=basePrimes[:] or None):
+        basePrimes.extend(primes)
+      baseLimit = newLimit
+
+    yield Wheel30Sieve(seg_lo, seg_hi, basePrimes).primes()
+    seg_lo = seg_hi + 1
+
+  # end unboundedSieve()
+
+
+#------------------------------------------------------------------------------
+# class PrimeCache
+#
+# Growing table of the odd primes, packed in an array('Q'), used as the
+# divisors of the "TRIAL_PRIMES" trial division engine. All odd primes
+# <= limit are in the table. The table grows in two ways: primes found
+# by a trial division run that has reached the end of the table are
+# appended as they are discovered (discovered()), and a run that starts
+# beyond the table first fills the gap with the segmented sieve
+# (extend()). It never holds more than max_primes primes (8 bytes each).
+# One table (primeCache) is shared by all PrimesGenerator objects in the
+# process.
+#------------------------------------------------------------------------------
+
+class PrimeCache(object):
+  '''Table of the odd primes up to "limit", shared within a process'''
+
+  def __init__(self, maxPrimes=None):
+
+    global primeCacheMaxPrimes
+
+    if maxPrimes == None:
+      maxPrimes = primeCacheMaxPrimes
+
+    self.primes     = array('Q')
+    self.limit      = 2
+    self.max_primes = maxPrimes
+
+  def full(self):
+    return len(self.primes) >= self.max_primes
+
+  #--- Make sure all primes <= n are in the table (unless it fills up)
+
+  def extend(self, n):
+    '''Sieves the primes in (limit, n] into the table'''
+
+    if n <= self.limit or self.full():
+      return
+
+    # Grow geometrically so that a slowly rising sqrt(x) does not
+    # restart the sieve for every few candidates
+
+    n = max(n, 2*self.limit)
+
+    if n < smallPrimesLimit:
+      chunks = [smallPrimes(self.limit + 1, n)]
+    else:
+      chunks = segmentedSieve(self.limit + 1, n)
+
+    for primes in chunks:
+      room = self.max_primes - len(self.primes)
+      if len(primes) > room:
+        primes = primes[:room]
+      if primes:
+        self.primes.extend(primes)
+        self.limit = primes[-1]
+      if self.full():
+        return
+
+    self.limit = n
+
+  #--- Record the result of testing odd x (x extends the table only if
+  #--- it is the next odd number after limit)
+
+  def discovered(self, x, isPrime):
+    if x > self.limit and x - self.limit <= 2 and not self.full():
+      if isPrime:
+        self.primes.append(x)
+      self.limit = x
+
+  # end class PrimeCache //////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# numpySieve()
+#
+# NumPy version of segmentedSieve(): same segments and odd-only layout,
+# but each segment is a boolean array, the first multiple of every base
+# prime in the segment is computed for all base primes at once, and the
+# primes are read back with numpy.flatnonzero(). NumPy is optional; when
+# it cannot be imported this simply runs segmentedSieve().
+#------------------------------------------------------------------------------
+
+def numpySieve( lo, hi, segmentSize=None, basePrimes=None ):
+  '''Yields lists of primes in [lo, hi], sieved with NumPy arrays'''
+
+  global sieveSegmentSize
+
+  # NumPy integers are 64 bit, so very large intervals are also left to
+  # the pure Python sieve
+
+  try:
+    import numpy
+  except ImportError:
+    numpy = None
+
+  if numpy == None or hi >= 2**62:
+    yield from segmentedSieve(lo, hi, basePrimes=basePrimes)
+    return
+
+  if segmentSize == None:
+    segmentSize = sieveSegmentSize
+
+  if hi < 2 or hi < lo:
+    return
+
+  if lo <= 2:
+    yield [2]
+    lo = 3
+
+  if lo % 2 == 0:
+    lo += 1
+
+  if basePrimes == None:
+    basePrimes = sieveBasePrimes(math.isqrt(hi))
+  odd = numpy.array(basePrimes[1:], dtype=numpy.int64)
+
+  seg_lo = lo
+  while seg_lo <= hi:
+
+    n      = min(segmentSize, (hi - seg_lo)//2 + 1)
+    seg_hi = seg_lo + 2*(n - 1)
+    seg    = numpy.ones(n, dtype=numpy.bool_)
+
+    # Index in this segment of the first odd multiple >= max(p*p, seg_lo)
+    # of each base prime p <= sqrt(seg_hi)
+
+    ps = odd[:numpy.searchsorted(odd, math.isqrt(seg_hi), side='right')]
+    m      = numpy.maximum(ps*ps, ((seg_lo + ps - 1)//ps)*ps)
+    starts = m - seg_lo
+    starts = numpy.where(starts % 2 == 1, starts + ps, starts)//2
+
+    for p, i in zip(ps.tolist(), starts.tolist()):
+      seg[i::p] = False
+
+    if seg_lo == 1:
+      seg[0] = False
+
+    yield (seg_lo + 2*numpy.flatnonzero(seg)).tolist()
+
+    seg_lo = seg_hi + 2
+
+    # end while seg_lo <= hi
+
+  # end numpySieve()
+
+
+#------------------------------------------------------------------------------
+# Parallel segmented sieve
+#
+# The interval is split into chunks of parallelChunkSize integers which
+# are sieved by a pool of worker processes. The base primes are sieved
+# once, in the parent, and handed to each worker process once, by the
+# pool initializer; a chunk then only costs its two end points going
+# out and a packed array of primes coming back. At most 2 chunks per
+# worker are in flight at any time, so memory stays bounded however
+# wide the interval is.
+#------------------------------------------------------------------------------
+
+# Base primes of the worker process (set by initSieveWorker())
+
+workerBasePrimes = None
+
+def initSieveWorker( basePrimes ):
+  '''Process pool initializer: stores the base primes in the worker'''
+  global workerBasePrimes
+  workerBasePrimes = basePrimes
+
+def sieveChunk( lo, hi ):
+  '''Returns array of the primes in [lo, hi] (runs in a worker process)'''
+  chunk = array('Q')
+  for primes in segmentedSieve(lo, hi, basePrimes=workerBasePrimes):
+    chunk.extend(primes)
+  return chunk
+
+def parallelSieve( lo, hi, workers=None, chunkSize=None ):
+  '''Yields lists of primes in [lo, hi], in order, sieved in parallel'''
+
+  global parallelChunkSize
+
+  from concurrent.futures import ProcessPoolExecutor
+
+  if workers == None:
+    workers = os.cpu_count() or 1
+  if chunkSize == None:
+    chunkSize = parallelChunkSize
+
+  if hi < 2 or hi < lo:
+    return
+
+  basePrimes = sieveBasePrimes(math.isqrt(hi))
+
+  executor = ProcessPoolExecutor(max_workers=workers, \
+    initializer=initSieveWorker, initargs=(basePrimes,))
+  pending  = deque()
+
+  try:
+    for a in range(lo, hi + 1, chunkSize):
+      pending.append(executor.submit(sieveChunk, a, min(a+chunkSize-1, hi)))
+      if len(pending) >= 2*workers:
+        yield pending.popleft().result().tolist()
+    while pending:
+      yield pending.popleft().result().tolist()
+  finally:
+    executor.shutdown(cancel_futures=True)
+
+  # end parallelSieve()
+
+
+#------------------------------------------------------------------------------
+# C sieve library (ctypes)
+#
+# The segmented sieve of the C program (c/src/sieve.c) is also built as
+# the shared library libprimes.so, loaded here with ctypes (which needs
+# no compiler or extra package at run time). sieve_fill() writes primes
+# straight into the memory of an array('Q') or a NumPy uint64 array, so
+# no Python int is created until the caller reads the buffer; the
+# library is only usable below 2**63 (C long long). When it cannot be
+# found the functions below fall back to segmentedSieve().
+#
+# The library is looked for, in order, at $PRIMES_LIBRARY, next to this
+# file, in ../lib (installed) and in ../../c/src (source tree).
+#------------------------------------------------------------------------------
+
+cLibrary       = None
+cLibraryLoaded = False
+
+def loadCLibrary():
+  '''Returns the C sieve library (ctypes.CDLL), or None if not found'''
+
+  global cLibrary, cLibraryLoaded
+
+  if cLibraryLoaded:
+    return cLibrary
+  cLibraryLoaded = True
+
+  import ctypes
+
+  thisDir = os.path.dirname(os.path.abspath(__file__))
+  paths   = [ \
+    os.path.join(thisDir, 'libprimes.so'), \
+    os.path.join(thisDir, '..', 'lib', 'libprimes.so'), \
+    os.path.join(thisDir, '..', '..', 'c', 'src', 'libprimes.so')]
+  if os.environ.get('PRIMES_LIBRARY'):
+    paths.insert(0, os.environ['PRIMES_LIBRARY'])
+
+  for path in paths:
+    if not os.path.exists(path):
+      continue
+    # (a library built from older sources lacks some of the functions)
+
+    try:
+      lib = ctypes.CDLL(path)
+      ll  = ctypes.c_longlong
+      lib.sieve_count.argtypes   = [ll, ll, ctypes.c_int]
+      lib.sieve_count.restype    = ll
+      lib.sieve_fill.argtypes    = [ll, ll, ctypes.c_void_p, ll]
+      lib.sieve_fill.restype     = ll
+      lib.sieve_release.argtypes = []
+      lib.sieve_release.restype  = None
+    except (OSError, AttributeError):
+      continue
+
+    cLibrary = lib
+    break
+
+  return cLibrary
+
+  # end loadCLibrary()
+
+def fill_primes( lo, hi, buf ):
+  '''Stores the first len(buf) primes in [lo, hi] in buf; returns count'''
+
+  # buf is an array('Q') or a NumPy uint64 array (any writable buffer of
+  # 8 byte items). A return value of len(buf) means there may be more
+  # primes: continue from buf[-1] + 1.
+
+  lib  = loadCLibrary()
+  size = len(buf)
+
+  if hi < lo or hi < 2 or size == 0:
+    return 0
+
+  if lib == None or hi >= 2**63 - 2:
+    n = 0
+    for primes in segmentedSieve(lo, hi):
+      k = min(len(primes), size - n)
+      buf[n:n + k] = array('Q', primes[:k])
+      n += k
+      if n == size:
+        break
+    return n
+
+  import ctypes
+
+  cBuf = (ctypes.c_uint64*size).from_buffer(buf)
+  n    = lib.sieve_fill(max(lo, 0), hi + 1, ctypes.addressof(cBuf), size)
+  del cBuf
+
+  if n < 0:
+    errMsg  = 'C sieve failed in ['+str(lo)+', '+str(hi)+']'
+    errInfo = ['fill_primes', errMsg]
+    raise ArgumentError('primeslib.py - ', [errInfo])
+
+  return n
+
+  # end fill_primes()
+
+def count_primes_c( lo, hi, threads=None ):
+  '''Returns the number of primes in [lo, hi], counted by the C sieve'''
+
+  lib = loadCLibrary()
+
+  if hi < lo or hi < 2:
+    return 0
+
+  if lib == None or hi >= 2**63 - 2:
+    return sieveCount(lo, hi)
+
+  if threads == None:
+    threads = os.cpu_count() or 1
+
+  n = lib.sieve_count(max(lo, 0), hi + 1, threads)
+  if n < 0:
+    errMsg  = 'C sieve failed in ['+str(lo)+', '+str(hi)+']'
+    errInfo = ['count_primes_c', errMsg]
+    raise ArgumentError('primeslib.py - ', [errInfo])
+
+  return n
+
+  # end count_primes_c()
+
+def cSieve( lo, hi, chunkSize=None ):
+  '''Yields lists of primes in [lo, hi], sieved by the C library'''
+
+  global cSieveChunkSize
+
+  if chunkSize == None:
+    chunkSize = cSieveChunkSize
+
+  if loadCLibrary() == None or hi >= 2**63 - 2:
+    yield from segmentedSieve(lo, hi)
+    return
+
+  buf = array('Q', bytes(8*chunkSize))
+
+  # Beyond 2**56 the library keeps the base primes of [lo, hi] between
+  # calls only until told to let go of them
+
+  try:
+    while lo <= hi:
+      n = fill_primes(lo, hi, buf)
+      if n == 0:
+        break
+      yield buf[:n].tolist()
+      if n < chunkSize:
+        break
+      lo = buf[n - 1] + 1
+  finally:
+    loadCLibrary().sieve_release()
+
+  # end cSieve()
+
+
+#------------------------------------------------------------------------------
+# Primality testing
+#
+# is_prime() tests a single n without any sieving: trial division by a
+# few small primes, then Miller-Rabin. For n < 2**64 the Miller-Rabin
+# bases in millerRabinBases are known to make the test deterministic;
+# above that it runs the Baillie-PSW test (strong base 2 test plus a
+# strong Lucas test), which has no known counterexample.
+#------------------------------------------------------------------------------
+
+millerRabinBases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def isStrongProbablePrime( n, a ):
+  '''Returns True if odd n > 2 is a strong probable prime to base a'''
+
+  d = n - 1
+  s = 0
+  while d % 2 == 0:
+    d //= 2
+    s += 1
+
+  x = pow(a, d, n)
+  if x == 1 or x == n - 1:
+    return True
+  for r in range(s - 1):
+    x = x*x % n
+    if x == n - 1:
+      return True
+  return False
+
+def jacobi( a, n ):
+  '''Returns the Jacobi symbol (a/n) for odd n > 0'''
+
+  a = a % n
+  j = 1
+  while a != 0:
+    while a % 2 == 0:
+      a //= 2
+      if n % 8 in (3, 5):
+        j = -j
+    a, n = n, a
+    if a % 4 == 3 and n % 4 == 3:
+      j = -j
+    a = a % n
+  if n == 1:
+    return j
+  return 0
+
+def isStrongLucasProbablePrime( n ):
+  '''Returns True if odd n > 2 is a strong Lucas probable prime'''
+
+  # Parameters chosen by Selfridge's method: D is the first of
+  # 5, -7, 9, -11, ... with (D/n) = -1; P = 1, Q = (1 - D)/4.
+
+  if math.isqrt(n)**2 == n:
+    return False
+
+  D = 5
+  while True:
+    j = jacobi(D, n)
+    if j == -1:
+      break
+    if j == 0 and abs(D) != n:
+      return False
+    if D > 0:
+      D = -D - 2
+    else:
+      D = -D + 2
+  Q = (1 - D)//4
+
+  d = n + 1
+  s = 0
+  while d % 2 == 0:
+    d //= 2
+    s += 1
+
+  # Binary ladder for U_d, V_d (P = 1) and Q^d, all mod n
+
+  U  = 1
+  V  = 1
+  Qk = Q % n
+  for bit in bin(d)[3:]:
+    U  = U*V % n
+    V  = (V*V - 2*Qk) % n
+    Qk = Qk*Qk % n
+    if bit == '1':
+      U, V = U + V, V + U*D
+      if U % 2:
+        U += n
+      if V % 2:
+        V += n
+      U  = (U//2) % n
+      V  = (V//2) % n
+      Qk = Qk*Q % n
+
+  if U == 0 or V == 0:
+    return True
+  for r in range(s - 1):
+    V  = (V*V - 2*Qk) % n
+    if V == 0:
+      return True
+    Qk = Qk*Qk % n
+  return False
+
+def is_prime( n ):
+  '''Returns True if n is prime'''
+
+  global millerRabinBases, smallPrimesLimit
+
+  if n < 2:
+    return False
+  for p in millerRabinBases:
+    if n % p == 0:
+      return n == p
+  if n < 41*41:
+    return True
+  if n < smallPrimesLimit:
+    return isSmallPrime(n)
+
+  if n < 2**64:
+    for a in millerRabinBases:
+      if not isStrongProbablePrime(n, a):
+        return False
+    return True
+
+  return isStrongProbablePrime(n, 2) and isStrongLucasProbablePrime(n)
+
+def next_prime( n ):
+  '''Returns the smallest prime > n'''
+
+  if n < 2:
+    return 2
+  if n < 3:
+    return 3
+  x = n + 1 + (n % 2)
+  while not is_prime(x):
+    x += 2
+  return x
+
+def prev_prime( n ):
+  '''Returns the largest prime < n (None if there is none)'''
+
+  if n <= 2:
+    return None
+  if n == 3:
+    return 2
+  x = n - 1 - (n % 2)
+  while not is_prime(x):
+    x -= 2
+  return x
+
+
+#------------------------------------------------------------------------------
+# millerRabinPrimes()
+#
+# Generator that tests the integers in [lo, hi] (forever if hi is None)
+# one at a time with is_prime() and yields lists of the primes found.
+# Only integers prime to 30 are tested. This beats sieving when [lo, hi]
+# is narrow and far from 0: a sieve first has to find all of the primes
+# up to sqrt(hi). See useMillerRabin().
+#------------------------------------------------------------------------------
+
+def millerRabinPrimes( lo, hi, chunkSize=None ):
+  '''Yields lists of primes in [lo, hi] found with is_prime()'''
+
+  global primesChunkSize, wheel30Residues
+
+  if chunkSize == None:
+    chunkSize = primesChunkSize
+
+  chunk = [p for p in (2, 3, 5) if lo <= p and (hi == None or p <= hi)]
+
+  x = 30*(max(lo, 0)//30)
+  while hi == None or x <= hi:
+    for r in wheel30Residues:
+      n = x + r
+      if hi != None and n > hi:
+        break
+      if n >= lo and is_prime(n):
+        chunk.append(n)
+    if len(chunk) >= chunkSize:
+      yield chunk
+      chunk = []
+    x += 30
+
+  if chunk:
+    yield chunk
+
+  # end millerRabinPrimes()
+
+def useMillerRabin( lo, hi, cSieve=False ):
+  '''Returns True if [lo, hi] is better searched with millerRabinPrimes()'''
+
+  # High (hi >= millerRabinThreshold) and narrow: for trial division and
+  # the Python sieves, fewer integers than there are candidate base
+  # primes, i.e. less than sqrt(hi). Against the C sieve ("cSieve", if
+  # the library is there), which finds the base primes some 64 times
+  # faster per integer than Miller-Rabin tests one, the cost of
+  # Miller-Rabin, (integers) x (bit length), must stay below sqrt(hi)/64
+  # and a fixed millerRabinMaxCost.
+
+  global millerRabinThreshold, millerRabinMaxCost
+
+  if hi < millerRabinThreshold:
+    return False
+
+  if cSieve and hi < 2**63 - 2 and loadCLibrary() != None:
+    cost = (hi - lo + 1)*hi.bit_length()
+    return cost < min(math.isqrt(hi)//64, millerRabinMaxCost)
+
+  return hi - lo < math.isqrt(hi)
+
+
+#------------------------------------------------------------------------------
+# Prime counting
+#
+# prime_pi() counts the primes <= x without enumerating them, using the
+# Lucy_Hedgehog algorithm (a Legendre-style sieve over the O(sqrt(x))
+# distinct values of x//i), which takes O(x**(3/4)) operations and
+# O(sqrt(x)) memory. S(v), the running count for each v, is kept in two
+# arrays: small[v] for v <= sqrt(x) and large[i] for v = x//i. When
+# NumPy is available, the update of all S(v) for one prime is done with
+# array operations (primePiNumpy()). Below piTableLimit, where the prime
+# counting table (pitable.py) is installed, prime_pi() instead sieves
+# from the nearest multiple of piTableBlock, whose count is in the
+# table: at most piTableBlock/2 integers.
+#------------------------------------------------------------------------------
+
+def loadPiTable():
+  '''Returns [pi(j*piTableBlock) for j = 0, 1, ...], or None'''
+
+  # From the generated module pitable.py, which holds the number of
+  # primes in each block of piTableBlock integers up to piTableLimit
+  # (None if it is missing or was made for another block or limit)
+
+  global piTable, piTableLoaded, piTableBlock, piTableLimit
+
+  if not piTableLoaded:
+    piTableLoaded = True
+    try:
+      import pitable
+      if pitable.block == piTableBlock and pitable.limit == piTableLimit:
+        piTable = list(accumulate(pitable.counts, initial=0))
+    except ImportError:
+      pass
+
+  return piTable
+
+  # end loadPiTable()
+
+def writePiTableModule( filename ):
+  '''Writes the prime counting table (for loadPiTable()) as a module'''
+
+  # This counts every prime below piTableLimit: some minutes with the
+  # C library, hours without it
+
+  global piTableBlock, piTableLimit
+
+  counts = [count_primes_c(j*piTableBlock + 1, (j + 1)*piTableBlock) \
+            for j in range(piTableLimit//piTableBlock)]
+
+  with open(filename, 'w') as f:
+    f.write('# pitable.py\n#\n')
+    f.write('# Generated by primeslib.writePiTableModule(); do not edit.\n')
+    f.write('# counts[j] is the number of primes p with j*block < p <= '+\
+            '(j+1)*block\n# (see primeslib.py).\n\n')
+    f.write('block  = '+str(piTableBlock)+'\n')
+    f.write('limit  = '+str(piTableLimit)+'\n\n')
+    f.write('counts = (\n')
+    for i in range(0, len(counts), 8):
+      f.write('  '+', '.join(str(c) for c in counts[i:i + 8])+',\n')
+    f.write('  )\n')
+
+  # end writePiTableModule()
+
+def prime_pi( x ):
+  '''Returns the number of primes <= x'''
+
+  global piTableBlock, piTableLimit
+
+  if x < 2:
+    return 0
+
+  # Below piTableLimit, count from the nearest multiple of piTableBlock
+
+  table = loadPiTable() if x < piTableLimit else None
+  if table != None:
+    j = min((x + piTableBlock//2)//piTableBlock, len(table) - 1)
+    c = j*piTableBlock
+    if c <= x:
+      return table[j] + count_primes_c(c + 1, x)
+    return table[j] - count_primes_c(x + 1, c)
+
+  try:
+    import numpy
+  except ImportError:
+    numpy = None
+
+  if numpy != None and x < 2**62:
+    return primePiNumpy(x, numpy)
+
+  r     = math.isqrt(x)
+  small = [v - 1 for v in range(r + 1)]
+  large = [0] + [x//i - 1 for i in range(1, r + 1)]
+
+  for p in range(2, r + 1):
+    if small[p] == small[p - 1]:
+      continue
+    sp  = small[p - 1]
+    p2  = p*p
+    lim = min(r, x//p2)
+
+    # S(v) -= S(v//p) - S(p-1) for every v >= p*p, largest v first so
+    # that S(v//p) still holds the value from the previous prime
+
+    for i in range(1, lim + 1):
+      d = i*p
+      if d <= r:
+        large[i] -= large[d] - sp
+      else:
+        large[i] -= small[x//d] - sp
+    for v in range(r, p2 - 1, -1):
+      small[v] -= small[v//p] - sp
+
+  return large[1]
+
+  # end prime_pi()
+
+def primePiNumpy( x, numpy ):
+  '''prime_pi() with the updates for each prime done by NumPy'''
+
+  r     = math.isqrt(x)
+  small = numpy.arange(-1, r, dtype=numpy.int64)
+  large = numpy.zeros(r + 1, dtype=numpy.int64)
+  large[1:] = x//numpy.arange(1, r + 1, dtype=numpy.int64) - 1
+
+  for p in range(2, r + 1):
+    if small[p] == small[p - 1]:
+      continue
+    sp  = int(small[p - 1])
+    p2  = p*p
+    lim = min(r, x//p2)
+    k   = min(lim, r//p)
+
+    # Right hand sides are evaluated before assignment, so S(v//p) is
+    # always the value from the previous prime
+
+    large[1:k + 1] -= large[p:k*p + 1:p] - sp
+    if lim > k:
+      d = numpy.arange(k + 1, lim + 1, dtype=numpy.int64)*p
+      large[k + 1:lim + 1] -= small[x//d] - sp
+    v = numpy.arange(p2, r + 1, dtype=numpy.int64)
+    small[p2:r + 1] -= small[v//p] - sp
+
+  return int(large[1])
+
+  # end primePiNumpy()
+
+def count_primes( a, b, threads=None ):
+  '''Returns the number of primes p with a <= p <= b'''
+
+  # High, narrow ranges are counted with Miller-Rabin and ranges
+  # narrower than countSieveSpan with the sieve (the C library, on
+  # "threads" threads, if it is there); only wide ranges need prime_pi()
+
+  global countSieveSpan
+
+  if b < a:
+    return 0
+  if useMillerRabin(a, b, cSieve=True):
+    return sum(len(primes) for primes in millerRabinPrimes(a, b))
+  if b - a < countSieveSpan:
+    return count_primes_c(a, b, threads)
+  return prime_pi(b) - prime_pi(a - 1)
+
+  # end count_primes()
+
+
+#------------------------------------------------------------------------------
+# nth_prime()
+#
+# Returns the k-th prime (nth_prime(1) == 2). Small k are looked up in
+# a plain sieve up to the upper bound p_k < k*(ln k + ln ln k) (k >= 6).
+# Up to the end of the prime counting table (k <= pi(2**38), which is
+# 10866266172), p_k is found by counting primes (nthPrimeIn()) from the
+# nearer end of the table block that holds it. Beyond, x, an estimate of p_k from the
+# asymptotic expansion p_k ~ k*(ln k + ln ln k - 1 + ...), is off by
+# roughly sqrt(x) log x at most, so after counting the primes <= x with
+# prime_pi() only a short interval next to x has to be sieved.
+#------------------------------------------------------------------------------
+
+def nth_prime( k ):
+  '''Returns the k-th prime'''
+
+  global nthPrimeSieveLimit, piTableBlock
+
+  if k < 1:
+    errMsg  = 'Invalid value k = '+str(k)+' : must be >= 1'
+    errInfo = ['nth_prime', errMsg]
+    raise ArgumentError('primeslib.py - ', [errInfo])
+
+  if k < 6:
+    return (2, 3, 5, 7, 11)[k - 1]
+
+  lk    = math.log(k)
+  llk   = math.log(lk)
+  upper = int(k*(lk + llk)) + 1
+
+  if upper <= nthPrimeSieveLimit:
+    return sieveBasePrimes(upper)[k - 1]
+
+  # Within the prime counting table, p_k lies in the block where the
+  # counts pass k: count on from whichever end of it is closer
+
+  table = loadPiTable()
+  if table != None and k <= table[-1]:
+    j    = bisect_left(table, k)
+    need = k - table[j - 1]
+    lo   = (j - 1)*piTableBlock + 1
+    hi   = j*piTableBlock
+    if 2*need <= table[j] - table[j - 1]:
+      return nthPrimeIn(lo, hi, need)
+    return nthPrimeIn(lo, hi, -(table[j] - k + 1))
+
+  x = int(k*(lk + llk - 1 + (llk - 2)/lk))
+  c = prime_pi(x)
+
+  # Too few primes <= x: p_k is the (k-c)-th prime after x. Otherwise
+  # p_k is the (c-k+1)-th prime counting down from x
+
+  if c < k:
+    return nthPrimeIn(x + 1, None, k - c)
+  return nthPrimeIn(2, x, -(c - k + 1))
+
+  # end nth_prime()
+
+def nthPrimeIn( lo, hi, k ):
+  '''Returns the k-th prime in [lo, hi] (if k < 0, the -k-th from hi)'''
+
+  # Counts piTableWindow integers at a time, then lists the primes of
+  # the window that holds the one wanted. hi may be None (if k > 0).
+  # Returns None if [lo, hi] holds fewer than abs(k) primes.
+
+  global piTableWindow
+
+  while k > 0 and (hi == None or lo <= hi):
+    b = lo + piTableWindow - 1 if hi == None else \
+        min(lo + piTableWindow - 1, hi)
+    n = count_primes_c(lo, b)
+    if n >= k:
+      return [p for primes in cSieve(lo, b) for p in primes][k - 1]
+    k -= n
+    lo = b + 1
+
+  while k < 0 and lo <= hi:
+    a = max(lo, hi - piTableWindow + 1)
+    n = count_primes_c(a, hi)
+    if n >= -k:
+      return [p for primes in cSieve(a, hi) for p in primes][k]
+    k += n
+    hi = a - 1
+
+  return None
+
+  # end nthPrimeIn()
+
+
+#------------------------------------------------------------------------------
+# Prime factorization
+#
+# factorize(n) divides out the primes in a table of small primes (those
+# below factorTrialLimit), then splits what is left with Pollard-Rho in
+# Brent's variant until every factor passes is_prime(). After the trial
+# division every remaining factor exceeds factorTrialLimit, so a
+# cofactor below factorTrialLimit**2 is known to be prime without a
+# test. Factorizations are lists of (prime, exponent) pairs in
+# increasing order of prime, e.g. factorize(360) == [(2,3), (3,2), (5,1)].
+#
+# Many small numbers (below factorSpfLimit) are factored faster by
+# looking up their smallest prime factors in a table built by spfSieve().
+#------------------------------------------------------------------------------
+
+def factorTrialPrimes():
+  '''Returns the table of primes below factorTrialLimit'''
+
+  global factorSmallPrimes
+
+  if factorSmallPrimes == None:
+    factorSmallPrimes = sieveBasePrimes(factorTrialLimit - 1)
+
+  return factorSmallPrimes
+
+def pollardRhoBrent( n ):
+  '''Returns a nontrivial factor of the odd composite n'''
+
+  # x -> x*x + c mod n, Brent's cycle detection, with the gcd taken of
+  # the product of m differences at a time. Should a batch overshoot
+  # (gcd == n) its steps are retaken one by one; should c fail
+  # altogether the next c is tried.
+
+  m = 128
+
+  for c in range(1, n):
+    y = 2
+    r = 1
+    q = 1
+    g = 1
+    while g == 1:
+      x = y
+      for i in range(r):
+        y = (y*y + c) % n
+      k = 0
+      while k < r and g == 1:
+        ys = y
+        for i in range(min(m, r - k)):
+          y = (y*y + c) % n
+          q = q*abs(x - y) % n
+        g = math.gcd(q, n)
+        k += m
+      r *= 2
+    if g == n:
+      g = 1
+      while g == 1:
+        ys = (ys*ys + c) % n
+        g  = math.gcd(abs(x - ys), n)
+    if g != n:
+      return g
+
+  # end pollardRhoBrent()
+
+def perfectPower( n ):
+  '''Returns (r, k) with n == r**k and k as large as possible'''
+
+  # Pollard-Rho takes about sqrt(p) steps to split p**k, so perfect
+  # powers are taken apart first. n has no prime factor below
+  # factorTrialLimit, which bounds k.
+
+  for k in range(n.bit_length()//(factorTrialLimit.bit_length() - 1), 1, -1):
+    # Newton's method for the integer k-th root, from above
+
+    r = 1 << (n.bit_length()//k + 1)
+    while True:
+      s = ((k - 1)*r + n//r**(k - 1))//k
+      if s >= r:
+        break
+      r = s
+
+    if r**k == n:
+      return r, k
+
+  return n, 1
+
+  # end perfectPower()
+
+def factorize( n ):
+  '''Returns the prime factorization of n as [(prime, exponent), ...]'''
+
+  global factorTrialLimit
+
+  if not isinstance(n, int) or n < 1:
+    errMsg  = 'Invalid value n = '+str(n)+' : must be an integer >= 1'
+    errInfo = ['factorize', errMsg]
+    raise ArgumentError('primeslib.py - ', [errInfo])
+
+  factors = {}
+
+  for p in factorTrialPrimes():
+    if p*p > n:
+      break
+    if n % p == 0:
+      e = 0
+      while n % p == 0:
+        n //= p
+        e  += 1
+      factors[p] = e
+  else:
+    # Every factor left is > factorTrialLimit
+    pending = [n] if n > 1 else []
+    while pending:
+      m = pending.pop()
+      if m < factorTrialLimit*factorTrialLimit or is_prime(m):
+        factors[m] = factors.get(m, 0) + 1
+        continue
+      r, k = perfectPower(m)
+      if k > 1:
+        pending.extend([r]*k)
+      else:
+        d = pollardRhoBrent(m)
+        pending.append(d)
+        pending.append(m//d)
+    n = 1
+
+  if n > 1:
+    factors[n] = factors.get(n, 0) + 1
+
+  return sorted(factors.items())
+
+  # end factorize()
+
+def factorize_many( numbers ):
+  '''Yields (n, factorize(n)) for each n in the iterable "numbers"'''
+
+  # Numbers are taken factorBatchSize at a time; those below
+  # factorSpfLimit are factored with the smallest prime factor table,
+  # which is rebuilt to cover the largest of them. It at least doubles
+  # every time, so that rising input does not rebuild it every batch.
+
+  global factorBatchSize, factorSpfLimit, factorSpfMinTable, spfTable
+
+  numbers = iter(numbers)
+
+  while True:
+    batch = list(islice(numbers, factorBatchSize))
+    if not batch:
+      return
+
+    small = [n for n in batch \
+      if isinstance(n, int) and 1 <= n <= factorSpfLimit]
+    if small and (spfTable == None or max(small) >= len(spfTable)):
+      spfTable = spfSieve(min(factorSpfLimit, \
+        max(2*len(spfTable or ()), max(small), factorSpfMinTable)))
+
+    for n in batch:
+      if isinstance(n, int) and 1 <= n < len(spfTable or ()):
+        yield n, spfFactorize(n, spfTable)
+      else:
+        yield n, factorize(n)
+
+  # end factorize_many()
+
+
+#------------------------------------------------------------------------------
+# spfSieve()
+#
+# Returns an array spf with spf[n] = the smallest prime factor of n for
+# composite n <= limit, and spf[n] == 0 for n prime (or n < 2). Primes
+# are taken largest first and every multiple from p*p on is assigned p
+# with one slice assignment, so the smallest prime factor is the last
+# value written.
+#------------------------------------------------------------------------------
+
+def spfSieve( limit ):
+  '''Returns the smallest prime factor table of 0..limit'''
+
+  spf = array('I', bytes(4*(limit + 1)))
+
+  for p in reversed(sieveBasePrimes(math.isqrt(limit))):
+    start = p*p
+    spf[start::p] = array('I', [p])*len(range(start, limit + 1, p))
+
+  return spf
+
+  # end spfSieve()
+
+def spfFactorize( n, spf ):
+  '''Returns the factorization of n from the smallest prime factor table'''
+
+  factors = []
+  while n > 1:
+    p = spf[n] or n
+    e = 0
+    while n % p == 0:
+      n //= p
+      e  += 1
+    factors.append((p, e))
+  return factors
+
+
+#------------------------------------------------------------------------------
+# factorRange()
+#
+# Generator yielding (n, factorization) for every n in [lo, hi], lo >= 1,
+# in increasing order. Below factorSpfLimit the smallest prime factor
+# table is used; above it [lo, hi] is handled one segment at a time by
+# a sieve that divides each multiple of each prime <= sqrt(hi) by that
+# prime, leaving at most one prime factor > sqrt(hi) in each cofactor.
+#------------------------------------------------------------------------------
+
+def factorRange( lo, hi, segmentSize=None ):
+  '''Yields (n, factorize(n)) for n in [lo, hi]'''
+
+  global factorSpfLimit, spfTable, sieveSegmentSize
+
+  if segmentSize == None:
+    segmentSize = sieveSegmentSize
+
+  lo = max(lo, 1)
+  if hi < lo:
+    return
+
+  if hi <= factorSpfLimit:
+    if spfTable == None or hi >= len(spfTable):
+      spfTable = spfSieve(max(hi, factorSpfMinTable))
+    for n in range(lo, hi + 1):
+      yield n, spfFactorize(n, spfTable)
+    return
+
+  basePrimes = sieveBasePrimes(math.isqrt(hi))
+
+  for seg_lo in range(lo, hi + 1, segmentSize):
+    seg_hi  = min(seg_lo + segmentSize - 1, hi)
+    rem     = list(range(seg_lo, seg_hi + 1))
+    factors = [[] for i in rem]
+
+    for p in basePrimes:
+      if p*p > seg_hi:
+        break
+      for i in range((-seg_lo) % p, len(rem), p):
+        e = 0
+        while rem[i] % p == 0:
+          rem[i] //= p
+          e += 1
+        factors[i].append((p, e))
+
+    for i, n in enumerate(range(seg_lo, seg_hi + 1)):
+      if rem[i] > 1:
+        factors[i].append((rem[i], 1))
+      yield n, factors[i]
+
+  # end factorRange()
+
+
+#------------------------------------------------------------------------------
+# formatFactors()
+#
+# Returns the factorization of n as text, e.g. "360 = 2^3 * 3^2 * 5".
+#------------------------------------------------------------------------------
+
+def formatFactors( n, factors ):
+  '''Returns "n = p1^e1 * p2^e2 * ..." (or "1 = 1")'''
+
+  if not factors:
+    return str(n)+' = 1'
+
+  return str(n)+' = '+' * '.join(\
+    str(p) if e == 1 else str(p)+'^'+str(e) for p, e in factors)
+
+  # end formatFactors()
+
+
+#------------------------------------------------------------------------------
+# class GapStats
+#
+# Streaming statistics of the gaps between consecutive primes and of the
+# prime k-tuples (see primeTuplePatterns) in a range, for run modes
+# "GAPS" and "TUPLES". Lists of primes in increasing order are added one
+# at a time; apart from the gap histogram and the maximal gaps (whose
+# sizes grow only like log(p)**2) nothing is kept but the few primes at
+# each end of the range, within primeTupleWindow of the first or last.
+#
+# The statistics of two adjacent ranges (no prime between them) merge
+# into those of their union: the gap across the boundary is added, and
+# the k-tuples that straddle it are found among the primes kept at the
+# ends. So a range may be split into chunks analyzed in any order or in
+# other processes (see parallelGapStats()), as long as the results are
+# merged in the order of the chunks.
+#------------------------------------------------------------------------------
+
+# Prime k-tuples counted: name -> offsets. A k-tuple is counted at its
+# first prime p when p + d is prime for every offset d.
+
+primeTuplePatterns = [ \
+  ('twins',       (0, 2)), \
+  ('cousins',     (0, 4)), \
+  ('sexy pairs',  (0, 6)), \
+  ('triplets',    (0, 2, 6)), \
+  ('triplets',    (0, 4, 6)), \
+  ('quadruplets', (0, 2, 6, 8))]
+
+primeTupleWindow = max(offsets[-1] for name, offsets in primeTuplePatterns)
+
+class GapStats(object):
+  '''Gap histogram, maximal gaps and k-tuple counts of a range of primes'''
+
+  def __init__(self, primes=None):
+    self.n_primes    = 0
+    self.first       = None        # smallest prime
+    self.last        = None        # largest prime
+    self.head        = []          # primes <= first + primeTupleWindow
+    self.tail        = []          # primes >= last - primeTupleWindow
+    self.gapCounts   = {}          # gap -> number of times it occurs
+    self.firstGap    = {}          # gap -> prime at which it first occurs
+    self.records     = []          # maximal gaps, [(gap, prime), ...]
+    self.tupleCounts = [0]*len(primeTuplePatterns)
+
+    if primes:
+      self.analyze(primes)
+
+    # end __init__() //////////////////////////////////////////////////////////
+
+  def analyze(self, primes):
+    '''Computes the statistics of one list of primes (self is empty)'''
+
+    global primeTuplePatterns, primeTupleWindow
+
+    self.n_primes = len(primes)
+    self.first    = primes[0]
+    self.last     = primes[-1]
+    self.head     = primes[:bisect_right(primes, self.first+primeTupleWindow)]
+    self.tail     = primes[bisect_left(primes, self.last-primeTupleWindow):]
+
+    gaps = list(map(operator.sub, islice(primes, 1, None), primes))
+
+    self.gapCounts = dict(Counter(gaps))
+
+    # Reversed, the first occurrence of each gap is the one that stays
+
+    self.firstGap  = dict(zip(reversed(gaps), reversed(primes[:-1])))
+
+    maxGap = 0
+    for g, p in zip(gaps, primes):
+      if g > maxGap:
+        maxGap = g
+        self.records.append((g, p))
+
+    # Tuples: the primes p for which every p + d is also prime
+
+    shifted = {}
+    primeSet = set(primes)
+    for i, (name, offsets) in enumerate(primeTuplePatterns):
+      found = primeSet
+      for d in offsets[1:]:
+        if not d in shifted:
+          shifted[d] = set(map((-d).__add__, primes))
+        found = found & shifted[d]
+      self.tupleCounts[i] = len(found)
+
+    # end analyze() ///////////////////////////////////////////////////////////
+
+  def add(self, primes):
+    '''Adds primes that all come after the primes already added'''
+    if primes:
+      self.merge(GapStats(primes))
+
+  def merge(self, other):
+    '''Merges in the statistics of the range that follows this one'''
+
+    global primeTuplePatterns, primeTupleWindow
+
+    if other.n_primes == 0:
+      return self
+
+    if self.n_primes == 0:
+      self.__dict__.update(other.__dict__)
+      return self
+
+    # The gap across the boundary, and the maximal gaps of other that
+    # are still maximal after the gaps of self
+
+    g = other.first - self.last
+    self.gapCounts[g] = self.gapCounts.get(g, 0) + 1
+    self.firstGap.setdefault(g, self.last)
+
+    maxGap = self.maxGap()
+    for r in [(g, self.last)] + other.records:
+      if r[0] > maxGap:
+        maxGap = r[0]
+        self.records.append(r)
+
+    for g, n in other.gapCounts.items():
+      self.gapCounts[g] = self.gapCounts.get(g, 0) + n
+    for g, p in other.firstGap.items():
+      self.firstGap.setdefault(g, p)
+
+    # Tuples with their first prime in self and their last in other
+
+    ends = set(self.tail) | set(other.head)
+    for i, (name, offsets) in enumerate(primeTuplePatterns):
+      for p in self.tail:
+        if p + offsets[-1] > self.last and \
+           all(p + d in ends for d in offsets[1:]):
+          self.tupleCounts[i] += 1
+      self.tupleCounts[i] += other.tupleCounts[i]
+
+    self.n_primes += other.n_primes
+    self.head      = [p for p in self.head + other.head \
+                      if p <= self.first + primeTupleWindow]
+    self.tail      = [p for p in self.tail + other.tail \
+                      if p >= other.last - primeTupleWindow]
+    self.last      = other.last
+
+    return self
+
+    # end merge() /////////////////////////////////////////////////////////////
+
+  def maxGap(self):
+    '''Returns the largest gap (0 if there are fewer than 2 primes)'''
+    return self.records[-1][0] if self.records else 0
+
+  def tupleTotals(self):
+    '''Returns [(name, count), ...], summed over patterns with one name'''
+    totals = OrderedDict()
+    for (name, offsets), n in zip(primeTuplePatterns, self.tupleCounts):
+      totals[name] = totals.get(name, 0) + n
+    return list(totals.items())
+
+  # end class GapStats ////////////////////////////////////////////////////////
+
+#------------------------------------------------------------------------------
+# Parallel gap statistics
+#
+# As parallelSieve(), but each worker process returns the GapStats of
+# its chunk instead of its primes, so only the boundary state of each
+# chunk comes back to be merged.
+#------------------------------------------------------------------------------
+
+def gapStatsChunk( lo, hi ):
+  '''Returns the GapStats of [lo, hi] (runs in a worker process)'''
+  stats = GapStats()
+  for primes in segmentedSieve(lo, hi, basePrimes=workerBasePrimes):
+    stats.add(primes)
+  return stats
+
+def parallelGapStats( lo, hi, workers=None, chunkSize=None ):
+  '''Returns the GapStats of [lo, hi], computed in parallel'''
+
+  global parallelChunkSize
+
+  from concurrent.futures import ProcessPoolExecutor
+
+  if workers == None:
+    workers = os.cpu_count() or 1
+  if chunkSize == None:
+    chunkSize = parallelChunkSize
+
+  stats = GapStats()
+
+  if hi < 2 or hi < lo:
+    return stats
+
+  basePrimes = sieveBasePrimes(math.isqrt(hi))
+
+  executor = ProcessPoolExecutor(max_workers=workers, \
+    initializer=initSieveWorker, initargs=(basePrimes,))
+  pending  = deque()
+
+  try:
+    for a in range(lo, hi + 1, chunkSize):
+      pending.append(\
+        executor.submit(gapStatsChunk, a, min(a+chunkSize-1, hi)))
+      if len(pending) >= 2*workers:
+        stats.merge(pending.popleft().result())
+    while pending:
+      stats.merge(pending.popleft().result())
+  finally:
+    executor.shutdown(cancel_futures=True)
+
+  return stats
+
+  # end parallelGapStats()
+
+
+#------------------------------------------------------------------------------
+# Queries
+#
+# A query is one line of text: a JSON object such as
+#
+#   {"id": 7, "op": "count", "a": 0, "b": 1000000}
+#
+# or the same as plain words, "count 0 1000000", whose id is then its
+# line number. queryOps lists the operations and their (integer, >= 0)
+# arguments; the answer to a query is {"id": ..., "result": ...} or
+# {"id": ..., "error": "..."}. Queries are read from "-i|--input_filename"
+# by primes.py (see batchQueries()) and from a socket by primesserver.py.
+#------------------------------------------------------------------------------
+
+queryOps = { \
+  'ping'       : [], \
+  'version'    : [], \
+  'is_prime'   : ['n'], \
+  'next_prime' : ['n'], \
+  'prev_prime' : ['n'], \
+  'factorize'  : ['n'], \
+  'nth_prime'  : ['k'], \
+  'prime_pi'   : ['x'], \
+  'count'      : ['a', 'b'], \
+  'primes'     : ['a', 'b'] }
+
+# batchQueries() reads queryBatchSize queries at a time. Of those, the
+# "count" and "primes" queries narrower than queryCoalesceSpan are
+# sorted, and ranges closer than queryCoalesceGap are sieved together,
+# in spans of at most queryCoalesceSpan integers.
+
+queryBatchSize      = 2**14
+queryCoalesceSpan   = 2**22
+queryCoalesceGap    = 2**16
+
+def parseQuery( line, lineNum ):
+  '''Returns (id, op, args) of one query line; raises ValueError'''
+
+  global queryOps
+
+  import json
+
+  line = line.strip()
+
+  if line.startswith('{'):
+    try:
+      query = json.loads(line)
+    except json.JSONDecodeError as e:
+      raise ValueError('invalid JSON : '+str(e))
+    if not isinstance(query, dict):
+      raise ValueError('query must be a JSON object')
+    queryId = query.get('id', lineNum)
+    op      = query.get('op')
+    if not op in queryOps:
+      raise ValueError('unknown op "'+str(op)+'" : valid ops are : '+\
+                       str(list(queryOps)))
+    values = [query.get(name) for name in queryOps[op]]
+  else:
+    words   = line.split()
+    queryId = lineNum
+    op      = words[0] if words else None
+    if not op in queryOps:
+      raise ValueError('unknown op "'+str(op)+'" : valid ops are : '+\
+                       str(list(queryOps)))
+    values = words[1:]
+    if len(values) != len(queryOps[op]):
+      raise ValueError('op "'+op+'" takes '+str(len(queryOps[op]))+\
+                       ' arguments : '+str(queryOps[op]))
+
+  args = []
+  for name, value in zip(queryOps[op], values):
+    try:
+      if isinstance(value, bool) or isinstance(value, float):
+        raise ValueError
+      args.append(int(value))
+    except (TypeError, ValueError):
+      raise ValueError('argument "'+name+'" of op "'+op+'" must be an '+\
+                       'integer, not '+json.dumps(value))
+    if args[-1] < 0:
+      raise ValueError('argument "'+name+'" of op "'+op+'" must be >= 0')
+
+  return queryId, op, args
+
+  # end parseQuery()
+
+def answerQuery( op, args ):
+  '''Returns the result of one query (args as from parseQuery())'''
+
+  global thisProgramVersion
+
+  if op == 'ping':
+    return 'pong'
+  if op == 'version':
+    return thisProgramVersion
+  if op == 'is_prime':
+    return is_prime(args[0])
+  if op == 'next_prime':
+    return next_prime(args[0])
+  if op == 'prev_prime':
+    return prev_prime(args[0])
+  if op == 'factorize':
+    return [list(f) for f in factorize(args[0])]
+  if op == 'nth_prime':
+    return nth_prime(args[0])
+  if op == 'prime_pi':
+    return prime_pi(args[0])
+
+  a, b = args
+
+  if op == 'count':
+    return count_primes(a, b, 1)
+
+  result = []
+  if b >= a:
+    chunks = millerRabinPrimes(a, b) if useMillerRabin(a, b, cSieve=True) else \
+             cSieve(a, b)
+    for primes in chunks:
+      result.extend(primes)
+  return result
+
+  # end answerQuery()
+
+def queryError( e ):
+  '''Returns the message of an exception raised by a query'''
+
+  # Only the error lines of an ArgumentError, not its call stack
+
+  if isinstance(e, ArgumentError):
+    errLines = str(e).strip().split('\n')[2:]
+    return ' '.join(l.strip() for l in errLines)
+  return str(e)
+
+  # end queryError()
+
+#------------------------------------------------------------------------------
+# coalesceRanges(), answerSpan()
+#
+# Range queries answered together: ranges is a list of (a, b, key, op)
+# with op "count", "primes" or "is_prime" (a point, a == b).
+# coalesceRanges() sorts them and yields (lo, hi, group) for every run
+# of ranges that overlap or lie within queryCoalesceGap of each other,
+# spanning at most queryCoalesceSpan integers. answerSpan() cuts the
+# answer to each query of a group out of one list of the primes in
+# [lo, hi] (chunks), and returns the (key, result) pairs.
+#------------------------------------------------------------------------------
+
+def coalesceRanges( ranges ):
+  '''Yields (lo, hi, group) for each run of close ranges'''
+
+  global queryCoalesceGap, queryCoalesceSpan
+
+  ranges.sort()
+
+  k = 0
+  while k < len(ranges):
+    lo, hi = ranges[k][0], ranges[k][1]
+    n = k + 1
+    while n < len(ranges) and \
+          ranges[n][0] <= hi + queryCoalesceGap and \
+          max(hi, ranges[n][1]) - lo < queryCoalesceSpan:
+      hi = max(hi, ranges[n][1])
+      n += 1
+    yield lo, hi, ranges[k:n]
+    k = n
+
+  # end coalesceRanges()
+
+def answerSpan( chunks, group ):
+  '''Returns [(key, result)] for group, from the primes of its span'''
+
+  span = []
+  for primes in chunks:
+    span.extend(primes)
+
+  results = []
+  for a, b, key, op in group:
+    first = bisect_left(span, a)
+    last  = bisect_right(span, b)
+    if op == 'count':
+      results.append((key, last - first))
+    elif op == 'is_prime':
+      results.append((key, last > first))
+    else:
+      results.append((key, span[first:last]))
+
+  return results
+
+  # end answerSpan()
+
+#------------------------------------------------------------------------------
+# batchQueries()
+#
+# Generator that answers the queries read from the lines of inFile, and
+# yields the answers (see "Queries" above) in the order of the queries.
+# Lines are read queryBatchSize at a time. The narrow "count" and
+# "primes" queries of a batch are sorted by range and those that
+# overlap or lie close together are answered from one sieve of the
+# span that covers them, with base primes that are kept from batch to
+# batch (and only sieved further when a larger range needs them).
+# Other queries are answered one at a time by answerQuery().
+#------------------------------------------------------------------------------
+
+def batchQueries( inFile ):
+  '''Yields the answers to the queries in inFile, in order'''
+
+  global queryBatchSize, queryCoalesceSpan
+
+  basePrimes = []
+  lines      = enumerate(inFile, 1)
+
+  while True:
+    batch = list(islice(lines, queryBatchSize))
+    if not batch:
+      break
+
+    answers = [None]*len(batch)
+    ranges  = []
+
+    for i, (lineNum, line) in enumerate(batch):
+      if not line.strip():
+        continue
+      queryId = lineNum
+      try:
+        queryId, op, args = parseQuery(line, lineNum)
+        if op in ('count', 'primes') and \
+           0 <= args[1] - args[0] < queryCoalesceSpan and \
+           not useMillerRabin(args[0], args[1]):
+          ranges.append((args[0], args[1], i, op))
+          answers[i] = {'id' : queryId}
+        else:
+          answers[i] = {'id' : queryId, 'result' : answerQuery(op, args)}
+      except Exception as e:
+        answers[i] = {'id' : queryId, 'error' : queryError(e)}
+
+    # Sieve each span of close ranges once, then cut every query's
+    # primes out of it
+
+    for lo, hi, group in coalesceRanges(ranges):
+      if math.isqrt(hi) > (basePrimes[-1] if basePrimes else 1):
+        basePrimes = sieveBasePrimes(max(math.isqrt(hi), 2*math.isqrt(lo)))
+      chunks = segmentedSieve(lo, hi, basePrimes=basePrimes)
+      for i, result in answerSpan(chunks, group):
+        answers[i]['result'] = result
+
+    for answer in answers:
+      if answer != None:
+        yield answer
+
+  # end batchQueries()
+
+
+#------------------------------------------------------------------------------
+# class PrimesWriter
+#
+# Output stage for prime numbers. Primes are collected and formatted in
+# batches of outputBatchSize lines, and each batch is handed to the
+# output stream with a single write() call, instead of one print() and
+# flush per prime.
+#------------------------------------------------------------------------------
+
+class PrimesWriter(object):
+  '''Writes prime numbers to a text stream in large batches'''
+
+  def __init__(self, outFile=None, annotate=True, batchSize=None):
+
+    global outputBatchSize
+
+    if outFile == None:
+      outFile = sys.stdout
+    if batchSize == None:
+      batchSize = outputBatchSize
+
+    self.out_file   = outFile
+    self.annotate   = annotate
+    self.batch_size = batchSize
+    self.buf        = []
+
+  #--- Queue one prime; i_div is the number of divisions it took
+
+  def write(self, x, i_div=None):
+    if self.annotate and i_div != None:
+      self.buf.append(str(x)+' ['+str(i_div)+']')
+    else:
+      self.buf.append(str(x))
+    if len(self.buf) >= self.batch_size:
+      self.writeBuffer()
+
+  #--- Write a list of primes (never annotated)
+
+  def writeChunk(self, primes):
+    if self.buf:
+      self.writeBuffer()
+    if primes:
+      self.out_file.write('\n'.join(map(str, primes))+'\n')
+
+  #--- Hand the queued lines to the output stream
+
+  def writeBuffer(self):
+    if self.buf:
+      self.buf.append('')
+      self.out_file.write('\n'.join(self.buf))
+      self.buf = []
+
+  def flush(self):
+    self.writeBuffer()
+    self.out_file.flush()
+
+  # end class PrimesWriter ////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# class Checkpoint
+#
+# Saves and restores the progress of a search (see PrimesGenerator::
+# saveCheckpoint()) as a small JSON file. save() writes a temporary file
+# next to the checkpoint file, syncs it to disk, then renames it over
+# the old one, so the file on disk is always a complete checkpoint. due()
+# tells the search when the next save is "interval" seconds away.
+#------------------------------------------------------------------------------
+
+class Checkpoint(object):
+  '''Periodically saved state of a search'''
+
+  def __init__(self, filename, interval=None):
+
+    global checkpointInterval
+
+    if interval == None:
+      interval = checkpointInterval
+
+    self.filename = filename
+    self.interval = interval
+    self.t_next   = time.monotonic() + interval
+
+  def due(self):
+    return time.monotonic() >= self.t_next
+
+  def load(self):
+    '''Returns the saved state (None if there is no checkpoint file)'''
+    import json
+    try:
+      with open(self.filename, 'r') as f:
+        return json.load(f)
+    except FileNotFoundError:
+      return None
+
+  def save(self, state):
+    '''Atomically replaces the checkpoint file with "state"'''
+
+    import json
+
+    tmpFilename = self.filename+'.tmp'
+    with open(tmpFilename, 'w') as f:
+      json.dump(state, f, indent=2)
+      f.write('\n')
+      f.flush()
+      os.fsync(f.fileno())
+    os.replace(tmpFilename, self.filename)
+
+    self.t_next = time.monotonic() + self.interval
+
+  # end class Checkpoint //////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# class Metrics
+#
+# Counters and phase timers of a search (see PrimesGenerator.metrics).
+# The engines add to the counters as they go; candidates and divisions
+# are counted by trial division only, segments are the lists of primes
+# produced by iter_prime_chunks(). Phases are timed with perf_counter_ns:
+#
+#   t_ns = metrics.start()
+#   ...
+#   metrics.stop('search', t_ns)
+#------------------------------------------------------------------------------
+
+class Metrics(object):
+  '''Counters and phase timers of a search'''
+
+  def __init__(self):
+    self.candidates = 0
+    self.divisions  = 0
+    self.primes     = 0
+    self.segments   = 0
+    self.phase_ns   = {}
+    self.t_start_ns = time.perf_counter_ns()
+
+  def start(self):
+    return time.perf_counter_ns()
+
+  def stop(self, phase, t_ns):
+    '''Adds the time since t_ns (from start()) to "phase"'''
+    self.phase_ns[phase] = \
+      self.phase_ns.get(phase, 0) + time.perf_counter_ns() - t_ns
+
+  def elapsed(self):
+    '''Returns the seconds since the metrics were created'''
+    return (time.perf_counter_ns() - self.t_start_ns)/1e9
+
+  def snapshot(self, x=None):
+    '''Returns the metrics as a dictionary; x is the search position'''
+
+    elapsed = self.elapsed()
+
+    return { \
+      'elapsed_s'    : elapsed, \
+      'x'            : x, \
+      'primes'       : self.primes, \
+      'candidates'   : self.candidates, \
+      'divisions'    : self.divisions, \
+      'segments'     : self.segments, \
+      'primes_per_s' : self.primes/elapsed if elapsed > 0 else None, \
+      'phase_s'      : {k: v/1e9 for k, v in self.phase_ns.items()} }
+
+  # end class Metrics /////////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# class ProgressReporter
+#
+# Progress callback for PrimesGenerator.progress: called as
+# reporter(event, metrics, x) with event "progress" every progress
+# interval and "done" at the end of a search. Writes one line of text
+# per call to STDERR, or one JSON object per line to a progress file.
+#------------------------------------------------------------------------------
+
+class ProgressReporter(object):
+  '''Writes progress reports to STDERR or a JSON-lines file'''
+
+  def __init__(self, outFile=None):
+
+    self.out_file   = outFile
+    self.json_lines = outFile != None
+
+    if outFile == None:
+      self.out_file = sys.stderr
+
+  def __call__(self, event, metrics, x):
+
+    report = metrics.snapshot(x)
+
+    if self.json_lines:
+      import json
+      report['event'] = event
+      self.out_file.write(json.dumps(report)+'\n')
+    else:
+      rate = report['primes_per_s']
+      self.out_file.write(\
+        event+': x = '+str(x)+\
+        ', primes = '+str(report['primes'])+\
+        ', divisions = '+str(report['divisions'])+\
+        ', elapsed = '+('%.3f' % report['elapsed_s'])+' s'+\
+        ', primes/s = '+('%.0f' % rate if rate != None else '-')+'\n')
+
+    self.out_file.flush()
+
+  # end class ProgressReporter ////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# class PrimesGenerator
+#------------------------------------------------------------------------------
+
+class PrimesGenerator(object):
+  '''Generates prime numbers between args.start_search and args.end_search'''
+
+  def __init__(self, runParams=None):
+
+    #==================================
+    # Class Properties:
+    #   - include setter, getter
+    #   - may be checked at assign time
+    #==================================
+
+    self.__run_params   = None
+
+    #==========================
+    # Class variables
     #   - direct access
     #   - no checking performed
     #==========================
@@ -502,6 +3501,20 @@ class PrimesGenerator(object):
 
     self.buf = []
 
+    # Counters and timers of the current search, and its checkpoint (if
+    # any). progress is called every progress_interval seconds during a
+    # search (see class ProgressReporter); None turns reports off.
+
+    self.metrics    = Metrics()
+    self.checkpoint = None
+    self.progress   = None
+    self.progress_interval = progressInterval
+    self.t_progress = 0.0
+
+    # Range cache used by iter_prime_chunks() (see class RangeCache)
+
+    self.cache      = None
+
     # Perform initializations
 
     self.run_params = runParams
@@ -516,81 +3529,1278 @@ class PrimesGenerator(object):
   def run_params(self, value):
     self.__run_params = value
 
+  #--- Run mode of this generator (DEFAULT when there are no run parameters)
+
+  def runMode(self):
+    '''Returns the run mode selected in the run parameters'''
+    if self.run_params == None or self.run_params.run_mode == None:
+      return 'DEFAULT'
+    return self.run_params.run_mode
+
+  #--- Trial division engine
+
+  def iterTrialDivision(self, i_start, i_end):
+    '''Yields (x, i_div) for each odd x in [i_start, i_end] with no divisor'''
+
+    # Every odd x is divided by 3, 5, 7, ... up to sqrt(x); i_div is the
+    # number of divisions performed since the previous prime was found.
+    # An i_end of None searches forever.
+
+    if self.runMode() == 'TRIAL_PRIMES':
+      yield from self.iterPrimeTrialDivision(i_start, i_end)
+      return
+
+    if self.run_params != None and self.run_params.wheel != 2:
+      yield from self.iterWheelTrialDivision(\
+        i_start, i_end, self.run_params.wheel)
+      return
+
+    if i_start % 2 == 0:
+      i_start += 1
+
+    metrics = self.metrics
+    x       = i_start
+    i_div   = 0
+    n_cand  = 0
+
+    while i_end == None or x <= i_end:
+      n_cand += 1
+      max_divisor = int(math.sqrt(x))
+      if max_divisor % 2 == 0:
+        max_divisor += 1
+      d = 3
+      remainder = -1
+      while (d <= max_divisor) and (remainder != 0):
+        remainder = x % d
+        d += 2
+        i_div += 1
+      if remainder != 0:
+        metrics.candidates += n_cand
+        metrics.divisions  += i_div
+        n_cand = 0
+        yield x, i_div
+        i_div = 0
+      x += 2
+      # end while i_end == None or x <= i_end
+
+    metrics.candidates += n_cand
+    metrics.divisions  += i_div
+
+    # end iterTrialDivision() /////////////////////////////////////////////////
+
+  #--- Trial division engine, wheel factorization version
+
+  def iterWheelTrialDivision(self, i_start, i_end, modulus):
+    '''iterTrialDivision() with candidates and divisors from a wheel'''
+
+    # Only integers prime to the wheel modulus (30 or 210) are tested,
+    # and only by divisors that are themselves prime to the modulus,
+    # starting with the smallest one after 1 (7 or 11); the odd primes
+    # dividing the modulus (3, 5 and 7) are reported as they are passed.
+    # This yields the same values as the 2-wheel, with about 2.5 (30)
+    # or 3 (210) times fewer candidates and divisions.
+
+    residues, gaps = wheelTables(modulus)
+    n_res = len(residues)
+
+    wheelPrimes = [p for p in (3, 5, 7) \
+      if modulus % p == 0 and p >= i_start and (i_end == None or p <= i_end)]
+
+    # First candidate: the smallest integer >= i_start prime to modulus
+
+    base = modulus*(max(i_start, 0)//modulus)
+    k    = 0
+    while base + residues[k] < i_start:
+      k += 1
+      if k == n_res:
+        k     = 0
+        base += modulus
+
+    metrics = self.metrics
+    x       = base + residues[k]
+    i_div   = 0
+    n_cand  = 0
+
+    while i_end == None or x <= i_end:
+      while wheelPrimes and wheelPrimes[0] < x:
+        metrics.divisions += i_div
+        yield wheelPrimes.pop(0), i_div
+        i_div = 0
+      n_cand += 1
+      max_divisor = math.isqrt(x)
+      d = residues[1]
+      j = 1
+      remainder = -1
+      while (d <= max_divisor) and (remainder != 0):
+        remainder = x % d
+        i_div += 1
+        d += gaps[j]
+        j += 1
+        if j == n_res:
+          j = 0
+      if remainder != 0:
+        metrics.candidates += n_cand
+        metrics.divisions  += i_div
+        n_cand = 0
+        yield x, i_div
+        i_div = 0
+      x += gaps[k]
+      k += 1
+      if k == n_res:
+        k = 0
+      # end while i_end == None or x <= i_end
+
+    metrics.candidates += n_cand
+
+    for p in wheelPrimes:
+      metrics.divisions += i_div
+      yield p, i_div
+      i_div = 0
+
+    metrics.divisions += i_div
+
+    # end iterWheelTrialDivision() ////////////////////////////////////////////
+
+  #--- Trial division engine, prime divisors only
+
+  def iterPrimeTrialDivision(self, i_start, i_end):
+    '''iterTrialDivision() dividing only by the primes in primeCache'''
+
+    # Divisors are taken from the shared PrimeCache, which this run
+    # extends with the primes it finds. Should sqrt(x) outgrow a full
+    # cache, the odd numbers after the last cached prime are used.
+
+    global primeCache
+
+    if primeCache == None:
+      primeCache = PrimeCache()
+    cache = primeCache
+
+    if i_start % 2 == 0:
+      i_start += 1
+
+    metrics = self.metrics
+    x       = i_start
+    i_div   = 0
+    n_cand  = 0
+
+    while i_end == None or x <= i_end:
+      n_cand += 1
+      max_divisor = math.isqrt(x)
+      if max_divisor > cache.limit:
+        cache.extend(max_divisor)
+      remainder = -1
+      for d in cache.primes:
+        if d > max_divisor:
+          break
+        remainder = x % d
+        i_div += 1
+        if remainder == 0:
+          break
+      if remainder != 0 and max_divisor > cache.limit:
+        d = cache.limit + 1 + cache.limit % 2
+        while (d <= max_divisor) and (remainder != 0):
+          remainder = x % d
+          d += 2
+          i_div += 1
+      cache.discovered(x, remainder != 0)
+      if remainder != 0:
+        metrics.candidates += n_cand
+        metrics.divisions  += i_div
+        n_cand = 0
+        yield x, i_div
+        i_div = 0
+      x += 2
+      # end while i_end == None or x <= i_end
+
+    metrics.candidates += n_cand
+    metrics.divisions  += i_div
+
+    # end iterPrimeTrialDivision() ////////////////////////////////////////////
+
+  #--- Streaming (no I/O) access to prime numbers
+
+  def iter_prime_chunks(self, start, end, chunkSize=None):
+    '''Yields lists of the primes in [start, end] in increasing order'''
+
+    # An end of None yields primes forever (from the unbounded sieve in
+    # most run modes). chunkSize bounds the length of the lists produced
+    # by the trial division engine; the sieve yields one list per segment.
+
+    # The sieve run modes go through the range cache, if there is one
+    # (not for high, narrow ranges, where Miller-Rabin is quicker than
+    # sieving a whole block).
+
+    metrics = self.metrics
+
+    if self.cache != None and end != None and \
+       self.runMode() in sieveRunModes and \
+       not useMillerRabin(start, end, self.runMode() == 'CTYPES'):
+      chunks = self.cache.primeChunks(start, end, self.iterSieveChunks)
+    else:
+      chunks = self.iterEngineChunks(start, end, chunkSize)
+
+    for primes in chunks:
+      metrics.primes   += len(primes)
+      metrics.segments += 1
+      yield primes
+
+    # end iter_prime_chunks() /////////////////////////////////////////////////
+
+  def iterEngineChunks(self, start, end, chunkSize=None):
+    '''iter_prime_chunks() from the engine selected by the run mode'''
+
+    global primesChunkSize
+
+    if chunkSize == None:
+      chunkSize = primesChunkSize
+
+    if end != None and end < start:
+      return
+
+    if self.runMode() == 'MILLER_RABIN' or (end != None and \
+       useMillerRabin(start, end, self.runMode() == 'CTYPES')):
+      yield from millerRabinPrimes(start, end, chunkSize)
+      return
+
+    # Open-ended streams come from the unbounded sieve, except in the
+    # "TRIAL_PRIMES" run mode (which is there to grow the prime cache)
+
+    if end == None and self.runMode() != 'TRIAL_PRIMES':
+      yield from unboundedSieve(start)
+      return
+
+    if self.runMode() in sieveRunModes and end != None:
+      yield from self.iterSieveChunks(start, end)
+      return
+
+    if start <= 2 and (end == None or end >= 2):
+      yield [2]
+
+    chunk = []
+    for x, i_div in self.iterTrialDivision(start, end):
+      if x > 1:
+        chunk.append(x)
+        if len(chunk) >= chunkSize:
+          yield chunk
+          chunk = []
+
+    if chunk:
+      yield chunk
+
+    # end iterEngineChunks() //////////////////////////////////////////////////
+
+  def iterSieveChunks(self, start, end):
+    '''Yields lists of the primes in [start, end] from the run mode's sieve'''
+
+    if self.runMode() == 'NUMPY':
+      yield from numpySieve(start, end)
+    elif self.runMode() == 'PARALLEL':
+      yield from parallelSieve(start, end, self.run_params.workers)
+    elif self.runMode() == 'CTYPES':
+      yield from cSieve(start, end)
+    else:
+      yield from segmentedSieve(start, end)
+
+  def iter_primes(self, start, end):
+    '''Yields the primes in [start, end] one at a time'''
+    for primes in self.iter_prime_chunks(start, end):
+      yield from primes
+
+  def iter_primes_unbounded(self, start):
+    '''Yields the primes >= start one at a time, forever'''
+    return self.iter_primes(start, None)
+
   #--- Print out prime numbers
 
   def printPrimes(self):
     '''Prints out prime numbers'''
 
+    self.metrics = Metrics()
+    t_ns = self.metrics.start()
+
     i_start = self.run_params.start_search
     i_end   = self.run_params.end_search
 
     if i_end != None:
       if i_end <= i_start:
         self.errors += 1
-        errMsg   = 'end_search = '+str(end_search)+' <= '
-        errMsg  += 'start_search = '+str(start_search)
+        errMsg   = 'end_search = '+str(i_end)+' <= '
+        errMsg  += 'start_search = '+str(i_start)
         errInfo  = ['printPrimes', errMsg]
         self.errList.append(errInfo)
         raise ArgumentError('pyapplib.py - ',self.errList)
 
+    self.startProgress()
+
+    if self.run_params.cache_dir != None:
+      self.cache = RangeCache(self.run_params.cache_dir, \
+        self.run_params.cache_max_bytes, self.run_params.cache_memory_blocks)
+
+    if self.run_params.nth_prime != None:
+      self.printNthPrime(self.run_params.nth_prime)
+      return
+
+    if self.run_params.input_file != None:
+      self.answerQueries()
+      return
+
+    if self.runMode() == 'COUNT':
+      self.printPrimeCount(i_start, i_end)
+      return
+
+    if self.runMode() == 'FACTOR':
+      self.printFactors(i_start, i_end)
+      return
+
+    if self.runMode() in ('GAPS', 'TUPLES'):
+      self.printPrimeGaps(i_start, i_end)
+      return
+
+    if self.run_params.output_format == 'TABLE':
+      self.writePrimeTable(i_start, i_end)
+      return
+
+    # An open-ended search in a sieve run mode uses the unbounded sieve
+    # (see iterEngineChunks()). High, narrow ranges are searched with
+    # Miller-Rabin in every run mode.
+
+    useSieve = self.runMode() == 'MILLER_RABIN' or \
+      self.runMode() in sieveRunModes or \
+      (i_end != None and useMillerRabin(i_start, i_end))
+
+    # With "-r|--resume", continue from the last checkpoint
+
+    i_start = self.startCheckpointing(i_start, i_end)
+
+    self.metrics.stop('setup', t_ns)
+
+    if useSieve:
+      self.printPrimesSieve(i_start, i_end)
+      return
+
     # i_start must be an odd number
     if i_start % 2 == 0:
       i_start += 1
 
-    x = i_start
+    # Checkpoints and progress reports are looked at once every
+    # checkpointCheckEvery primes; the "search" phase includes the
+    # formatting of the output and any checkpoints.
 
-    print('DEBUG: i_start = '+str(i_start))
-    print('DEBUG: i_end   = '+str(i_end))
+    writer   = self.outputWriter()
+    metrics  = self.metrics
+    periodic = self.checkpoint != None or self.progress != None
+    x        = None
 
-    i_div = 0
-    i_div_tot = 0
+    t_ns = metrics.start()
+    try:
+      for x, i_div in self.iterTrialDivision(i_start, i_end):
+        writer.write(x, i_div)
+        metrics.primes += 1
+        if periodic and metrics.primes % checkpointCheckEvery == 0:
+          self.periodicTasks(writer, x + 1)
+    except KeyboardInterrupt:
+      if self.checkpoint != None and x != None:
+        self.saveCheckpoint(writer, x + 1)
+      raise
+    finally:
+      metrics.stop('search', t_ns)
 
-    if i_end != None:
+    t_ns = metrics.start()
+    writer.flush()
+    metrics.stop('output', t_ns)
 
-      while(x <= i_end):
-        max_divisor = int(math.sqrt(x))
-        if max_divisor % 2 == 0:
-          max_divisor += 1
-        d = 3
-        remainder = -1
-        while (d <= max_divisor) and (remainder != 0):
-          remainder = x % d
-          d += 2
-          i_div += 1
-        if remainder != 0:
-          print(str(x)+' ['+str(i_div)+']')
-          i_div_tot += i_div
-          i_div = 0
-        x += 2
-        # end while(x <= i_end)
+    if self.checkpoint != None and i_end != None:
+      self.saveCheckpoint(writer, i_end + 1)
+
+    self.reportProgress('done', i_end + 1 if i_end != None else x)
+
+    elapsed = metrics.elapsed()
+
+    print('total divisors tested = '+str(metrics.divisions))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+    print('divisors per second   = '+str(metrics.divisions / elapsed))
+
+    # end printPrimes() ///////////////////////////////////////////////////////
+
+  #--- Output stage: "-o|--output_filename" if given, else STDOUT
+
+  def outputWriter(self):
+    '''Returns a PrimesWriter for the run parameters' output file'''
+
+    outFile  = None
+    annotate = True
+
+    if self.run_params != None:
+      outFile  = self.run_params.output_file
+      annotate = self.run_params.annotate
+
+    # Anything already printed to STDOUT must come out first
+
+    sys.stdout.flush()
+
+    return PrimesWriter(outFile, annotate)
+
+  #--- Progress reports ("-p|--progress", "-P|--progress_filename")
+
+  def startProgress(self):
+    '''Sets up progress reports as asked for by the run parameters'''
+
+    rp = self.run_params
+
+    if rp.progress_interval != None:
+      self.progress          = ProgressReporter(rp.progress_file)
+      self.progress_interval = rp.progress_interval
+
+    self.t_progress = time.monotonic() + self.progress_interval
+
+  def reportProgress(self, event, x):
+    '''Calls the progress callback (if any); x is the search position'''
+    if self.progress != None:
+      self.progress(event, self.metrics, x)
+      self.t_progress = time.monotonic() + self.progress_interval
+
+  def periodicTasks(self, writer, x):
+    '''Saves a checkpoint and reports progress when they are due'''
+    if self.checkpoint != None and self.checkpoint.due():
+      self.saveCheckpoint(writer, x)
+    if self.progress != None and time.monotonic() >= self.t_progress:
+      self.reportProgress('progress', x)
+
+  #--- Checkpointing ("-C|--checkpoint", "-r|--resume")
+
+  def startCheckpointing(self, i_start, i_end):
+    '''Sets up the checkpoint; returns the integer to start searching at'''
+
+    # A checkpoint records x, the first integer not yet searched, once
+    # every prime < x has been written (and synced) to the output file,
+    # together with the running totals and the size of the output file
+    # at that point. Resuming truncates the output file back to that
+    # size, so primes written after the checkpoint are not repeated.
+
+    self.checkpoint = None
+
+    if self.run_params.checkpoint_filename == None:
+      return i_start
+
+    self.checkpoint = Checkpoint(\
+      self.run_params.checkpoint_filename, \
+      self.run_params.checkpoint_interval)
+
+    if not self.run_params.resume:
+      return i_start
+
+    # No checkpoint was saved before the last run stopped: start over,
+    # discarding whatever that run wrote to the output file
+
+    state = self.checkpoint.load()
+    if state == None:
+      if self.run_params.output_file != None:
+        self.run_params.output_file.truncate(0)
+      p_dbg('no checkpoint saved : starting at x = '+str(i_start))
+      return i_start
+
+    if state['start_search'] != self.run_params.start_search or \
+       state['end_search']   != self.run_params.end_search   or \
+       state['run_mode']     != self.runMode()               or \
+       state['wheel']        != self.run_params.wheel:
+      self.errors += 1
+      errMsg   = 'checkpoint "'+self.run_params.checkpoint_filename+'" '
+      errMsg  += 'is for a different search'
+      errInfo  = ['startCheckpointing', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.metrics.divisions  = state['i_div_tot']
+    self.metrics.primes     = state['primes']
+    self.metrics.candidates = state.get('candidates', 0)
+
+    outFile = self.run_params.output_file
+    if outFile != None and state['output_bytes'] != None:
+      outFile.truncate(state['output_bytes'])
+
+    p_dbg('resuming at x = '+str(state['x']))
 
+    return state['x']
+
+    # end startCheckpointing() ////////////////////////////////////////////////
+
+  def saveCheckpoint(self, writer, x):
+    '''Saves a checkpoint: all primes < x have been found'''
+
+    t_ns = self.metrics.start()
+
+    writer.flush()
+
+    outFile     = self.run_params.output_file
+    outputBytes = None
+    if outFile != None:
+      os.fsync(outFile.fileno())
+      outputBytes = outFile.tell()
+
+    self.checkpoint.save({ \
+      'start_search' : self.run_params.start_search, \
+      'end_search'   : self.run_params.end_search, \
+      'run_mode'     : self.runMode(), \
+      'wheel'        : self.run_params.wheel, \
+      'x'            : x, \
+      'i_div_tot'    : self.metrics.divisions, \
+      'primes'       : self.metrics.primes, \
+      'candidates'   : self.metrics.candidates, \
+      'output_bytes' : outputBytes })
+
+    self.metrics.stop('checkpoint', t_ns)
+
+    # end saveCheckpoint() ////////////////////////////////////////////////////
+
+  #--- Print out prime numbers found by a sieve (or Miller-Rabin)
+
+  def printPrimesSieve(self, i_start, i_end):
+    '''Prints out prime numbers found by iter_prime_chunks()'''
+
+    # Time spent producing each list of primes counts as "search",
+    # time spent writing it out as "output"
+
+    writer   = self.outputWriter()
+    metrics  = self.metrics
+    periodic = self.checkpoint != None or self.progress != None
+    x        = None
+
+    try:
+      t_ns = metrics.start()
+      for primes in self.iter_prime_chunks(i_start, i_end):
+        metrics.stop('search', t_ns)
+        t_ns = metrics.start()
+        writer.writeChunk(primes)
+        metrics.stop('output', t_ns)
+        if primes:
+          x = primes[-1]
+        if periodic and x != None:
+          self.periodicTasks(writer, x + 1)
+        t_ns = metrics.start()
+      metrics.stop('search', t_ns)
+    except KeyboardInterrupt:
+      if self.checkpoint != None and x != None:
+        self.saveCheckpoint(writer, x + 1)
+      raise
+
+    t_ns = metrics.start()
+    writer.flush()
+    metrics.stop('output', t_ns)
+
+    if self.checkpoint != None and i_end != None:
+      self.saveCheckpoint(writer, i_end + 1)
+
+    self.reportProgress('done', i_end + 1 if i_end != None else x)
+
+    elapsed = metrics.elapsed()
+
+    print('total primes found    = '+str(metrics.primes))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+    print('primes per second     = '+str(metrics.primes / elapsed))
+
+    # end printPrimesSieve() //////////////////////////////////////////////////
+
+  #--- Print out the number of primes in [i_start, i_end]
+
+  def printPrimeCount(self, i_start, i_end):
+    '''Prints out the number of primes between i_start and i_end'''
+
+    if i_end == None:
+      self.errors += 1
+      errMsg   = 'run mode "COUNT" requires -e|--end_search'
+      errInfo  = ['printPrimeCount', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    t_ns = self.metrics.start()
+    n_primes = count_primes(i_start, i_end)
+    self.metrics.stop('count', t_ns)
+
+    self.metrics.primes = n_primes
+    self.reportProgress('done', i_end + 1)
+
+    elapsed = self.metrics.elapsed()
+
+    print('total primes found    = '+str(n_primes))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+
+    # end printPrimeCount() ///////////////////////////////////////////////////
+
+  #--- Print out the factorization of every integer in [i_start, i_end]
+
+  def printFactors(self, i_start, i_end):
+    '''Prints out the prime factorizations of i_start..i_end'''
+
+    if i_end == None:
+      self.errors += 1
+      errMsg   = 'run mode "FACTOR" requires -e|--end_search'
+      errInfo  = ['printFactors', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    writer  = self.outputWriter()
+    metrics = self.metrics
+
+    t_ns = metrics.start()
+    for n, factors in factorRange(i_start, i_end):
+      writer.write(formatFactors(n, factors))
+      metrics.candidates += 1
+    writer.flush()
+    metrics.stop('factor', t_ns)
+
+    self.reportProgress('done', i_end + 1)
+
+    elapsed = metrics.elapsed()
+
+    print('total factorizations  = '+str(metrics.candidates))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+
+    # end printFactors() //////////////////////////////////////////////////////
+
+  #--- Print out prime gap or k-tuple statistics of [i_start, i_end]
+
+  def printPrimeGaps(self, i_start, i_end):
+    '''Prints out the gap ("GAPS") or k-tuple ("TUPLES") statistics'''
+
+    if i_end == None:
+      self.errors += 1
+      errMsg   = 'run mode "'+self.runMode()+'" requires -e|--end_search'
+      errInfo  = ['printPrimeGaps', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    # With "-w|--workers", chunks are analyzed by worker processes;
+    # otherwise the primes are streamed from the C sieve library (or the
+    # segmented sieve), or Miller-Rabin for high, narrow ranges
+
+    metrics = self.metrics
+    workers = self.run_params.workers
+
+    t_ns = metrics.start()
+    if workers != None and workers > 1 and not useMillerRabin(i_start, i_end):
+      stats = parallelGapStats(i_start, i_end, workers)
     else:
+      if useMillerRabin(i_start, i_end, cSieve=True):
+        chunks = millerRabinPrimes(i_start, i_end)
+      else:
+        chunks = cSieve(i_start, i_end)
+      stats = GapStats()
+      for primes in chunks:
+        stats.add(primes)
+        metrics.primes   += len(primes)
+        metrics.segments += 1
+        if self.progress != None and primes:
+          self.periodicTasks(None, primes[-1] + 1)
+    metrics.primes = stats.n_primes
+    metrics.stop('analysis', t_ns)
+
+    writer = self.outputWriter()
+
+    if self.runMode() == 'GAPS':
+      writer.write('maximal gaps (gap after_prime):')
+      for g, p in stats.records:
+        writer.write('  '+str(g)+' '+str(p))
+      writer.write('gap histogram (gap count first_prime):')
+      for g in sorted(stats.gapCounts):
+        writer.write('  '+str(g)+' '+str(stats.gapCounts[g])+' '+\
+                     str(stats.firstGap[g]))
+    else:
+      writer.write('prime k-tuples (pattern count):')
+      for (name, offsets), n in zip(primeTuplePatterns, stats.tupleCounts):
+        pattern = ', '.join('p' if d == 0 else 'p+'+str(d) for d in offsets)
+        writer.write('  '+name+' ('+pattern+') '+str(n))
+    writer.flush()
 
-      while(1):
-        max_divisor = int(math.sqrt(x))
-        if max_divisor % 2 == 0:
-          max_divisor += 1
-        d = 3
-        remainder = -1
-        while (d <= max_divisor) and (remainder != 0):
-          remainder = x % d
-          d += 2
-          i_div += 1
-        if remainder != 0:
-          print(str(x)+' ['+str(i_div)+']')
-          i_div_tot += i_div
-          i_div = 0
-        x += 2
-        # end while(1)
+    self.reportProgress('done', i_end + 1)
+
+    elapsed = metrics.elapsed()
 
-    t_now           = datetime.datetime.now()
-    t_since_start   = t_now - t_0
-    divs_per_second = i_div_tot / t_since_start.total_seconds()
+    print('total primes found    = '+str(stats.n_primes))
+    if self.runMode() == 'GAPS':
+      print('largest gap           = '+str(stats.maxGap()))
+    else:
+      for name, n in stats.tupleTotals():
+        print(('total '+name).ljust(22)+'= '+str(n))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
 
-    print('total divisors tested = '+str(i_div_tot))
-    print('total run time        = '+str(t_since_start))
-    print('divisors per second   = '+str(divs_per_second))
+    # end printPrimeGaps() ////////////////////////////////////////////////////
 
-    # end printPrimes() ///////////////////////////////////////////////////////
+  #--- Answer the queries read from "-i|--input_filename"
+
+  def answerQueries(self):
+    '''Writes the answers to the queries in the input file (JSON lines)'''
+
+    import json
+
+    writer  = self.outputWriter()
+    metrics = self.metrics
+    n_query = 0
+
+    t_ns = metrics.start()
+    for answer in batchQueries(self.run_params.input_file):
+      writer.write(json.dumps(answer))
+      n_query += 1
+    writer.flush()
+    metrics.stop('queries', t_ns)
+
+    self.reportProgress('done', None)
+
+    elapsed = metrics.elapsed()
+
+    print('total queries         = '+str(n_query))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+
+    # end answerQueries() /////////////////////////////////////////////////////
+
+  #--- Print out the k-th prime
+
+  def printNthPrime(self, k):
+    '''Prints out the k-th prime number'''
+
+    t_ns = self.metrics.start()
+    p = nth_prime(k)
+    self.metrics.stop('nth_prime', t_ns)
+
+    self.metrics.primes = k
+    self.reportProgress('done', p + 1)
+
+    elapsed = self.metrics.elapsed()
+
+    print(str(p))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+
+    # end printNthPrime() /////////////////////////////////////////////////////
+
+  #--- Write prime numbers to a binary prime table file
+
+  def writePrimeTable(self, i_start, i_end):
+    '''Writes the primes in [i_start, i_end] to a prime table file'''
+
+    if i_end == None or self.run_params.output_file == None:
+      self.errors += 1
+      errMsg   = 'output format "TABLE" requires both '
+      errMsg  += '-e|--end_search and -o|--output_filename'
+      errInfo  = ['writePrimeTable', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    # The "SIEVE" run mode writes the bitmaps of its wheel-30 sieve
+    # segments straight to the table
+
+    if self.runMode() == 'SIEVE' and self.cache == None and \
+       not useMillerRabin(i_start, i_end):
+      primeChunks = None
+    else:
+      primeChunks = self.iter_prime_chunks(i_start, i_end)
+
+    t_ns = self.metrics.start()
+    n_primes = writePrimeTable(\
+      self.run_params.output_file, i_start, i_end, primeChunks)
+    self.metrics.primes = n_primes
+
+    self.run_params.output_file.close()
+    self.metrics.stop('table', t_ns)
+
+    self.reportProgress('done', i_end + 1)
+
+    elapsed = self.metrics.elapsed()
+
+    print('total primes found    = '+str(n_primes))
+    print('total run time        = '+str(datetime.timedelta(seconds=elapsed)))
+
+    # end writePrimeTable() ///////////////////////////////////////////////////
 
   # end class PrimesGenerator /////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# Prime table file format
+#
+# A prime table holds every prime in [lo, hi] as a wheel-30 bitmap: one
+# byte per 30 consecutive integers, one bit for each of the 8 residues
+# mod 30 that are prime to 30 (see wheel30Residues). The primes 2, 3, 5
+# are implied by lo and hi. All integers are stored little-endian.
+#
+#   header  : tableHeaderFormat (see below)
+#   index   : nblocks x uint64, the number of bitmap primes that come
+#             before each block of blockBytes bitmap bytes
+#   bitmap  : nbytes bytes; byte i, bit j represents base + 30*i + R[j]
+#
+# Header fields: magic, format version, bytes per block, lo, hi, base
+# (= 30*(lo//30)), nbytes, nblocks.
+#------------------------------------------------------------------------------
+
+tableMagic        = b'PRMTAB30'
+tableVersion      = 1
+tableHeaderFormat = '<8sIIQQQQQ'
+tableHeaderSize   = struct.calcsize(tableHeaderFormat)
+tableBlockBytes   = 4096
+
+
+#------------------------------------------------------------------------------
+# writePrimeTable()
+#
+# Writes a prime table covering [lo, hi] to the binary file outFile.
+# primeChunks is an iterable of lists of primes (such as the output of
+# PrimesGenerator.iter_prime_chunks()) in increasing order. If it is
+# None, [lo, hi] is sieved with wheel30Segments() and the bitmaps of the
+# segments are written out as they are. Only one block (or segment) of
+# the bitmap is held in memory at a time; the index is written last,
+# into space reserved right after the header. Returns the number of
+# primes written.
+#------------------------------------------------------------------------------
+
+def writePrimeTable( outFile, lo, hi, primeChunks, blockBytes=None ):
+  '''Writes primes in [lo, hi] to outFile in prime table format'''
+
+  global tableBlockBytes, wheel30Bit
+
+  if blockBytes == None:
+    blockBytes = tableBlockBytes
+
+  lo      = max(lo, 0)
+  base    = 30*(lo//30)
+  nbytes  = hi//30 - base//30 + 1
+  nblocks = (nbytes + blockBytes - 1)//blockBytes
+
+  outFile.write(struct.pack(tableHeaderFormat, \
+    tableMagic, tableVersion, blockBytes, lo, hi, base, nbytes, nblocks))
+  outFile.write(bytes(8*nblocks))
+
+  if primeChunks == None:
+    return writeSievedTable(outFile, lo, hi, blockBytes, nblocks)
+
+  index      = [0]*nblocks
+  n_bitmap   = 0
+  n_primes   = 0
+  block_num  = 0
+  block_base = base
+  block_span = 30*blockBytes
+  block      = bytearray(min(blockBytes, nbytes))
+
+  for primes in primeChunks:
+    for p in primes:
+      if p < 7:
+        n_primes += 1
+        continue
+      while p >= block_base + block_span:
+        outFile.write(block)
+        block_num  += 1
+        block_base += block_span
+        index[block_num] = n_bitmap
+        block = bytearray(min(blockBytes, nbytes - block_num*blockBytes))
+      i, r = divmod(p - block_base, 30)
+      block[i] |= 1 << wheel30Bit[r]
+      n_bitmap += 1
+
+  # Write out the remaining blocks (the last may have no primes in it)
+
+  outFile.write(block)
+  while block_num < nblocks - 1:
+    block_num += 1
+    index[block_num] = n_bitmap
+    outFile.write(bytes(min(blockBytes, nbytes - block_num*blockBytes)))
+
+  outFile.seek(tableHeaderSize)
+  outFile.write(struct.pack('<'+str(nblocks)+'Q', *index))
+  outFile.flush()
+
+  return n_primes + n_bitmap
+
+  # end writePrimeTable()
+
+def writeSievedTable( outFile, lo, hi, blockBytes, nblocks ):
+  '''writePrimeTable() bitmap and index straight from the wheel-30 sieve'''
+
+  index    = []
+  n_bitmap = 0
+  pending  = bytearray()
+
+  for sieve in wheel30Segments(lo, hi):
+    pending += sieve.bits
+    if sieve.hi == hi:
+      full = len(pending)
+    else:
+      full = len(pending) - len(pending) % blockBytes
+    for i in range(0, full, blockBytes):
+      index.append(n_bitmap)
+      n_bitmap += int.from_bytes(pending[i:i + blockBytes], 'little').bit_count()
+    outFile.write(pending[:full])
+    del pending[:full]
+
+  outFile.seek(tableHeaderSize)
+  outFile.write(struct.pack('<'+str(nblocks)+'Q', *index))
+  outFile.flush()
+
+  return len([p for p in (2, 3, 5) if lo <= p <= hi]) + n_bitmap
+
+  # end writeSievedTable()
+
+
+#------------------------------------------------------------------------------
+# class PrimeTable
+#
+# Read-only access to a prime table file written by writePrimeTable().
+# The file is memory-mapped, so only the pages touched by a query are
+# ever read in: contains() reads one byte, pi() one index entry plus at
+# most one block of the bitmap, and primes_in() only the bytes that
+# cover [a, b].
+#------------------------------------------------------------------------------
+
+class PrimeTable(object):
+  '''Memory-mapped reader for prime table files'''
+
+  def __init__(self, filename):
+
+    self.errList = []
+    self.errors  = 0
+
+    self.filename = filename
+    import mmap
+
+    self.file     = open(filename, 'rb')
+    self.map      = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, self.block_bytes, self.lo, self.hi, self.base, \
+      self.nbytes, self.nblocks = \
+      struct.unpack_from(tableHeaderFormat, self.map, 0)
+
+    if magic != tableMagic or version != tableVersion:
+      self.close()
+      self.errors += 1
+      errMsg  = 'File "'+str(filename)+'" is not a version '
+      errMsg += str(tableVersion)+' prime table'
+      errInfo = ['PrimeTable', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    self.index_offset  = tableHeaderSize
+    self.bitmap_offset = tableHeaderSize + 8*self.nblocks
+
+    # 2, 3 and 5 are not in the bitmap
+
+    self.small_primes = [p for p in (2, 3, 5) if self.lo <= p <= self.hi]
+
+  def close(self):
+    self.map.close()
+    self.file.close()
+
+  #--- Byte number and bit mask of n in the bitmap (None, 0 if not in it)
+
+  def bitPosition(self, n):
+    i, r = divmod(n - self.base, 30)
+    if wheel30Bit[r] == None:
+      return None, 0
+    return i, 1 << wheel30Bit[r]
+
+  #--- Is n prime? (n must be within the table)
+
+  def contains(self, n):
+    '''Returns True if n is a prime in the table'''
+
+    if n < self.lo or n > self.hi:
+      self.errors += 1
+      errMsg  = str(n)+' is outside the table range ['
+      errMsg += str(self.lo)+', '+str(self.hi)+']'
+      errInfo = ['PrimeTable.contains', errMsg]
+      self.errList.append(errInfo)
+      raise ArgumentError('pyapplib.py - ',self.errList)
+
+    if n < 7:
+      return n in self.small_primes
+
+    i, mask = self.bitPosition(n)
+    if i == None:
+      return False
+    return self.map[self.bitmap_offset + i] & mask != 0
+
+  #--- All primes in [a, b] (clipped to the table range)
+
+  def primes_in(self, a, b):
+    '''Yields the primes p in the table with a <= p <= b'''
+
+    a = max(a, self.lo)
+    b = min(b, self.hi)
+
+    for p in self.small_primes:
+      if a <= p <= b:
+        yield p
+
+    if b < 7 or b < a:
+      return
+
+    first = self.bitmap_offset + (a - self.base)//30
+    last  = self.bitmap_offset + (b - self.base)//30
+
+    n = self.base + 30*(first - self.bitmap_offset)
+    for byte in self.map[first:last + 1]:
+      for r in wheel30Offsets[byte]:
+        if a <= n + r <= b:
+          yield n + r
+      n += 30
+
+  #--- Number of primes in the table that are <= n
+
+  def pi(self, n):
+    '''Returns the number of primes p in the table with p <= n'''
+
+    # For a table that starts at 1 or 2 this is the prime counting
+    # function pi(n) (for n within the table).
+
+    count = len([p for p in self.small_primes if p <= n])
+
+    if n < 7 or n < self.lo:
+      return count
+
+    n = min(n, self.hi)
+
+    i     = (n - self.base)//30
+    block = i//self.block_bytes
+
+    count += struct.unpack_from('<Q', self.map, \
+      self.index_offset + 8*block)[0]
+
+    start = self.bitmap_offset + block*self.block_bytes
+    end   = self.bitmap_offset + i
+    count += int.from_bytes(self.map[start:end], 'little').bit_count()
+
+    # Bits of the last byte that are <= n
+
+    last = self.map[end]
+    r    = (n - self.base) % 30
+    for j, res in enumerate(wheel30Residues):
+      if res <= r and last & (1 << j):
+        count += 1
+
+    return count
+
+  # end class PrimeTable //////////////////////////////////////////////////////
+
+
+#------------------------------------------------------------------------------
+# class RangeCache
+#
+# Cache of computed primes, on disk and in memory, for searches whose
+# ranges overlap. The integers are divided into blocks of "span"
+# integers (block b covers [b*span, (b+1)*span - 1]) and each block is
+# kept as a wheel-30 bitmap (span/30 bytes, the encoding of the prime
+# table bitmap). primeChunks() serves a range from the cached blocks
+# and hands each run of missing blocks to the search engine in one go,
+# caching the blocks it produces.
+#
+# Blocks live in "directory" as one file per block, under a
+# subdirectory named for the span. The most recently used blocks are
+# also held in memory (at most memoryBlocks of them). When the files
+# exceed maxBytes the least recently used ones (oldest modification
+# time; a block read from disk is touched) are removed, down to 90% of
+# maxBytes. Several processes may share a directory: blocks are
+# written to a temporary file then renamed, and a block removed by
+# another process is simply computed again.
+#------------------------------------------------------------------------------
+
+class RangeCache(object):
+  '''LRU cache of blocks of primes, on disk and in memory'''
+
+  def __init__(self, directory, maxBytes=None, memoryBlocks=None, \
+               span=None):
+
+    global cacheBlockSpan, cacheMaxBytes, cacheMemoryBlocks
+
+    if maxBytes == None:
+      maxBytes = cacheMaxBytes
+    if memoryBlocks == None:
+      memoryBlocks = cacheMemoryBlocks
+    if span == None:
+      span = cacheBlockSpan
+
+    self.span          = span
+    self.block_bytes   = span//30
+    self.max_bytes     = maxBytes
+    self.memory_blocks = memoryBlocks
+    self.directory     = os.path.join(directory, 'w30-'+str(span))
+    self.memory        = OrderedDict()
+    self.hits          = 0
+    self.misses        = 0
+
+    try:
+      os.makedirs(self.directory, exist_ok=True)
+      self.disk_bytes = sum(e.stat().st_size \
+        for e in os.scandir(self.directory) if e.name.endswith('.blk'))
+    except OSError as e:
+      errMsg  = 'Cannot use cache directory "'+str(directory)+'"\n'
+      errMsg += '  OSError message = "'+str(e)+'"'
+      errInfo = ['RangeCache', errMsg]
+      raise ArgumentError('primeslib.py - ',[errInfo])
+
+  def blockPath(self, b):
+    return os.path.join(self.directory, str(b)+'.blk')
+
+  #--- Bitmap of block b (None if it is not cached)
+
+  def get(self, b):
+    '''Returns the bitmap of block b, or None if it is not cached'''
+
+    bitmap = self.memory.get(b)
+    if bitmap != None:
+      self.memory.move_to_end(b)
+      return bitmap
+
+    path = self.blockPath(b)
+    try:
+      with open(path, 'rb') as f:
+        bitmap = f.read()
+      os.utime(path)
+    except OSError:
+      return None
+
+    if len(bitmap) != self.block_bytes:
+      return None
+
+    self.remember(b, bitmap)
+    return bitmap
+
+  def has(self, b):
+    return b in self.memory or os.path.exists(self.blockPath(b))
+
+  def remember(self, b, bitmap):
+    self.memory[b] = bitmap
+    if len(self.memory) > self.memory_blocks:
+      self.memory.popitem(last=False)
+
+  #--- Add the bitmap of block b to the cache
+
+  def put(self, b, bitmap):
+    '''Caches the bitmap of block b (in memory, then on disk)'''
+
+    self.remember(b, bitmap)
+
+    # A cache that cannot be written (e.g. a full disk) is not an error;
+    # the block is then only held in memory
+
+    path    = self.blockPath(b)
+    tmpPath = path+'.'+str(os.getpid())+'.tmp'
+    try:
+      with open(tmpPath, 'wb') as f:
+        f.write(bitmap)
+      os.replace(tmpPath, path)
+    except OSError:
+      return
+
+    self.disk_bytes += len(bitmap)
+    if self.disk_bytes > self.max_bytes:
+      self.evict()
+
+  def evict(self):
+    '''Removes the least recently used block files'''
+
+    entries = []
+    for e in os.scandir(self.directory):
+      try:
+        if e.name.endswith('.blk'):
+          st = e.stat()
+          entries.append((st.st_mtime, st.st_size, e.path))
+      except OSError:
+        pass
+    entries.sort()
+
+    self.disk_bytes = sum(size for t, size, path in entries)
+    target          = int(0.9*self.max_bytes)
+
+    for t, size, path in entries:
+      if self.disk_bytes <= target:
+        break
+      try:
+        os.remove(path)
+      except OSError:
+        pass
+      self.disk_bytes -= size
+
+  #--- Primes in block b that are in [lo, hi]
+
+  def decode(self, b, bitmap, lo, hi):
+    '''Returns the primes in [lo, hi] of block b (bitmap)'''
+
+    base   = b*self.span
+    first  = max(lo - base, 0)//30
+    last   = min(hi - base, self.span - 1)//30
+    primes = wheel30Primes(bitmap[first:last + 1], base + 30*first)
+
+    if primes and (primes[0] < lo or primes[-1] > hi):
+      primes = primes[bisect_left(primes, lo):bisect_right(primes, hi)]
+
+    return primes
+
+  #--- Primes in [lo, hi], from the cache where possible
+
+  def primeChunks(self, lo, hi, engine):
+    '''Yields lists of the primes in [lo, hi] in increasing order'''
+
+    # engine(a, b) yields lists of the primes in [a, b], such as
+    # PrimesGenerator.iterSieveChunks()
+
+    lo = max(lo, 0)
+    if hi < lo:
+      return
+
+    small = [p for p in (2, 3, 5) if lo <= p <= hi]
+    if small:
+      yield small
+
+    b      = lo//self.span
+    b_last = hi//self.span
+
+    while b <= b_last:
+      bitmap = self.get(b)
+      if bitmap != None:
+        self.hits += 1
+        primes = self.decode(b, bitmap, lo, hi)
+        if primes:
+          yield primes
+        b += 1
+        continue
+      b_end = b
+      while b_end < b_last and not self.has(b_end + 1):
+        b_end += 1
+      yield from self.computeBlocks(b, b_end, lo, hi, engine)
+      b = b_end + 1
+
+    # end RangeCache::primeChunks() ///////////////////////////////////////////
+
+  def computeBlocks(self, b_first, b_last, lo, hi, engine):
+    '''Computes, caches and yields blocks b_first..b_last (see above)'''
+
+    span   = self.span
+    bitOf  = [0 if j == None else 1 << j for j in wheel30Bit]
+
+    b      = b_first
+    base   = b*span
+    bitmap = bytearray(self.block_bytes)
+
+    for primes in engine(b_first*span, (b_last + 1)*span - 1):
+      for p in primes:
+        if p < 7:
+          continue
+        while p >= base + span:
+          yield from self.finishBlock(b, bitmap, lo, hi)
+          b     += 1
+          base  += span
+          bitmap = bytearray(self.block_bytes)
+        i, r = divmod(p - base, 30)
+        bitmap[i] |= bitOf[r]
+
+    while b <= b_last:
+      yield from self.finishBlock(b, bitmap, lo, hi)
+      b     += 1
+      bitmap = bytearray(self.block_bytes)
+
+  def finishBlock(self, b, bitmap, lo, hi):
+    self.misses += 1
+    bitmap = bytes(bitmap)
+    self.put(b, bitmap)
+    primes = self.decode(b, bitmap, lo, hi)
+    if primes:
+      yield primes
+
+  # end class RangeCache //////////////////////////////////////////////////////
+
@@ -0,0 +1,663 @@
+#!/usr/bin/env python3
+###############################################################################
+# primesserver.py
+#
+# Local query server for the PRIMES library.
+#
+# Answers primality and range queries over a Unix socket ("-u|--unix")
+# or localhost TCP ("-p|--port") without the cost of starting primes.py
+# for every query. The server keeps a table of the primes below
+# serverTableLimit (and the base primes that sieve any range up to
+# serverBasePrimeLimit**2) warm in memory, as well as the range cache of
+# primes.conf if one is configured.
+#
+# Protocol: one request per line, one JSON response per line. A request
+# is either a JSON object, {"id": 7, "op": "count", "a": 0, "b": 10**6},
+# or plain words, "count 0 1000000" (the id is then the line number on
+# the connection). Responses are {"id": 7, "result": 78498}, or
+# {"id": 7, "error": "..."}, and are written as soon as they are ready,
+# so they may come back in a different order than the requests. The
+# operations and their arguments are listed in primeslib.queryOps.
+#
+# Small queries that arrive together are answered together, in one
+# pass of the event loop, up to serverBatchSize at a time, and those
+# whose ranges lie close together share one sieve; queries that may
+# take longer (see PrimeServer.isLarge()) run in a pool of worker
+# processes so that the event loop never waits on them.
+#
+###############################################################################
+#
+#--- Directory of routines:
+#
+# (egrep 'class|def' primesserver.py > primesserver.routines)
+#
+# def main(argv=None):
+# def parseCmdLine( argv ):
+# def parsePort( value ):
+#
+# class WarmPrimes(object):
+#   def __init__(self, tableLimit=None, baseLimit=None):
+#   def isPrime(self, n):
+#   def primeChunks(self, a, b):
+#
+# def runQuery( op, args, warm=None, cache=None ):
+# def initWorker():
+# def runSpan( lo, hi, group ):
+# def setResults( done, futures ):
+#
+# class PrimeServer(object):
+#   def __init__(self, workers=None, cache=None):
+#   def isLarge(self, op, args):
+#   def sieveCost(self, a, b):
+#   def submit(self, op, args):
+#   def flush(self):
+#   async def answer(self, line, lineNum):
+#   async def handleClient(self, reader, writer):
+#   async def serve(self, unixPath=None, host=None, port=None):
+#
+#------------------------------------------------------------------------------
+
+#--- Python Imports
+
+import sys
+import os
+import json
+import math
+import signal
+import asyncio
+import argparse
+
+from itertools import compress
+
+#--- Project imports
+
+import primeslib
+
+from errmsgs import *
+
+#--- Global variables
+
+thisScriptDir = os.path.dirname(os.path.abspath(__file__))
+
+# The primes below serverTableLimit are looked up in a table (one byte
+# per odd integer); ranges up to serverBasePrimeLimit**2 are sieved
+# with base primes kept in memory.
+
+serverTableLimit     = 2**24
+serverBasePrimeLimit = 2**20
+
+# Small queries are answered serverBatchSize at a time. Queries that
+# may take longer go to the process pool (see PrimeServer.isLarge()):
+# range queries wider than serverInlineSpan, above the reach of the
+# base primes, or with an estimated cost above serverInlineMRCost (if
+# tested with Miller-Rabin) or serverInlineSieveCost (if sieved);
+# prime_pi(x) above serverInlineSpan and nth_prime(k) above
+# serverInlineNthPrime; is_prime(n), next_prime(n) and prev_prime(n)
+# for n longer than serverInlineBits bits (unless table-backed); and
+# factorizations of n > serverInlineFactor. These limits keep any query
+# answered on the event loop to about 10 ms. "primes" queries may not
+# be wider than serverMaxListSpan.
+
+serverBatchSize       = 256
+serverInlineSpan      = 2**20
+serverInlineMRCost    = 2**15
+serverInlineSieveCost = 2**19
+serverInlineNthPrime  = 2**16
+serverInlineBits      = 64
+serverInlineFactor    = 2**40
+serverMaxListSpan     = 2**24
+
+# Requests read from one connection and not yet answered
+
+serverMaxPending     = 1024
+
+defaultHost = '127.0.0.1'
+defaultPort = 7919
+
+#------------------------------------------------------------------------------
+#- Main Script
+#------------------------------------------------------------------------------
+
+def main(argv=None):
+  '''Main program - PRIMESSERVER'''
+
+  if argv is None:
+    argv = sys.argv[1:]
+
+  args = parseCmdLine(argv)
+
+  # "version.txt" is installed next to this script, or one level up
+
+  for versionPath in [os.path.join(thisScriptDir, '..', 'version.txt'), \
+                      os.path.join(thisScriptDir, 'version.txt')]:
+    if os.path.exists(versionPath):
+      with open(versionPath) as versionFile:
+        primeslib.thisProgramVersion = versionFile.readline().strip()
+      break
+
+  # The range cache of the config file, as in primes.py
+
+  cache = None
+
+  try:
+    rp = primeslib.RunParameters()
+    rp.workers = args.workers
+    port = parsePort(args.port)
+    if args.config != None or os.path.exists(primeslib.defaultConfPath):
+      confPath = args.config or primeslib.defaultConfPath
+      with open(confPath) as confFile:
+        conf = primeslib.readConfFile(confFile)
+      rp.cache_dir           = conf.get('cache_dir')
+      rp.cache_max_bytes     = conf.get('cache_max_bytes')
+      rp.cache_memory_blocks = conf.get('cache_memory_blocks')
+    if rp.cache_dir != None:
+      cache = primeslib.RangeCache(rp.cache_dir, rp.cache_max_bytes, \
+                                   rp.cache_memory_blocks)
+  except (ArgumentError, OSError) as e:
+    primeslib.p_err(e)
+    return 2
+
+  server = PrimeServer(rp.workers, cache)
+
+  try:
+    asyncio.run(server.serve(args.unix, args.host, port))
+  except KeyboardInterrupt:
+    pass
+
+  return 0
+
+  # end main()
+
+#------------------------
+# function parseCmdLine()
+#------------------------
+
+def parseCmdLine( argv ):
+  '''Parse the command line'''
+
+  argParser = argparse.ArgumentParser( \
+    prog='primesserver', \
+    description='Answers prime number queries over a local socket' \
+    )
+
+  argParser.add_argument( \
+    '-u', '--unix', \
+    help='path of the Unix socket to listen on (instead of TCP)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-H', '--host', \
+    help='TCP address to listen on (default: '+defaultHost+')', \
+    default=defaultHost \
+    )
+
+  argParser.add_argument( \
+    '-p', '--port', \
+    help='TCP port to listen on (default: '+str(defaultPort)+')', \
+    default=defaultPort \
+    )
+
+  argParser.add_argument( \
+    '-w', '--workers', \
+    help='number of worker processes for large queries '+\
+         '(default: one per CPU)', \
+    default=None \
+    )
+
+  argParser.add_argument( \
+    '-c', '--config', \
+    help='config file name (default: primes.conf)', \
+    default=None \
+    )
+
+  return argParser.parse_args(argv)
+
+  # end function parseCmdLine() ///////////////////////////////////////////////
+
+#---------------------
+# function parsePort()
+#---------------------
+
+def parsePort( value ):
+  '''Returns the TCP port number value, or raises ArgumentError'''
+
+  # "-p|--port" must be an integer from 1 to 65535
+  try:
+    port = int(value)
+  except ValueError:
+    port = 0
+
+  if not 0 < port < 65536:
+    errMsg  = 'Invalid TCP port "'+str(value)+'" : '
+    errMsg += 'must be an integer from 1 to 65535'
+    raise ArgumentError('primesserver.py - ', [['parsePort', errMsg]])
+
+  return port
+
+  # end function parsePort() //////////////////////////////////////////////////
+
+#------------------------------------------------------------------------------
+# class WarmPrimes
+#
+# The tables the server keeps in memory: table[i] is 1 if 2*i+1 is prime
+# (for 2*i+1 < tableLimit), and basePrimes holds every prime <= baseLimit.
+#------------------------------------------------------------------------------
+
+class WarmPrimes(object):
+  '''Prime tables kept in memory by the server'''
+
+  def __init__(self, tableLimit=None, baseLimit=None):
+
+    global serverTableLimit, serverBasePrimeLimit
+
+    if tableLimit == None:
+      tableLimit = serverTableLimit
+    if baseLimit == None:
+      baseLimit = serverBasePrimeLimit
+
+    self.table_limit = tableLimit
+    self.base_limit  = baseLimit
+    self.table       = bytearray(tableLimit//2)
+
+    for primes in primeslib.segmentedSieve(3, tableLimit - 1):
+      for p in primes:
+        self.table[p >> 1] = 1
+
+    self.basePrimes = primeslib.sieveBasePrimes(baseLimit)
+
+  def isPrime(self, n):
+    '''Returns True if n is prime'''
+    if n < self.table_limit:
+      return n == 2 or (n & 1 == 1 and self.table[n >> 1] == 1)
+    return primeslib.is_prime(n)
+
+  def primeChunks(self, a, b):
+    '''Yields lists of the primes in [a, b] (an engine for RangeCache)'''
+
+    a = max(a, 0)
+
+    if b < self.table_limit:
+      if a <= 2 <= b:
+        yield [2]
+      lo = max(a, 3) | 1
+      if lo <= b:
+        yield list(compress(range(lo, b + 1, 2), \
+                            self.table[lo >> 1:(b - 1)//2 + 1]))
+    elif primeslib.useMillerRabin(a, b):
+      yield from primeslib.millerRabinPrimes(a, b)
+    elif math.isqrt(b) <= self.base_limit:
+      yield from primeslib.segmentedSieve(a, b, basePrimes=self.basePrimes)
+    else:
+      yield from primeslib.segmentedSieve(a, b)
+
+  # end class WarmPrimes //////////////////////////////////////////////////////
+
+#------------------------------------------------------------------------------
+# FUNCTIONS
+#------------------------------------------------------------------------------
+
+#--------------------
+# function runQuery()
+#--------------------
+
+def runQuery( op, args, warm=None, cache=None ):
+  '''Returns the result of one query (in the server or a worker)'''
+
+  # args holds the integer arguments of op, as from primeslib.parseQuery().
+  # Without the warm tables (in a worker) this is primeslib.answerQuery().
+
+  if warm == None:
+    return primeslib.answerQuery(op, args)
+
+  if op in ('is_prime', 'next_prime', 'prev_prime'):
+    n = args[0]
+    if op == 'is_prime':
+      return warm.isPrime(n)
+    if op == 'next_prime' and n + 1 < warm.table_limit:
+      x = max(n + 1, 2)
+      while not warm.isPrime(x):
+        x += 1
+      return x
+    if op == 'prev_prime' and n < warm.table_limit:
+      x = n - 1
+      while x >= 2 and not warm.isPrime(x):
+        x -= 1
+      return x if x >= 2 else None
+
+  if not op in ('count', 'primes'):
+    return primeslib.answerQuery(op, args)
+
+  a, b = args
+  if b < a:
+    return 0 if op == 'count' else []
+
+  if cache != None and not primeslib.useMillerRabin(a, b):
+    chunks = cache.primeChunks(a, b, warm.primeChunks)
+  else:
+    chunks = warm.primeChunks(a, b)
+
+  if op == 'count':
+    return sum(len(primes) for primes in chunks)
+
+  result = []
+  for primes in chunks:
+    result.extend(primes)
+  return result
+
+  # end function runQuery() ///////////////////////////////////////////////////
+
+#----------------------
+# function initWorker()
+#----------------------
+
+def initWorker():
+  '''Prepares a worker process of the server'''
+
+  # A forked worker inherits the event loop's SIGTERM handler, which
+  # would keep it from being stopped by the server when it shuts down
+
+  signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+  # end function initWorker() /////////////////////////////////////////////////
+
+#-------------------
+# function runSpan()
+#-------------------
+
+def runSpan( lo, hi, group ):
+  '''Returns primeslib.answerSpan() for group from a sieve of [lo, hi]'''
+
+  # Run in a worker for a combined span too costly for the event loop
+
+  return primeslib.answerSpan(primeslib.segmentedSieve(lo, hi), group)
+
+  # end function runSpan() ////////////////////////////////////////////////////
+
+#----------------------
+# function setResults()
+#----------------------
+
+def setResults( done, futures ):
+  '''Sets futures (in group order) from the finished runSpan() done'''
+
+  try:
+    results = [result for key, result in done.result()]
+  except Exception as e:
+    for future in futures:
+      if not future.done():
+        future.set_exception(e)
+    return
+
+  for future, result in zip(futures, results):
+    if not future.done():
+      future.set_result(result)
+
+  # end function setResults() /////////////////////////////////////////////////
+
+#------------------------------------------------------------------------------
+# class PrimeServer
+#
+# Serves one connection per asyncio task. Each request line becomes a
+# task of its own (at most serverMaxPending per connection), so a large
+# query never holds up the requests behind it. Small queries are queued
+# by submit() and answered by flush(), which the event loop runs once
+# all the requests that are ready to be read have been read (or when
+# serverBatchSize of them are waiting); close ranges in a flush share
+# one sieve.
+#------------------------------------------------------------------------------
+
+class PrimeServer(object):
+  '''asyncio server answering prime number queries'''
+
+  def __init__(self, workers=None, cache=None):
+    self.workers   = workers
+    self.cache     = cache
+    self.warm      = WarmPrimes()
+    self.executor  = None
+    self.pending   = []
+    self.scheduled = False
+    self.served    = 0
+
+  def isLarge(self, op, args):
+    '''Returns True if the query is run in the process pool'''
+
+    # Routed by an estimate of its cost, so that nothing that may take
+    # more than a few milliseconds runs on the event loop. A Miller-Rabin
+    # range costs about (candidates) x (bit length); a sieved range
+    # about its width plus some 256 integers' worth per base prime.
+
+    global serverInlineBits, serverInlineMRCost, serverInlineSieveCost, \
+           serverInlineFactor, serverInlineNthPrime, serverInlineSpan, \
+           serverMaxListSpan
+
+    if op in ('ping', 'version'):
+      return False
+    if op == 'factorize':
+      return args[0] > serverInlineFactor
+    if op == 'nth_prime':
+      return args[0] > serverInlineNthPrime
+    if op == 'prime_pi':
+      return args[0] > serverInlineSpan
+    if op in ('is_prime', 'next_prime', 'prev_prime'):
+      return args[0] + 1 >= self.warm.table_limit and \
+             args[0].bit_length() > serverInlineBits
+
+    a, b = args
+    if op == 'primes' and b - a >= serverMaxListSpan:
+      raise ValueError('op "primes" is limited to ranges narrower than '+\
+                       str(serverMaxListSpan)+' : use "count"')
+    if b < self.warm.table_limit:
+      return b - a >= serverInlineSpan
+    if primeslib.useMillerRabin(a, b):
+      return (b - a + 1)*b.bit_length() > serverInlineMRCost
+
+    if b - a >= serverInlineSpan or math.isqrt(b) > self.warm.base_limit:
+      return True
+    return self.sieveCost(a, b) > serverInlineSieveCost
+
+  def sieveCost(self, a, b):
+    '''Returns the estimated cost of sieving [a, b]'''
+    root = math.isqrt(b)
+    return (b - a) + 256*root//max(root.bit_length(), 1)
+
+  def submit(self, op, args):
+    '''Queues a small query; returns a future for its result'''
+
+    global serverBatchSize
+
+    future = asyncio.get_running_loop().create_future()
+    self.pending.append((op, args, future))
+
+    if len(self.pending) >= serverBatchSize:
+      self.flush()
+    elif not self.scheduled:
+      asyncio.get_running_loop().call_soon(self.flush)
+      self.scheduled = True
+
+    return future
+
+  def flush(self):
+    '''Answers the queued small queries'''
+
+    # The "count", "primes" and "is_prime" queries beyond the table that
+    # lie close together are answered from one sieve of their combined
+    # span (as in primeslib.batchQueries()); the others one at a time.
+    # A combined span may cost more than each of its queries: above
+    # serverInlineSieveCost it is sieved in the process pool.
+
+    global serverInlineSieveCost
+
+    batch = self.pending
+    self.pending   = []
+    self.scheduled = False
+
+    warm    = self.warm
+    ranges  = []
+    singles = []
+
+    for i, (op, args, future) in enumerate(batch):
+      if future.cancelled():
+        continue
+      if op in ('count', 'primes') and args[0] <= args[1] and \
+         args[1] >= warm.table_limit and \
+         not primeslib.useMillerRabin(args[0], args[1]):
+        ranges.append((args[0], args[1], i, op))
+      elif op == 'is_prime' and args[0] >= warm.table_limit:
+        ranges.append((args[0], args[0], i, op))
+      else:
+        singles.append(i)
+
+    for lo, hi, group in primeslib.coalesceRanges(ranges):
+
+      # A group of lone is_prime() points is not worth a sieve
+
+      if all(op == 'is_prime' for a, b, i, op in group):
+        singles.extend(i for a, b, i, op in group)
+        continue
+
+      if self.sieveCost(lo, hi) > serverInlineSieveCost:
+        futures = [batch[i][2] for a, b, i, op in group]
+        asyncio.get_running_loop().run_in_executor( \
+          self.executor, runSpan, lo, hi, group).add_done_callback( \
+          lambda done, futures=futures: setResults(done, futures))
+        continue
+
+      try:
+        if self.cache != None:
+          chunks = self.cache.primeChunks(lo, hi, warm.primeChunks)
+        else:
+          chunks = warm.primeChunks(lo, hi)
+        for i, result in primeslib.answerSpan(chunks, group):
+          batch[i][2].set_result(result)
+      except Exception as e:
+        for a, b, i, op in group:
+          batch[i][2].set_exception(e)
+
+    for i in singles:
+      op, args, future = batch[i]
+      try:
+        future.set_result(runQuery(op, args, warm, self.cache))
+      except Exception as e:
+        future.set_exception(e)
+
+    # end flush() /////////////////////////////////////////////////////////////
+
+  async def answer(self, line, lineNum):
+    '''Returns the response line to one request line'''
+
+    reqId = lineNum
+    try:
+      reqId, op, args = primeslib.parseQuery(line, lineNum)
+      if self.isLarge(op, args):
+        result = await asyncio.get_running_loop().run_in_executor( \
+          self.executor, runQuery, op, args)
+      else:
+        result = await self.submit(op, args)
+      response = {'id' : reqId, 'result' : result}
+    except Exception as e:
+      response = {'id' : reqId, 'error' : primeslib.queryError(e)}
+
+    self.served += 1
+    return json.dumps(response)+'\n'
+
+    # end answer() ////////////////////////////////////////////////////////////
+
+  async def handleClient(self, reader, writer):
+    '''Answers the requests of one connection until it is closed'''
+
+    global serverMaxPending
+
+    slots = asyncio.Semaphore(serverMaxPending)
+    tasks = set()
+
+    async def respond(line, lineNum):
+      try:
+        response = await self.answer(line, lineNum)
+        writer.write(response.encode())
+        if writer.transport.get_write_buffer_size() > 2**16:
+          await writer.drain()
+      except ConnectionError:
+        pass
+      finally:
+        slots.release()
+
+    try:
+      lineNum = 0
+      while True:
+        line = await reader.readline()
+        if not line:
+          break
+        lineNum += 1
+        if not line.strip():
+          continue
+        await slots.acquire()
+        task = asyncio.ensure_future( \
+          respond(line.decode(errors='replace'), lineNum))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+      if tasks:
+        await asyncio.gather(*tasks)
+      await writer.drain()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError, \
+            asyncio.CancelledError):
+      pass
+    finally:
+      for task in tasks:
+        task.cancel()
+      writer.close()
+
+    # end handleClient() //////////////////////////////////////////////////////
+
+  async def serve(self, unixPath=None, host=None, port=None):
+    '''Listens on unixPath (or host:port) until interrupted'''
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    self.executor = ProcessPoolExecutor(max_workers=self.workers, \
+                                        initializer=initWorker)
+
+    try:
+      if unixPath != None:
+        server = await asyncio.start_unix_server(self.handleClient, unixPath)
+        where  = unixPath
+      else:
+        server = await asyncio.start_server(self.handleClient, host, port)
+        where  = str(host)+':'+str(port)
+
+      primeslib.p_err('primesserver: listening on '+where)
+
+      # SIGTERM ("kill") stops the server as Ctrl-C does, so that the
+      # worker processes are shut down and the socket file removed
+
+      try:
+        asyncio.get_running_loop().add_signal_handler( \
+          signal.SIGTERM, asyncio.current_task().cancel)
+      except NotImplementedError:
+        pass
+
+      async with server:
+        await server.serve_forever()
+    except asyncio.CancelledError:
+      pass
+    finally:
+      # Workers still busy with a large query are stopped rather than
+      # waited for; ProcessPoolExecutor has no public way to do this
+      for process in list((self.executor._processes or {}).values()):
+        process.terminate()
+      self.executor.shutdown(wait=True, cancel_futures=True)
+      if unixPath != None and os.path.exists(unixPath):
+        os.unlink(unixPath)
+
+    # end serve() /////////////////////////////////////////////////////////////
+
+  # end class PrimeServer /////////////////////////////////////////////////////
+
+
+#--------------------------------------------------------
+# Prevent interactive use from exiting Python interpreter
+#--------------------------------------------------------
+
+if __name__ == '__main__':
+  sys.exit(main())
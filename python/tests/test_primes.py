@@ -0,0 +1,327 @@
+###############################################################################
+# test_primes.py
+#
+# Regression tests for the PRIMES library and command (run with pytest
+# from the python directory: "python3 -m pytest tests").
+#
+# Every run mode is compared with a brute force reference (trial
+# division by every integer up to sqrt(n)) on the ranges where the
+# engines are most easily off by one: the ends of the number line (0,
+# 1, 2), the wheel-30 boundary (29, 30, 31), the boundaries of sieve
+# segments, chunks and blocks (made small here, so that a short range
+# crosses many of them) and the switch to Miller-Rabin at 2**32. The
+# primality test is checked against known strong pseudoprimes, the
+# prime table against its two writers, GapStats.merge() against a
+# single pass, and a checkpointed search against one killed and
+# resumed with "-C" and "-r".
+#
+###############################################################################
+
+#--- Python Imports
+
+import os
+import sys
+import json
+import math
+import bisect
+import time
+import signal
+import subprocess
+
+import pytest
+
+#--- Project imports
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, srcDir)
+
+import primeslib
+
+#--- Global variables
+
+# Ranges [lo, hi] searched by every run mode
+
+edgeRanges = [ \
+  (0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (0, 7), (7, 7), \
+  (29, 31), (30, 30), (29, 29), (31, 31), (0, 100), (1, 1000), \
+  (599, 661), (2**32 - 200, 2**32 + 200), (10**12 - 60, 10**12 + 60)]
+
+# Engines of iter_prime_chunks(): (run mode, trial division wheel)
+
+searchEngines = [ \
+  ('DEFAULT', 2), ('DEFAULT', 30), ('DEFAULT', 210), ('SPECIAL', 2), \
+  ('TRIAL_PRIMES', 2), ('SIEVE', 2), ('PARALLEL', 2), ('NUMPY', 2), \
+  ('MILLER_RABIN', 2), ('CTYPES', 2)]
+
+sieveEngines = [engine for engine in searchEngines \
+                if engine[0] in primeslib.sieveRunModes]
+
+# Start of the second segment of the C sieve (SEGMENT_SPAN in sieve.h)
+
+cSegmentSpan = 2*8*2**18
+
+# Composites that pass the strong probable prime test to base 2 (and,
+# for the larger ones, to every base up to 17, 23 or 37)
+
+strongPseudoprimes = [ \
+  2047, 1373653, 25326001, 3215031751, 2152302898747, 3474749660383, \
+  341550071728321, 3825123056546413051, 318665857834031151167461, \
+  3317044064679887385961981]
+
+primesScript = os.path.join(srcDir, 'primes.py')
+
+#------------------------------------------------------------------------------
+# Brute force reference
+#------------------------------------------------------------------------------
+
+def isPrimeBrute( n ):
+  '''Returns True if n is prime, by trial division'''
+  if n < 2:
+    return False
+  return all(n % d for d in range(2, math.isqrt(n) + 1))
+
+def primesBrute( lo, hi ):
+  '''Returns the list of primes in [lo, hi], by trial division'''
+  return [n for n in range(lo, hi + 1) if isPrimeBrute(n)]
+
+def primesEratosthenes( lo, hi ):
+  '''Returns the list of primes in [lo, hi], from a plain sieve of 0..hi'''
+  if hi < 2:
+    return []
+  sieve = bytearray([1])*(hi + 1)
+  sieve[0:2] = b'\x00\x00'
+  for p in range(2, math.isqrt(hi) + 1):
+    if sieve[p]:
+      sieve[p*p::p] = bytes(len(range(p*p, hi + 1, p)))
+  return [n for n in range(max(lo, 2), hi + 1) if sieve[n]]
+
+def factorsBrute( n ):
+  '''Returns [(p, e), ...], the prime factorization of n >= 1'''
+  factors = []
+  d = 2
+  while d*d <= n:
+    e = 0
+    while n % d == 0:
+      n //= d
+      e += 1
+    if e:
+      factors.append((d, e))
+    d += 1
+  if n > 1:
+    factors.append((n, 1))
+  return factors
+
+#------------------------------------------------------------------------------
+# Helpers
+#------------------------------------------------------------------------------
+
+class SearchParameters(object):
+  pass
+
+def engineAvailable( runMode ):
+  '''Returns False if the run mode needs a dependency that is missing'''
+  if runMode == 'NUMPY':
+    try:
+      import numpy
+    except ImportError:
+      return False
+  if runMode == 'CTYPES':
+    return primeslib.loadCLibrary() != None
+  return True
+
+def searchPrimes( runMode, wheel, lo, hi ):
+  '''Returns the primes in [lo, hi] found by iter_prime_chunks()'''
+
+  if not engineAvailable(runMode):
+    pytest.skip('run mode '+runMode+' is not available')
+
+  rp = SearchParameters()
+  rp.run_mode = runMode
+  rp.wheel    = wheel
+  rp.workers  = 2
+
+  gen    = primeslib.PrimesGenerator(rp)
+  primes = []
+  for chunk in gen.iter_prime_chunks(lo, hi):
+    primes.extend(chunk)
+
+  assert gen.metrics.primes == len(primes)
+  return primes
+
+@pytest.fixture
+def smallSegments( monkeypatch ):
+  '''Makes the segments, chunks and blocks of every engine small'''
+  monkeypatch.setattr(primeslib, 'wheelSegmentBytes', 2)
+  monkeypatch.setattr(primeslib, 'sieveSegmentSize', 64)
+  monkeypatch.setattr(primeslib, 'parallelChunkSize', 97)
+  monkeypatch.setattr(primeslib, 'cSieveChunkSize', 3)
+  monkeypatch.setattr(primeslib, 'primesChunkSize', 5)
+
+#------------------------------------------------------------------------------
+# Run modes against the reference
+#------------------------------------------------------------------------------
+
+@pytest.mark.parametrize('lo, hi', edgeRanges)
+@pytest.mark.parametrize('runMode, wheel', searchEngines)
+def test_search_engines( runMode, wheel, lo, hi, smallSegments ):
+  assert searchPrimes(runMode, wheel, lo, hi) == primesBrute(lo, hi)
+
+@pytest.mark.parametrize('runMode, wheel', sieveEngines)
+def test_sieve_segment_boundaries( runMode, wheel ):
+  # With the real segment sizes: the second segment of the C sieve and
+  # the first wheel-30 segments
+
+  lo, hi = cSegmentSpan - 1000, cSegmentSpan + 1000
+  assert searchPrimes(runMode, wheel, lo, hi) == primesBrute(lo, hi)
+
+  hi = 30*primeslib.wheelSegmentBytes + 1000
+  assert searchPrimes(runMode, wheel, 0, hi) == primesEratosthenes(0, hi)
+
+@pytest.mark.parametrize('lo, hi', edgeRanges)
+def test_count_primes( lo, hi ):
+  assert primeslib.count_primes(lo, hi) == len(primesBrute(lo, hi))
+
+def test_count_primes_segment_boundary():
+  hi = cSegmentSpan + 1000
+  assert primeslib.count_primes(0, hi) == len(primesEratosthenes(0, hi))
+
+@pytest.mark.parametrize('lo, hi', edgeRanges)
+def test_factor_range( lo, hi, smallSegments ):
+  # factorRange() starts at 1: 0 has no factorization
+
+  expected = [(n, factorsBrute(n)) for n in range(max(lo, 1), hi + 1)]
+  assert list(primeslib.factorRange(lo, hi)) == expected
+
+@pytest.mark.parametrize('lo, hi', edgeRanges)
+def test_gap_stats( lo, hi, smallSegments ):
+  # The GAPS and TUPLES run modes, serial and parallel
+
+  expected = primeslib.GapStats(primesBrute(lo, hi)).__dict__
+  assert primeslib.parallelGapStats(lo, hi, 2, 97).__dict__ == expected
+
+  stats = primeslib.GapStats()
+  for primes in primeslib.cSieve(lo, hi):
+    stats.add(primes)
+  assert stats.__dict__ == expected
+
+def test_nth_prime_and_prime_pi():
+  primes = primesEratosthenes(0, 10**5)
+  for k in (1, 2, 3, 4, 10, 1000, len(primes)):
+    assert primeslib.nth_prime(k) == primes[k - 1]
+  for x in (0, 1, 2, 3, 29, 30, 31, 10**5):
+    assert primeslib.prime_pi(x) == len([p for p in primes if p <= x])
+
+#------------------------------------------------------------------------------
+# Primality
+#------------------------------------------------------------------------------
+
+@pytest.mark.parametrize('n', strongPseudoprimes)
+def test_strong_pseudoprimes( n ):
+  assert primeslib.isStrongProbablePrime(n, 2)
+  assert not primeslib.is_prime(n)
+  assert n not in [p for chunk in primeslib.millerRabinPrimes(n - 10, n + 10) \
+                   for p in chunk]
+
+def test_is_prime():
+  for n in range(-2, 5000):
+    assert primeslib.is_prime(n) == isPrimeBrute(n)
+  for n in (2**31 - 1, 2**61 - 1, 2**64 - 59, 2**89 - 1):
+    assert primeslib.is_prime(n)
+  for n in (2**32 + 1, 2**64 - 1, 2**64 + 1, (2**61 - 1)*(2**31 - 1)):
+    assert not primeslib.is_prime(n)
+
+#------------------------------------------------------------------------------
+# Prime table
+#------------------------------------------------------------------------------
+
+@pytest.mark.parametrize('lo, hi', \
+  [(0, 0), (0, 6), (1, 30), (7, 7), (29, 31), (0, 2000), (12345, 98765)])
+def test_prime_table_round_trip( lo, hi, tmp_path, monkeypatch ):
+  # writeSievedTable() (primeChunks None) and the prime list writer,
+  # with blocks that do not line up with the sieve segments
+
+  monkeypatch.setattr(primeslib, 'wheelSegmentBytes', 7)
+
+  expected = primesBrute(lo, hi)
+  isPrime  = set(expected)
+  contents = []
+
+  for primeChunks in (None, primeslib.segmentedSieve(lo, hi)):
+    filename = str(tmp_path / 'primes.tbl')
+    with open(filename, 'wb') as f:
+      n_primes = primeslib.writePrimeTable(f, lo, hi, primeChunks, 16)
+    assert n_primes == len(expected)
+
+    table = primeslib.PrimeTable(filename)
+    try:
+      assert list(table.primes_in(lo, hi)) == expected
+      for n in range(lo, hi + 1):
+        assert table.contains(n) == (n in isPrime)
+        assert table.pi(n) == bisect.bisect_right(expected, n)
+    finally:
+      table.close()
+
+    with open(filename, 'rb') as f:
+      contents.append(f.read())
+
+  assert contents[0] == contents[1]
+
+#------------------------------------------------------------------------------
+# GapStats.merge()
+#------------------------------------------------------------------------------
+
+def test_gap_stats_merge():
+  primes = primesEratosthenes(0, 3000)
+  single = primeslib.GapStats(primes).__dict__
+
+  # Splits inside k-tuples, next to either end, and into empty or one
+  # prime pieces
+
+  for cuts in ([0], [1], [2], [3], [5, 6], [100], [len(primes) - 1], \
+               [1, 2, 3, 4], [10, 10, 20], list(range(0, len(primes), 7))):
+    bounds = [0] + cuts + [len(primes)]
+    stats  = primeslib.GapStats()
+    for a, b in zip(bounds, bounds[1:]):
+      stats.merge(primeslib.GapStats(primes[a:b]))
+    assert stats.__dict__ == single, cuts
+
+#------------------------------------------------------------------------------
+# Checkpoint and resume
+#------------------------------------------------------------------------------
+
+def runPrimes( args, cwd ):
+  return subprocess.run([sys.executable, primesScript] + args, cwd=cwd, \
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+@pytest.mark.parametrize('runMode, lo, hi', \
+  [('DEFAULT', 1, 400000), ('SIEVE', 0, 3*10**7)])
+def test_kill_and_resume( runMode, lo, hi, tmp_path ):
+  search = ['-m', runMode, '-s', str(lo), '-e', str(hi)]
+
+  assert runPrimes(search + ['-o', 'full.txt'], tmp_path).returncode == 0
+
+  # Kill the search (with no chance to clean up) once it has saved a
+  # checkpoint part of the way through
+
+  checkpoint = tmp_path / 'search.ckpt'
+  proc = subprocess.Popen([sys.executable, primesScript] + search + \
+    ['-o', 'part.txt', '-C', str(checkpoint), '-T', '0.02'], \
+    cwd=tmp_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+  deadline = time.monotonic() + 60
+  while proc.poll() == None and time.monotonic() < deadline:
+    try:
+      if json.loads(checkpoint.read_text())['x'] > lo:
+        break
+    except (OSError, ValueError):
+      pass
+    time.sleep(0.005)
+  proc.send_signal(signal.SIGKILL)
+  assert proc.wait() == -signal.SIGKILL, 'the search ended before the kill'
+
+  resumed = runPrimes(search + \
+    ['-o', 'part.txt', '-C', str(checkpoint), '-r'], tmp_path)
+  assert resumed.returncode == 0, resumed.stderr
+
+  assert (tmp_path / 'part.txt').read_bytes() == \
+         (tmp_path / 'full.txt').read_bytes()